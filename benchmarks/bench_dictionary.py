@@ -0,0 +1,106 @@
+"""
+Compare the compressed size of icon-heavy pages with gzip, zstd, and zstd with the shared compression
+dictionary (`dcz`), with both the raw-content dictionary and a trained dictionary.
+
+The pages are tables like an audit log, with a few icons per row, picked from the icons that an app uses.
+
+Requires zstandard to be installed.
+
+```sh
+python benchmarks/bench_dictionary.py --rows 10 50 200 --distinct 40 --trained-size 112640
+```
+"""
+
+import argparse
+import gzip
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Tuple
+
+from benchutils import setup_bench_config
+
+if TYPE_CHECKING:
+    from djc_heroicons.icons import IconName
+
+
+def make_page(rows: int, names: List["IconName"]) -> bytes:
+    """Render a page with a table of `rows` rows, each with a status icon and two action icons."""
+    from djc_heroicons.render import render_icon
+
+    rng = random.Random(0)
+    body = "".join(
+        f"<tr><td>Event {index}</td>"
+        f"<td>{render_icon(rng.choice(names), variant='solid', size=16, class_='status')}</td>"
+        f"<td><a href='/events/{index}/'>{render_icon(rng.choice(names), size=20, aria_label='View')}</a>"
+        f"<a href='/events/{index}/edit/'>{render_icon(rng.choice(names), size=20, aria_label='Edit')}</a></td></tr>"
+        for index in range(rows)
+    )
+    return f"<!DOCTYPE html><html><head><title>Events</title></head><body><table>{body}</table></body></html>".encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--distinct", type=int, default=40, help="Number of different icons used on the pages")
+    parser.add_argument("--trained-size", type=int, default=112_640, help="Size of the trained dictionary")
+    args = parser.parse_args()
+
+    setup_bench_config()
+
+    import zstandard
+
+    from djc_heroicons.compression import (
+        COMPRESSION_LEVEL,
+        compress_with_dictionary,
+        decompress_with_dictionary,
+        train_dictionary,
+    )
+    from djc_heroicons.dictionary import build_raw_dictionary, get_dictionary_samples, load_dictionary
+    from djc_heroicons.icons import ICONS
+
+    names: List[IconName] = random.Random(1).sample(sorted(set(ICONS["outline"]) & set(ICONS["solid"])), args.distinct)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dictionaries: List[Tuple[str, str]] = []
+        for label, data in (
+            ("dcz raw", build_raw_dictionary()),
+            ("dcz trained", train_dictionary(args.trained_size, get_dictionary_samples())),
+        ):
+            path = str(Path(tmp_dir) / f"{label.replace(' ', '_')}.dict")
+            Path(path).write_bytes(data)
+            dictionaries.append((label, path))
+            print(f"{label} dictionary: {len(data)} bytes")
+        print()
+
+        print(f"{'rows':>5} {'html':>8} {'gzip':>8} {'zstd':>8} {'dcz raw':>14} {'dcz trained':>14} {'dcz time':>9}")
+        for rows in args.rows:
+            page = make_page(rows, names)
+            gzip_size = len(gzip.compress(page))
+            zstd_size = len(zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(page))
+
+            columns = []
+            for label, path in dictionaries:
+                body = compress_with_dictionary(page, path)
+                columns.append(f"{len(body):>6} ({gzip_size / len(body):.1f}x)")
+
+            # Time the compression of a page as done by the middleware, with the raw dictionary
+            start = time.perf_counter()
+            for _ in range(100):
+                compress_with_dictionary(page, dictionaries[0][1])
+            elapsed = (time.perf_counter() - start) / 100
+
+            print(f"{rows:>5} {len(page):>8} {gzip_size:>8} {zstd_size:>8} {columns[0]:>14} {columns[1]:>14} ", end="")
+            print(f"{elapsed * 1e6:>7.0f}us")
+
+        # Check that the pages decompress as in the browser
+        page = make_page(args.rows[-1], names)
+        for _, path in dictionaries:
+            if decompress_with_dictionary(compress_with_dictionary(page, path), load_dictionary(path)) != page:
+                raise AssertionError(f"Page compressed with {path} didn't decompress to the same content")
+    print("\n(Nx) = times smaller than with gzip")
+
+
+if __name__ == "__main__":
+    main()
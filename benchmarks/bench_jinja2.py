@@ -0,0 +1,95 @@
+"""
+Compare the Jinja2 `heroicon()` global with the Django template path (`{% component "icon" %}`
+and `{% icon %}`), by rendering each in a 1,000-iteration loop.
+
+Requires Jinja2 to be installed.
+
+```sh
+python benchmarks/bench_jinja2.py --iterations 1000 --repeat 5
+```
+"""
+
+import argparse
+import re
+import time
+from typing import Callable, Dict, List, Sequence
+
+from benchutils import setup_bench_config
+
+COMPONENT_TEMPLATE = """
+{% load component_tags %}
+{% for name in names %}
+    {% component "icon" name=name variant="solid" size=20 attrs:class="h-5 w-5" / %}
+{% endfor %}
+"""
+
+TAG_TEMPLATE = """
+{% load heroicons %}
+{% for name in names %}
+    {% icon name variant="solid" size=20 class="h-5 w-5" %}
+{% endfor %}
+"""
+
+RENDER_ID_RE = re.compile(r" data-djc-id-\w+=\"\"")
+
+JINJA2_TEMPLATE = """
+{% for name in names %}
+    {{ heroicon(name, variant="solid", size=20, class_="h-5 w-5") }}
+{% endfor %}
+"""
+
+
+def bench(render: Callable[[Dict], str], names: Sequence[str], repeat: int) -> float:
+    """Return the fastest of `repeat` renders, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render({"names": names})
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_bench_config()
+
+    import jinja2
+    from django.template import Context, Template
+
+    from djc_heroicons.icons import ICONS
+    from djc_heroicons.jinja2 import HeroIconsExtension
+
+    icon_names = list(ICONS["solid"].keys())
+    names: List[str] = [icon_names[index % len(icon_names)] for index in range(args.iterations)]
+
+    component_template = Template(COMPONENT_TEMPLATE)
+    tag_template = Template(TAG_TEMPLATE)
+    jinja2_env = jinja2.Environment(extensions=[HeroIconsExtension], autoescape=True)
+    jinja2_template = jinja2_env.from_string(JINJA2_TEMPLATE)
+
+    # All three render the same icons. Render ID of the components differs for each render, so it's removed
+    jinja2_rendered = jinja2_template.render(names=names).split()
+    if jinja2_rendered != tag_template.render(Context({"names": names})).split():
+        raise AssertionError("heroicon() and {% icon %} rendered different markup")
+    component_rendered = RENDER_ID_RE.sub("", component_template.render(Context({"names": names}))).split()
+    if jinja2_rendered != component_rendered:
+        raise AssertionError('heroicon() and {% component "icon" %} rendered different markup')
+
+    timings = [
+        ('{% component "icon" %}', bench(lambda data: component_template.render(Context(data)), names, args.repeat)),
+        ("{% icon %}", bench(lambda data: tag_template.render(Context(data)), names, args.repeat)),
+        ("Jinja2 heroicon()", bench(lambda data: jinja2_template.render(data), names, args.repeat)),
+    ]
+
+    print(f"{'':<24} {'total':>10} {'per icon':>10}")
+    for label, timing in timings:
+        print(f"{label:<24} {timing * 1000:>8.1f}ms {timing / len(names) * 1e6:>8.1f}us")
+    print(f"Jinja2 heroicon() is {timings[1][1] / timings[2][1]:.1f}x faster than {{% icon %}}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Load test of icon-heavy pages of the `demo` project, requested by many concurrent clients.
+
+By default, the demo project is booted in this process, and served by a threaded WSGI server.
+To load test the demo as it runs in production, start it with e.g. gunicorn, and pass its URL with `--url`.
+
+Reports the throughput and the p50 / p95 / p99 latency of each page. The results can be written
+to a JSON file with `--output`, and compared with an earlier result with `--compare`:
+
+```sh
+python benchmarks/bench_load.py --concurrency 16 --duration 10 --output base.json
+python benchmarks/bench_load.py --setting optimize=true --label optimize --compare base.json
+```
+
+`--setting` sets a field of the `DJC_HEROICONS` settings, and can be given multiple times.
+It only applies to the in-process server.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from socketserver import ThreadingMixIn
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from benchutils import ROOT_DIR
+
+DEMO_DIR = ROOT_DIR / "demo"
+
+DEFAULT_PATHS = ["/dashboard/", "/"]
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def parse_setting(value: str) -> Tuple[str, Any]:
+    """Parse `key=value`, where the value is JSON, or a plain string."""
+    key, _, raw = value.partition("=")
+    try:
+        return key, json.loads(raw)
+    except ValueError:
+        return key, raw
+
+
+def setup_demo(heroicons_settings: Dict[str, Any]) -> None:
+    """Load the settings of the demo project, and set up Django with the given `DJC_HEROICONS` settings."""
+    # Allow running the benchmark without installing the package
+    sys.path.insert(0, str(ROOT_DIR / "src"))
+    sys.path.insert(0, str(DEMO_DIR))
+    os.chdir(DEMO_DIR)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "demo.settings")
+
+    import django
+    from django.conf import settings
+
+    from djc_heroicons import HeroIconsSettings
+
+    settings.DEBUG = False
+    settings.DJC_HEROICONS = HeroIconsSettings(**heroicons_settings)
+    django.setup()
+
+
+def start_server() -> Tuple[str, WSGIServer]:
+    """Serve the demo project from a background thread. Returns the server's URL."""
+    from django.core.wsgi import get_wsgi_application
+
+    server = make_server("127.0.0.1", 0, get_wsgi_application(), _ThreadingWSGIServer, _QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", server
+
+
+def request(host: str, port: int, path: str) -> Tuple[float, int, bool]:
+    """Request the page. Returns (seconds, response bytes, ok)."""
+    start = time.perf_counter()
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        body = response.read()
+        ok = response.status == 200
+    except OSError:
+        body, ok = b"", False
+    finally:
+        conn.close()
+    return time.perf_counter() - start, len(body), ok
+
+
+def run(url: str, paths: Sequence[str], concurrency: int, duration: float) -> Dict[str, List[Tuple[float, int, bool]]]:
+    """
+    Request the pages from `concurrency` clients for `duration` seconds.
+    Each client requests the pages in turn. Returns the samples of each page.
+    """
+    parts = urlsplit(url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    prefix = parts.path.rstrip("/")
+    barrier = threading.Barrier(concurrency)
+
+    def client(offset: int) -> List[Tuple[str, Tuple[float, int, bool]]]:
+        samples = []
+        barrier.wait()
+        deadline = time.perf_counter() + duration
+        i = offset
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            samples.append((path, request(host, port, prefix + path)))
+            i += 1
+        return samples
+
+    results: Dict[str, List[Tuple[float, int, bool]]] = {path: [] for path in paths}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for samples in executor.map(client, range(concurrency)):
+            for path, sample in samples:
+                results[path].append(sample)
+    return results
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples: List[Tuple[float, int, bool]], duration: float) -> Dict[str, Any]:
+    latencies = sorted(seconds * 1000 for seconds, _, ok in samples if ok)
+    ok_count = len(latencies)
+    return {
+        "requests": len(samples),
+        "errors": len(samples) - ok_count,
+        "throughput": ok_count / duration,
+        "bytes": round(sum(size for _, size, ok in samples if ok) / ok_count) if ok_count else 0,
+        "latency_ms": {
+            "mean": sum(latencies) / ok_count if ok_count else 0.0,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+    }
+
+
+def get_environment() -> Dict[str, Optional[str]]:
+    def package_version(name: str) -> Optional[str]:
+        try:
+            return version(name)
+        except PackageNotFoundError:
+            return None
+
+    from djc_heroicons.fingerprints import get_icons_version
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "django": package_version("django"),
+        "django_components": package_version("django_components"),
+        "djc_heroicons": package_version("djc_heroicons"),
+        "icons_version": get_icons_version(),
+    }
+
+
+def print_results(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    columns = ["throughput", "p50", "p95", "p99"]
+
+    def values(stats: Dict[str, Any]) -> List[float]:
+        latency = stats["latency_ms"]
+        return [stats["throughput"], latency["p50"], latency["p95"], latency["p99"]]
+
+    print(f"{'page':<16} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for page, stats in result["pages"].items():
+        throughput, p50, p95, p99 = values(stats)
+        print(
+            f"{page:<16} {stats['requests']:>9} {stats['errors']:>7} "
+            f"{throughput:>9.1f} {p50:>9.2f} {p95:>9.2f} {p99:>9.2f}"
+        )
+        if baseline and page in baseline["pages"]:
+            changes = [
+                f"{(new / old - 1) * 100:+8.1f}%" if old else f"{'-':>9}"
+                for new, old in zip(values(stats), values(baseline["pages"][page]))
+            ]
+            print(f"{'  vs ' + (baseline.get('label') or 'baseline'):<34} {' '.join(changes)}")
+
+    if baseline:
+        print(f"(changes of {', '.join(columns)} against {baseline.get('label') or 'baseline'})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="URL of a running demo server. If omitted, the demo is served in-process")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS, help="Pages to request")
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of concurrent clients")
+    parser.add_argument("--duration", type=float, default=10, help="Duration of the load test, in seconds")
+    parser.add_argument("--warmup", type=float, default=2, help="Duration of the warmup, in seconds")
+    parser.add_argument("--setting", action="append", default=[], type=parse_setting, metavar="KEY=VALUE")
+    parser.add_argument("--label", help="Name of this run, e.g. the version or the settings")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Compare the results with this JSON file")
+    args = parser.parse_args()
+
+    heroicons_settings = dict(args.setting)
+    if args.url and heroicons_settings:
+        parser.error("--setting can be used only with the in-process server")
+
+    # NOTE: Resolve the paths before `setup_demo()` changes the working directory
+    output = os.path.abspath(args.output) if args.output else None
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    setup_demo(heroicons_settings)
+    url = args.url
+    if url is None:
+        url, _ = start_server()
+
+    if args.warmup:
+        run(url, args.paths, args.concurrency, args.warmup)
+    samples = run(url, args.paths, args.concurrency, args.duration)
+
+    result = {
+        "label": args.label,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": get_environment(),
+        "settings": heroicons_settings,
+        "config": {
+            "url": args.url,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+        },
+        "total": summarize([sample for page in samples.values() for sample in page], args.duration),
+        "pages": {path: summarize(page, args.duration) for path, page in samples.items()},
+    }
+
+    print_results(result, baseline)
+    total = result["total"]
+    p99 = total["latency_ms"]["p99"]
+    print(f"Total: {total['requests']} requests, {total['throughput']:.1f} req/s, p99 {p99:.2f} ms")
+
+    if output:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=2)
+        print(f"Results written to {output}")
+
+    if total["errors"]:
+        print(f"ERROR: {total['errors']} requests failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
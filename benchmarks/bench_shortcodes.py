@@ -0,0 +1,103 @@
+"""
+Replace icon shortcodes in a 1 MB document, once with `render_shortcodes()`, which scans the text
+in a single pass, and once by replacing the shortcodes of each icon one by one.
+
+```sh
+python benchmarks/bench_shortcodes.py --size 1000000 --density 50 --repeat 5
+```
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, List
+
+from benchutils import setup_bench_config
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor 10:30: note:".split()
+
+
+def make_document(size: int, density: int, names: List[str]) -> str:
+    """Generate a text of about `size` bytes, with a shortcode about every `density` words."""
+    rng = random.Random(0)
+    words: List[str] = []
+    length = 0
+    while length < size:
+        if rng.randrange(density) == 0:
+            name = rng.choice(names)
+            word = f":{name}:" if rng.random() < 0.5 else f":{rng.choice(['outline', 'solid'])}:{name}:"
+        else:
+            word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def replace_one_by_one(text: str) -> str:
+    """Baseline that scans the text once per shortcode."""
+    from djc_heroicons.icons import ICONS
+    from djc_heroicons.render import render_icon
+
+    for variant, icons in ICONS.items():
+        for name in icons:
+            shortcode = f":{variant}:{name}:"
+            if shortcode in text:
+                text = text.replace(shortcode, render_icon(name, variant))
+    # NOTE: Longest names first, so e.g. `bars-3-bottom-left` is replaced before `bars-3`
+    for name in sorted(ICONS["outline"], key=len, reverse=True):
+        shortcode = f":{name}:"
+        if shortcode in text:
+            text = text.replace(shortcode, render_icon(name))
+    return text
+
+
+def bench(func: Callable[[str], str], text: str, repeat: int) -> float:
+    """Return the fastest of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000, help="Size of the document in bytes")
+    parser.add_argument("--density", type=int, default=50, help="One shortcode per this many words")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_bench_config()
+
+    from djc_heroicons.icons import ICON_NAMES
+    from djc_heroicons.shortcodes import get_shortcode_pattern, render_shortcodes
+
+    text = make_document(args.size, args.density, sorted(ICON_NAMES))
+    shortcodes = len(get_shortcode_pattern().findall(text))
+
+    get_shortcode_pattern.cache_clear()
+    re.purge()
+    start = time.perf_counter()
+    get_shortcode_pattern()
+    compile_time = time.perf_counter() - start
+
+    single_pass = render_shortcodes(text)
+    if single_pass != replace_one_by_one(text):
+        raise AssertionError("render_shortcodes() and the baseline rendered different text")
+
+    single_pass_time = bench(render_shortcodes, text, args.repeat)
+    one_by_one_time = bench(replace_one_by_one, text, args.repeat)
+
+    megabytes = len(text) / 1_000_000
+    print(f"Document: {len(text)} bytes, {shortcodes} shortcodes, {len(single_pass)} bytes rendered")
+    print(f"Regex compiled in {compile_time * 1000:.1f}ms (once per process)")
+    print(f"{'':<24} {'total':>10} {'MB/s':>8}")
+    for label, timing in [("render_shortcodes()", single_pass_time), ("one icon at a time", one_by_one_time)]:
+        print(f"{label:<24} {timing * 1000:>8.1f}ms {megabytes / timing:>8.1f}")
+    print(f"render_shortcodes() is {one_by_one_time / single_pass_time:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare the `{% icon %}` template tag with the `{% component "icon" %}` component,
+by rendering each in a 1,000-iteration `{% for %}` loop.
+
+The `{% icon %}` tag is also measured with only literal arguments, whose markup is reused between renders.
+
+```sh
+python benchmarks/bench_template_tag.py --iterations 1000 --repeat 5
+```
+"""
+
+import argparse
+import time
+from typing import Sequence
+
+from benchutils import setup_bench_config
+
+COMPONENT_TEMPLATE = """
+{% load component_tags %}
+{% for name in names %}
+    {% component "icon" name=name variant="solid" size=20 attrs:class="h-5 w-5" / %}
+{% endfor %}
+"""
+
+TAG_TEMPLATE = """
+{% load heroicons %}
+{% for name in names %}
+    {% icon name variant="solid" size=20 class="h-5 w-5" %}
+{% endfor %}
+"""
+
+LITERAL_TAG_TEMPLATE = """
+{% load heroicons %}
+{% for name in names %}
+    {% icon "bars-3" variant="solid" size=20 class="h-5 w-5" %}
+{% endfor %}
+"""
+
+
+def bench(template_str: str, names: Sequence[str], repeat: int) -> float:
+    """Return the fastest of `repeat` renders, in seconds."""
+    from django.template import Context, Template
+
+    template = Template(template_str)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        template.render(Context({"names": names}))
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_bench_config()
+
+    from djc_heroicons.icons import ICONS
+
+    icon_names = list(ICONS["solid"].keys())
+    names = [icon_names[index % len(icon_names)] for index in range(args.iterations)]
+
+    component_time = bench(COMPONENT_TEMPLATE, names, args.repeat)
+    tag_time = bench(TAG_TEMPLATE, names, args.repeat)
+    literal_tag_time = bench(LITERAL_TAG_TEMPLATE, names, args.repeat)
+
+    print(f"{'':<24} {'total':>10} {'per icon':>10}")
+    for label, timing in [
+        ('{% component "icon" %}', component_time),
+        ("{% icon %}", tag_time),
+        ("{% icon %} (literals)", literal_tag_time),
+    ]:
+        print(f"{label:<24} {timing * 1000:>8.1f}ms {timing / len(names) * 1e6:>8.1f}us")
+    print(f"{{% icon %}} is {component_time / tag_time:.1f}x faster")
+    print(f"{{% icon %}} with literals is {tag_time / literal_tag_time:.1f}x faster than with variables")
+
+
+if __name__ == "__main__":
+    main()
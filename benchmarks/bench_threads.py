@@ -0,0 +1,105 @@
+"""
+Stress benchmark that renders icons from multiple threads at once.
+
+It checks that each thread renders the same markup as a single-threaded render,
+and reports how the throughput scales with the number of threads.
+
+Run it on a free-threaded build (e.g. Python 3.13t / 3.14t) to see the scaling without the GIL:
+
+```sh
+python benchmarks/bench_threads.py --threads 1 2 4 8 --renders 2000
+```
+"""
+
+import argparse
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from benchutils import setup_bench_config
+
+# Render ID differs for each render, so it's removed before comparing the outputs
+RENDER_ID_RE = re.compile(r" data-djc-id-\w+=\"\"")
+
+
+def get_workload() -> List[Dict]:
+    from djc_heroicons.icons import ICONS
+
+    workload: List[Dict] = []
+    for variant, icons in ICONS.items():
+        for index, name in enumerate(icons):
+            workload.append(
+                {
+                    "name": name,
+                    "variant": variant,
+                    "size": 16 + index % 3 * 4,
+                    "color": ["currentColor", "red"][index % 2],
+                }
+            )
+    return workload
+
+
+def render(kwargs: Dict) -> str:
+    from djc_heroicons import Icon
+
+    return RENDER_ID_RE.sub("", Icon.render(kwargs=kwargs))
+
+
+def run(num_threads: int, renders: int, workload: List[Dict], expected: List[str]) -> Tuple[float, int]:
+    """Render `renders` icons in each of `num_threads` threads. Returns (seconds, errors)."""
+    barrier = threading.Barrier(num_threads)
+
+    def worker(offset: int) -> int:
+        errors = 0
+        barrier.wait()
+        for i in range(renders):
+            index = (offset + i) % len(workload)
+            if render(workload[index]) != expected[index]:
+                errors += 1
+        return errors
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        start = time.perf_counter()
+        results = list(executor.map(worker, [n * 97 for n in range(num_threads)]))
+        elapsed = time.perf_counter() - start
+
+    return elapsed, sum(results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--renders", type=int, default=1000, help="Number of renders per thread")
+    args = parser.parse_args()
+
+    setup_bench_config()
+
+    workload = get_workload()
+    expected = [render(kwargs) for kwargs in workload]
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+    print(f"{'threads':>8} {'renders':>9} {'seconds':>9} {'renders/s':>11} {'speedup':>8} {'errors':>7}")
+
+    base_throughput = None
+    total_errors = 0
+    for num_threads in args.threads:
+        elapsed, errors = run(num_threads, args.renders, workload, expected)
+        total = num_threads * args.renders
+        throughput = total / elapsed
+        if base_throughput is None:
+            base_throughput = throughput / num_threads
+        speedup = throughput / base_throughput
+        total_errors += errors
+        print(f"{num_threads:>8} {total:>9} {elapsed:>9.3f} {throughput:>11.0f} {speedup:>7.2f}x {errors:>7}")
+
+    if total_errors:
+        print(f"ERROR: {total_errors} renders differed from the single-threaded output")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
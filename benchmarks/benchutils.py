@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+from typing import Any
+
+import django
+from django.conf import settings
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_bench_config(**extra_settings: Any) -> None:
+    """Configure a minimal Django project for running the benchmarks, similar to `tests/testutils.py`."""
+    if settings.configured:
+        return
+
+    # Allow running the benchmarks without installing the package
+    sys.path.insert(0, str(ROOT_DIR / "src"))
+
+    default_settings = {
+        "BASE_DIR": ROOT_DIR / "benchmarks",
+        "INSTALLED_APPS": ("django_components", "djc_heroicons"),
+        "TEMPLATES": [
+            {
+                "BACKEND": "django.template.backends.django.DjangoTemplates",
+            }
+        ],
+        "COMPONENTS": {
+            "autodiscover": False,
+        },
+        "SECRET_KEY": "secret",
+        "ROOT_URLCONF": "django_components.urls",
+    }
+
+    settings.configure(**{**default_settings, **extra_settings})
+    django.setup()
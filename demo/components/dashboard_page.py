@@ -0,0 +1,77 @@
+from django.http import HttpResponse
+from django_components import Component, types
+
+NAV_ITEMS = [
+    ("home", "Home"),
+    ("inbox", "Inbox"),
+    ("calendar", "Calendar"),
+    ("chart-bar", "Reports"),
+    ("users", "Team"),
+    ("folder", "Projects"),
+    ("document-text", "Documents"),
+    ("credit-card", "Billing"),
+    ("bell", "Notifications"),
+    ("cog-6-tooth", "Settings"),
+    ("question-mark-circle", "Help"),
+    ("arrow-right-start-on-rectangle", "Sign out"),
+]
+
+STATUSES = [
+    ("check-circle", "green", "Done"),
+    ("clock", "orange", "Pending"),
+    ("x-circle", "red", "Failed"),
+]
+
+
+# Generates a page with icons used the way a typical app uses them:
+# a navigation, and a table with a few small icons on each row.
+class DashboardPage(Component):
+    template: types.django_html = """
+        {% load heroicons %}
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>djc-heroicons dashboard</title>
+        </head>
+        <body>
+        <nav>
+            {% for icon_name, label in nav_items %}
+                <a href="#">
+                    {% component "icon" name=icon_name size=24 attrs:class="nav-icon" / %}
+                    {{ label }}
+                </a>
+            {% endfor %}
+        </nav>
+        <table>
+            {% for row in rows %}
+                <tr>
+                    <td>{% icon row.status_icon variant="solid" size=16 color=row.status_color %}</td>
+                    <td>{{ row.title }}</td>
+                    <td>{{ row.status }}</td>
+                    <td>
+                        {% icon "pencil-square" size=20 aria_label="Edit" %}
+                        {% icon "trash" size=20 aria_label="Delete" %}
+                    </td>
+                </tr>
+            {% endfor %}
+        </table>
+        </body>
+        </html>
+    """
+
+    def get_context_data(self, rows: int = 50) -> dict:
+        return {
+            "nav_items": NAV_ITEMS,
+            "rows": [
+                {
+                    "title": f"Task #{index}",
+                    "status_icon": STATUSES[index % len(STATUSES)][0],
+                    "status_color": STATUSES[index % len(STATUSES)][1],
+                    "status": STATUSES[index % len(STATUSES)][2],
+                }
+                for index in range(rows)
+            ],
+        }
+
+    def get(self, request, /) -> HttpResponse:
+        return self.render_to_response()
@@ -48,15 +48,8 @@ class IconsPage(Component):
         """
 
     def get_context_data(self) -> dict:
-        icon_groups: dict = {}
-        for key, val in ICONS.items():
-            prefix, name = key.split("_", maxsplit=1)
-            if prefix not in icon_groups:
-                icon_groups[prefix] = []
-            icon_groups[prefix].append(name)
-
         return {
-            "icon_groups": icon_groups,
+            "icon_groups": {variant: list(icons) for variant, icons in ICONS.items()},
         }
 
     def get(self, request, /) -> HttpResponse:
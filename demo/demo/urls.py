@@ -1,8 +1,10 @@
 from django.urls import include, path
 
+from components.dashboard_page import DashboardPage
 from components.icons_page import IconsPage
 
 urlpatterns = [
     path("", IconsPage.as_view(), name="icons_page"),
+    path("dashboard/", DashboardPage.as_view(), name="dashboard_page"),
     path("", include("django_components.urls")),
 ]
@@ -1,8 +1,11 @@
 from contextlib import contextmanager
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, List, NamedTuple
+from typing import Dict, List, NamedTuple, Tuple
 
+from gen_fingerprints import gen_fingerprints
+from gen_icon_ids import main as gen_icon_ids
+from gen_icon_stub import gen_icon_stub
 from playwright.sync_api import sync_playwright
 
 
@@ -35,7 +38,7 @@ class IconGroup(NamedTuple):
     icons: List[Dict]
 
 
-def download_icons():
+def download_icons() -> Tuple[str, str, str]:
     all_names = set()
     icon_groups: List[IconGroup] = []
 
@@ -73,17 +76,22 @@ def download_icons():
 
     # Once all icons are downloaded, write them to a file
     content = "ICONS: Dict[VariantName, Dict[IconName, List[Dict[str, str]]]] = {}\n"
+    icons_data: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
     for group in icon_groups:
         content += f"\n# {group.group.capitalize()}\n" f'ICONS["{group.group}"] = {{}}\n'
         for item in group.icons:
             name = item["name"]
             paths = item["paths"]
             all_names.add(name)
+            icons_data.setdefault(group.group, {})[name] = paths
             content += f'ICONS["{group.group}"]["{name}"] = {paths}\n'
 
+    # NOTE: The full `Literal` of icon names is defined only in the `icons.pyi` stub,
+    #       so it's not evaluated at runtime.
     icon_name_literals = sorted([f'"{name}"' for name in all_names])
     icon_type = 'VariantName = Literal["outline", "solid"]'
-    icon_type += f'\n    IconName = Literal[{", ".join(icon_name_literals)}]'
+    icon_type += "\n    IconName = str"
+    icon_type += f'\n    ICON_NAMES: FrozenSet[IconName] = frozenset([{", ".join(icon_name_literals)}])'
 
     content = (
         dedent(
@@ -99,9 +107,11 @@ def download_icons():
     the makers of Tailwind CSS.
 
     The icons were extracted from the website using `scripts/download_icons.py`.
+
+    The `IconName` type with all icon names is defined in the `icons.pyi` stub.
     '''
 
-    from typing import Dict, List, Literal
+    from typing import Dict, FrozenSet, List, Literal
 
     {icon_type}
 
@@ -110,12 +120,16 @@ def download_icons():
         + content
     ).lstrip()
 
-    return content
+    return content, gen_icon_stub(all_names), gen_fingerprints(icons_data)
 
 
 def main():
-    icons_script = download_icons()
+    icons_script, icons_stub, fingerprints = download_icons()
     Path("src/djc_heroicons/icons.py").write_text(icons_script)
+    Path("src/djc_heroicons/icons.pyi").write_text(icons_stub)
+    Path("src/djc_heroicons/fingerprints_data.py").write_text(fingerprints)
+    # Assign IDs to new icons, reading the `icons.py` written above
+    gen_icon_ids()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+"""
+Generate `fingerprints_data.py` with content hashes of the icon data in `icons.py`.
+
+The hashes are computed here, when the icons are generated, so they don't have to be computed
+on import. Run this whenever `icons.py` changes (`scripts/download_icons.py` runs it automatically):
+
+```sh
+python scripts/gen_fingerprints.py
+```
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Dict, List
+
+ICONS_DIR = Path(__file__).parent.parent / "src" / "djc_heroicons"
+
+HASH_LENGTH = 16
+
+
+def _hash(data: str) -> str:
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+def gen_fingerprints(icons: Dict[str, Dict[str, List[Dict[str, str]]]]) -> str:
+    icon_versions: Dict[str, Dict[str, str]] = {}
+    variant_versions: Dict[str, str] = {}
+    for variant, variant_icons in sorted(icons.items()):
+        icon_versions[variant] = {
+            # NOTE: The order of the paths matters, the order of the attributes doesn't
+            name: _hash(json.dumps(paths, sort_keys=True, separators=(",", ":")))
+            for name, paths in sorted(variant_icons.items())
+        }
+        variant_versions[variant] = _hash(json.dumps(icon_versions[variant], sort_keys=True))
+
+    icons_version = _hash(json.dumps(variant_versions, sort_keys=True))
+
+    content = dedent(
+        """
+        # fmt: off
+        '''
+        Content hashes of the icon data in `icons.py`.
+        Generated by `scripts/gen_fingerprints.py`, DO NOT EDIT.
+
+        Use the functions in `djc_heroicons.fingerprints` to access these.
+        '''
+
+        from typing import Dict
+
+        ICONS_VERSION = "{icons_version}"
+
+        VARIANT_VERSIONS: Dict[str, str] = {variant_versions}
+
+        ICON_VERSIONS: Dict[str, Dict[str, str]] = {{}}
+        """
+    ).lstrip()
+    content = content.format(icons_version=icons_version, variant_versions=json.dumps(variant_versions))
+
+    for variant, versions in icon_versions.items():
+        content += f'ICON_VERSIONS["{variant}"] = {json.dumps(versions)}\n'
+
+    return content
+
+
+def main() -> None:
+    # Import the data module directly, so we don't need to set up Django
+    sys.path.insert(0, str(ICONS_DIR))
+    from icons import ICONS  # type: ignore[import-not-found]
+
+    (ICONS_DIR / "fingerprints_data.py").write_text(gen_fingerprints(ICONS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Generate `icon_ids_data.py`, which assigns a stable integer ID to each `(variant, name)` of the icons
+in `icons.py`. The IDs are stored in the database by `IconField`.
+
+The table is append-only. New icons get the next free IDs, and the IDs of existing icons never change,
+not even when an icon is removed. Each time icons are added, `ICON_IDS_VERSION` is incremented.
+
+Run this whenever `icons.py` changes (`scripts/download_icons.py` runs it automatically):
+
+```sh
+python scripts/gen_icon_ids.py
+```
+"""
+
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Dict, Iterable, Tuple
+
+ICONS_DIR = Path(__file__).parent.parent / "src" / "djc_heroicons"
+
+
+def gen_icon_ids(
+    icons: Iterable[Tuple[str, str]],
+    current_ids: Dict[int, Tuple[str, str]],
+    current_version: int,
+) -> str:
+    ids = dict(current_ids)
+    known = set(ids.values())
+    new_icons = sorted(set(icons) - known)
+
+    version = current_version
+    if new_icons or not ids:
+        version += 1
+    next_id = max(ids, default=0) + 1
+    for icon in new_icons:
+        ids[next_id] = icon
+        next_id += 1
+
+    content = dedent(
+        """
+        # fmt: off
+        '''
+        Stable integer IDs of the icons, as `ID: (variant, name)`.
+        Generated by `scripts/gen_icon_ids.py`, DO NOT EDIT.
+
+        This table is append-only. IDs are stored in databases by `IconField`, so they must never change.
+
+        Use the functions in `djc_heroicons.icon_ids` to access these.
+        '''
+
+        from typing import Dict, Tuple
+
+        ICON_IDS_VERSION = {version}
+
+        ICON_IDS: Dict[int, Tuple[str, str]] = {{
+        """
+    ).lstrip()
+    content = content.format(version=version)
+
+    for icon_id, (variant, name) in sorted(ids.items()):
+        content += f'    {icon_id}: ("{variant}", "{name}"),\n'
+    content += "}\n"
+    return content
+
+
+def main() -> None:
+    # Import the data modules directly, so we don't need to set up Django
+    sys.path.insert(0, str(ICONS_DIR))
+    from icons import ICONS  # type: ignore[import-not-found]
+
+    try:
+        from icon_ids_data import ICON_IDS, ICON_IDS_VERSION  # type: ignore[import-not-found]
+    except ImportError:
+        ICON_IDS, ICON_IDS_VERSION = {}, 0
+
+    icons = [(variant, name) for variant, variant_icons in ICONS.items() for name in variant_icons]
+    (ICONS_DIR / "icon_ids_data.py").write_text(gen_icon_ids(icons, ICON_IDS, ICON_IDS_VERSION))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Generate the `icons.pyi` type stub from the icon data in `icons.py`.
+
+At runtime, `IconName` is a plain `str` alias, so importing `icons.py` doesn't have to build
+a `Literal` with hundreds of members. Type checkers and IDEs read the stub instead,
+which holds the full `Literal` of icon names.
+
+Run this whenever `icons.py` changes (`scripts/download_icons.py` runs it automatically):
+
+```sh
+python scripts/gen_icon_stub.py
+```
+"""
+
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Iterable
+
+ICONS_DIR = Path(__file__).parent.parent / "src" / "djc_heroicons"
+
+
+def gen_icon_stub(icon_names: Iterable[str]) -> str:
+    icon_name_literals = sorted([f'"{name}"' for name in set(icon_names)])
+
+    content = dedent(
+        """
+        # fmt: off
+        '''
+        Type stub for `icons.py`. Generated by `scripts/gen_icon_stub.py`, DO NOT EDIT.
+
+        At runtime `IconName` is only an alias for `str`, and `ICON_NAMES` holds the valid names.
+        '''
+
+        from typing import Dict, FrozenSet, List, Literal
+
+        VariantName = Literal["outline", "solid"]
+        IconName = Literal[{icon_names}]
+
+        ICON_NAMES: FrozenSet[IconName]
+        ICONS: Dict[VariantName, Dict[IconName, List[Dict[str, str]]]]
+        """
+    ).lstrip()
+
+    return content.replace("{icon_names}", ", ".join(icon_name_literals))
+
+
+def main() -> None:
+    # Import the data module directly, so we don't need to set up Django
+    sys.path.insert(0, str(ICONS_DIR))
+    from icons import ICONS  # type: ignore[import-not-found]
+
+    icon_names = set()
+    for variant_icons in ICONS.values():
+        icon_names.update(variant_icons.keys())
+
+    (ICONS_DIR / "icons.pyi").write_text(gen_icon_stub(icon_names))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,17 @@
 # Public API
-# isort: off
-from djc_heroicons.app_settings import HeroIconsSettings
-from djc_heroicons.components.icon import Icon
-from djc_heroicons.icons import IconName, VariantName
+# NOTE: The public API is imported lazily, on first access, so that e.g. `import djc_heroicons.icons`
+#       doesn't import Django and django-components.
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
 
-# isort: on
+if TYPE_CHECKING:
+    # isort: off
+    from djc_heroicons.app_settings import HeroIconsSettings
+    from djc_heroicons.components.icon import Icon
+    from djc_heroicons.icons import IconName, VariantName
+    from djc_heroicons.render import render_icon
+
+    # isort: on
 
 
 __all__ = [
@@ -12,4 +19,28 @@ __all__ = [
     "Icon",
     "IconName",
     "VariantName",
+    "render_icon",
 ]
+
+_LAZY_IMPORTS: Dict[str, str] = {
+    "HeroIconsSettings": "djc_heroicons.app_settings",
+    "Icon": "djc_heroicons.components.icon",
+    "IconName": "djc_heroicons.icons",
+    "VariantName": "djc_heroicons.icons",
+    "render_icon": "djc_heroicons.render",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    # Cache the value, so `__getattr__` is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -1,9 +1,14 @@
 from importlib import import_module
-from typing import NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Union
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django_components import ComponentRegistry
 
+if TYPE_CHECKING:
+    from djc_heroicons.tracing import IconTracer
+
 
 class HeroIconsSettings(NamedTuple):
     """
@@ -64,12 +69,210 @@ class HeroIconsSettings(NamedTuple):
     ```
     """
 
+    optimize: Optional[bool] = None
+    """
+    Whether to render the icons with fewer DOM nodes.
+
+    If `True`, paths with the same attributes are merged into a single `<path>`,
+    and attributes shared by all paths (e.g. `stroke-linecap`) are set on the `<svg>` element instead.
+    The icons stay visually identical. See `djc_heroicons/optimize.py`.
+
+    Defaults to `False`.
+    """
+
+    css_variables: Optional[bool] = None
+    """
+    Whether to take the icon size, color and stroke width from CSS custom properties.
+
+    If `True`, each icon renders to the same markup, no matter the `size`, `color` and `stroke_width`
+    kwargs, which are ignored. This makes the rendered HTML easier to cache and compress.
+
+    Instead, set the `--heroicon-size`, `--heroicon-color` and `--heroicon-stroke-width`
+    CSS custom properties on a parent element or a CSS class:
+
+    ```html
+    <div style="--heroicon-size: 16px; --heroicon-color: red">
+        {% component "icon" name="academic-cap" / %}
+    </div>
+    ```
+
+    Defaults to `False`.
+    """
+
+    fallback_icon: Optional[str] = None
+    """
+    What to render in place of icons that don't exist, e.g. when icon names come from the database.
+
+    - If `None`, rendering an unknown icon or variant raises `ValueError`.
+    - If an empty string, unknown icons render to nothing.
+    - Otherwise, this is the name of the icon to render instead, with the same size, color and attributes.
+      If the variant is unknown too, the `"outline"` variant of the fallback icon is used.
+
+    Each unknown icon is logged once, as a warning to the `djc_heroicons` logger.
+
+    ```python
+    DJC_HEROICONS = HeroIconsSettings(
+        fallback_icon="question-mark-circle",
+    )
+    ```
+
+    Defaults to `None`.
+    """
+
+    warmup_profile: Optional[str] = None
+    """
+    Path to a JSON file with the icons that are rendered the most, e.g. `BASE_DIR / "heroicons_profile.json"`.
+
+    If set, the most rendered icons from this file are rendered when Django starts, so that
+    the first requests of a new worker don't have to render them. See `djc_heroicons/warmup.py`.
+
+    The file is written when `warmup_sample_rate` is set, or you can write it yourself.
+
+    Defaults to `None`.
+    """
+
+    warmup_sample_rate: Optional[float] = None
+    """
+    Fraction of renders, between `0` and `1`, that are recorded to the `warmup_profile` file.
+
+    E.g. `0.01` records 1 in 100 renders. The recorded usage is written to the file every minute,
+    and when the process exits.
+
+    Defaults to `0` (recording is off).
+    """
+
+    warmup_count: Optional[int] = None
+    """
+    Number of the most rendered icons from `warmup_profile` to render when Django starts.
+
+    Defaults to `100`.
+    """
+
+    cache: Optional[str] = None
+    """
+    Alias of the Django cache (from the `CACHES` setting) in which to cache the rendered icons,
+    so they are shared by all worker processes, e.g. with Redis or Memcached.
+
+    The icons are also cached in each process, so the shared cache is used only the first time
+    each process renders an icon. Only icons rendered without custom `attrs` are cached.
+
+    ```python
+    DJC_HEROICONS = HeroIconsSettings(
+        cache="icons",
+    )
+    ```
+
+    Defaults to `None` (icons are cached only in each process).
+    """
+
+    byte_budget: Optional[float] = None
+    """
+    Maximum share, between `0` and `1`, of the response bytes that may be taken by icons.
+
+    Used by `djc_heroicons.middleware.IconBudgetMiddleware`, which logs a warning when a HTML response
+    exceeds this budget.
+
+    ```python
+    DJC_HEROICONS = HeroIconsSettings(
+        byte_budget=0.1,
+    )
+    ```
+
+    Defaults to `0.25`.
+    """
+
+    static_markup: Optional[bool] = None
+    """
+    Whether the `Icon` component renders plain SVG markup, without the `data-djc-id-...` attribute
+    that django-components adds to each rendered component.
+
+    If `True`, rendering an icon with the same kwargs always gives the same HTML, which makes the HTML
+    easier to cache and compress. Icons have no JS or CSS, so they don't need the attribute.
+
+    This can be also set for a single icon with the `static` kwarg of the `Icon` component.
+
+    Defaults to `False`.
+    """
+
+    tracer: Optional[Union["IconTracer", str]] = None
+    """
+    Tracer that receives traces of the icon renders, or an import path to it.
+    See `djc_heroicons/tracing.py`.
+
+    ```python
+    DJC_HEROICONS = HeroIconsSettings(
+        tracer="myapp.tracing.icon_tracer",
+    )
+    ```
+
+    Defaults to `None` (icon renders are not traced).
+    """
+
+    presets: Optional[Dict[str, Dict[str, Any]]] = None
+    """
+    Icon components with their own defaults, for the icon configurations that are used the most.
+
+    Each preset is registered as a separate component, next to the `Icon` component. The keys are
+    the component names, and the values are the defaults for the inputs of the `Icon` component.
+    Preset `attrs` are prepared once, and icons rendered with them are cached.
+
+    ```python
+    DJC_HEROICONS = HeroIconsSettings(
+        presets={
+            "button_icon": {"variant": "solid", "size": 16},
+            "nav_icon": {"size": 20, "attrs": {"class": "nav-icon"}},
+        },
+    )
+    ```
+
+    Then use the presets like the `Icon` component. The defaults can still be overridden:
+
+    ```html
+    {% component "button_icon" name="check" / %}
+    {% component "nav_icon" name="home" size=24 / %}
+    ```
+
+    Defaults to `{}`.
+    """
+
+    compression_dictionary: Optional[str] = None
+    """
+    Path to the shared compression dictionary built with the `heroicons_dictionary` management command.
+
+    If set, browsers download the dictionary once from the `djc_heroicons:compression_dictionary` endpoint,
+    and `djc_heroicons.compression.CompressionDictionaryMiddleware` compresses the HTML responses with it,
+    so the icons on each page take only a few bytes. See `djc_heroicons/dictionary.py`.
+
+    ```python
+    DJC_HEROICONS = HeroIconsSettings(
+        compression_dictionary=str(BASE_DIR / "heroicons.dict"),
+    )
+    ```
+
+    Defaults to `None` (no dictionary).
+    """
+
 
 class InternalSettings:
+    def __init__(self) -> None:
+        self._snapshot: Optional[HeroIconsSettings] = None
+        self._imported: Dict[str, Any] = {}
+
     @property
     def _settings(self) -> HeroIconsSettings:
-        data = getattr(settings, "DJC_HEROICONS", {})
-        return HeroIconsSettings(**data) if not isinstance(data, HeroIconsSettings) else data
+        # The settings are parsed once and then kept as an immutable snapshot.
+        # Reading and replacing the reference is atomic, so this is safe to use from multiple threads
+        # (also without the GIL) without a lock. At worst, a few threads parse the settings at the same time.
+        snapshot = self._snapshot
+        if snapshot is None:
+            data = getattr(settings, "DJC_HEROICONS", {})
+            snapshot = HeroIconsSettings(**data) if not isinstance(data, HeroIconsSettings) else data
+            self._snapshot = snapshot
+        return snapshot
+
+    def _reset(self) -> None:
+        self._snapshot = None
+        self._imported = {}
 
     @property
     def REGISTRY(self) -> ComponentRegistry:
@@ -93,5 +296,105 @@ class InternalSettings:
 
         return component_name
 
+    @property
+    def OPTIMIZE(self) -> bool:
+        optimize = self._settings.optimize
+        if optimize is None:
+            optimize = False
+
+        return optimize
+
+    @property
+    def CSS_VARIABLES(self) -> bool:
+        css_variables = self._settings.css_variables
+        if css_variables is None:
+            css_variables = False
+
+        return css_variables
+
+    @property
+    def FALLBACK_ICON(self) -> Optional[str]:
+        return self._settings.fallback_icon
+
+    @property
+    def WARMUP_PROFILE(self) -> Optional[str]:
+        warmup_profile = self._settings.warmup_profile
+        return str(warmup_profile) if warmup_profile is not None else None
+
+    @property
+    def WARMUP_SAMPLE_RATE(self) -> float:
+        warmup_sample_rate = self._settings.warmup_sample_rate
+        if warmup_sample_rate is None:
+            warmup_sample_rate = 0
+
+        return warmup_sample_rate
+
+    @property
+    def WARMUP_COUNT(self) -> int:
+        warmup_count = self._settings.warmup_count
+        if warmup_count is None:
+            warmup_count = 100
+
+        return warmup_count
+
+    @property
+    def CACHE(self) -> Optional[str]:
+        return self._settings.cache
+
+    @property
+    def BYTE_BUDGET(self) -> float:
+        byte_budget = self._settings.byte_budget
+        if byte_budget is None:
+            byte_budget = 0.25
+
+        return byte_budget
+
+    @property
+    def STATIC_MARKUP(self) -> bool:
+        static_markup = self._settings.static_markup
+        if static_markup is None:
+            static_markup = False
+
+        return static_markup
+
+    @property
+    def TRACER(self) -> Optional["IconTracer"]:
+        tracer_or_import = self._settings.tracer
+        if not isinstance(tracer_or_import, str):
+            return tracer_or_import
+
+        # The tracer is read on each render, so it's imported only once
+        tracer = self._imported.get(tracer_or_import)
+        if tracer is None:
+            module_name, attr = tracer_or_import.rsplit(".", 1)
+            tracer = getattr(import_module(module_name), attr)
+            self._imported[tracer_or_import] = tracer
+        return tracer
+
+    @property
+    def PRESETS(self) -> Dict[str, Dict[str, Any]]:
+        presets = self._settings.presets
+        if presets is None:
+            presets = {}
+
+        return presets
+
+    @property
+    def COMPRESSION_DICTIONARY(self) -> Optional[str]:
+        compression_dictionary = self._settings.compression_dictionary
+        return str(compression_dictionary) if compression_dictionary is not None else None
+
 
 app_settings = InternalSettings()
+
+
+# Clear the snapshot when the settings are changed, e.g. with `override_settings` in tests
+@receiver(setting_changed)
+def _on_setting_changed(setting: str, **kwargs: Any) -> None:
+    if setting == "DJC_HEROICONS":
+        app_settings._reset()
+
+        # The cached renders were looked up in or stored to the shared cache from the old `cache` setting
+        from djc_heroicons.render import _format_svg_cached
+
+        _format_svg_cached.cache_clear()
@@ -1,5 +1,11 @@
+import os
+import sys
+
 from django.apps import AppConfig
 
+# Management commands that serve requests, so the caches are warmed up for them
+SERVER_COMMANDS = ("runserver", "runserver_plus")
+
 
 class HeroIconsConfig(AppConfig):
     name = "djc_heroicons"
@@ -8,11 +14,38 @@ class HeroIconsConfig(AppConfig):
     # to Django's INSTALLED_APPS
     def ready(self) -> None:
         register_icon_component()
+        setup_warmup()
 
 
 def register_icon_component() -> None:
     from djc_heroicons.app_settings import app_settings
-    from djc_heroicons.components.icon import Icon
+    from djc_heroicons.components.icon import Icon, create_icon_preset
 
     # Register the component with the specified name and to the specified registry
-    app_settings.REGISTRY.register(app_settings.COMPONENT_NAME, Icon)
+    registry = app_settings.REGISTRY
+    registry.register(app_settings.COMPONENT_NAME, Icon)
+
+    # Register the presets next to it, see the `presets` setting
+    for name, preset in app_settings.PRESETS.items():
+        registry.register(name, create_icon_preset(name, preset))
+
+
+def is_management_command() -> bool:
+    """Whether Django runs a management command that doesn't serve requests, e.g. `migrate` or `shell`."""
+    script = sys.argv[0] if sys.argv else ""
+    # NOTE: `python -m django` runs `django/__main__.py`
+    is_django_script = script.endswith(os.path.join("django", "__main__.py"))
+    if os.path.basename(script) not in ("manage.py", "django-admin") and not is_django_script:
+        return False
+    return len(sys.argv) < 2 or sys.argv[1] not in SERVER_COMMANDS
+
+
+def setup_warmup() -> None:
+    from djc_heroicons.warmup import setup_warmup
+
+    # Management commands don't render icons, so they shouldn't warm up or record
+    if is_management_command():
+        return
+
+    # Render the most used icons in advance, if `warmup_profile` is set
+    setup_warmup()
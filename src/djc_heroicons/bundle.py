@@ -0,0 +1,148 @@
+"""
+Bundles of several icons served in a single response, as JSON or as an SVG sprite.
+
+Bundles are assembled from per-icon fragments that are rendered once and cached. The icons
+in a bundle are sorted, so the same set of icons always gives the same bundle, no matter the order
+in which they were requested.
+"""
+
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+from typing import Iterable, Literal, NamedTuple, Tuple
+
+from django.utils.html import escape
+
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.fingerprints import get_icon_version, get_markup_version
+from djc_heroicons.icons import IconName, VariantName
+from djc_heroicons.render import (
+    DEFAULT_COLOR,
+    DEFAULT_SIZE,
+    DEFAULT_STROKE_WIDTH,
+    _format_svg_cached,
+    _get_icon_body,
+    get_default_attrs,
+    validate_icon,
+)
+
+BundleFormat = Literal["json", "svg"]
+
+BUNDLE_MAX_ICONS = 100
+"""Maximum number of icons in a single bundle."""
+
+BundleKey = Tuple[Tuple[VariantName, IconName], ...]
+
+
+class IconBundle(NamedTuple):
+    body: bytes
+    """The bundle as UTF-8 encoded JSON or SVG."""
+    gzip_body: bytes
+    """The `body` compressed with gzip."""
+    content_type: str
+
+
+def get_bundle_key(icons: Iterable[Tuple[VariantName, IconName]]) -> BundleKey:
+    """
+    Get the canonical key of a bundle, which is the same for the same set of icons in any order.
+
+    Raises `ValueError` if any of the icons doesn't exist, or if there are more than `BUNDLE_MAX_ICONS` icons.
+    """
+    key = tuple(sorted(set(icons)))
+    if len(key) > BUNDLE_MAX_ICONS:
+        raise ValueError(f"Too many icons: {len(key)}. At most {BUNDLE_MAX_ICONS} icons can be bundled")
+
+    for variant, name in key:
+        validate_icon(name, variant)
+    return key
+
+
+def parse_bundle_icons(value: str) -> BundleKey:
+    """
+    Parse a comma-separated list of icons, e.g. `"solid:bars-3,academic-cap"`, into a bundle key.
+
+    Icons are given as `variant:name`, or only as `name` for the `"outline"` variant.
+    """
+    icons = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        variant, _, name = item.rpartition(":")
+        icons.append((variant or "outline", name))
+    return get_bundle_key(icons)  # type: ignore[arg-type]
+
+
+def get_bundle_etag(key: BundleKey, format: BundleFormat) -> str:
+    """
+    Get the ETag of a bundle, without quotes. It changes when any of the bundled icons change,
+    or when their markup changes (see `get_markup_version()`).
+    """
+    parts = [get_markup_version(), format]
+    parts.extend(f"{variant}:{name}:{get_icon_version(name, variant)}" for variant, name in key)
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+@lru_cache(maxsize=None)
+def _get_json_fragment(variant: VariantName, name: IconName, optimize: bool, css_variables: bool) -> str:
+    svg = _format_svg_cached(
+        name, variant, DEFAULT_SIZE, DEFAULT_COLOR, DEFAULT_STROKE_WIDTH, "0 0 24 24", None, optimize, css_variables
+    )
+    return f"{json.dumps(f'{variant}:{name}')}:{json.dumps(str(svg))}"
+
+
+@lru_cache(maxsize=None)
+def _get_sprite_fragment(variant: VariantName, name: IconName, optimize: bool, css_variables: bool) -> str:
+    svg_attrs, paths = _get_icon_body(variant, name, optimize)
+    attrs = get_default_attrs(variant, DEFAULT_SIZE, DEFAULT_COLOR, DEFAULT_STROKE_WIDTH, "0 0 24 24", css_variables)
+    attrs.update(svg_attrs)
+    attrs.pop("aria-hidden")
+
+    # The size is set by the `<svg>` element that uses the symbol, so only the coloring styles are kept
+    style = "; ".join(part for part in attrs.pop("style").split("; ") if not part.startswith(("width:", "height:")))
+    if style:
+        attrs["style"] = style
+
+    attrs_html = " ".join(f'{key}="{escape(value)}"' for key, value in attrs.items())
+    return f'<symbol id="heroicon-{variant}-{name}" {attrs_html}>{paths}</symbol>'
+
+
+@lru_cache(maxsize=256)
+def _get_icon_bundle(key: BundleKey, format: BundleFormat, optimize: bool, css_variables: bool) -> IconBundle:
+    if format == "json":
+        fragments = [_get_json_fragment(variant, name, optimize, css_variables) for variant, name in key]
+        content = '{"icons":{' + ",".join(fragments) + "}}"
+        content_type = "application/json"
+    else:
+        fragments = [_get_sprite_fragment(variant, name, optimize, css_variables) for variant, name in key]
+        content = '<svg xmlns="http://www.w3.org/2000/svg" style="display: none">' + "".join(fragments) + "</svg>"
+        content_type = "image/svg+xml"
+
+    body = content.encode("utf-8")
+    # NOTE: `mtime=0` so the compressed body is the same on every server
+    gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+    return IconBundle(body=body, gzip_body=gzip_body, content_type=content_type)
+
+
+def get_icon_bundle(key: BundleKey, format: BundleFormat = "json") -> IconBundle:
+    """
+    Get a bundle of icons, either as JSON (`format="json"`), or as an SVG sprite (`format="svg"`).
+
+    The JSON bundle maps `"variant:name"` to the icon's `<svg>` element:
+
+    ```json
+    {"icons": {"outline:bars-3": "<svg ...>...</svg>", "solid:bars-3": "<svg ...>...</svg>"}}
+    ```
+
+    The SVG sprite contains a `<symbol>` with the ID `heroicon-<variant>-<name>` for each icon:
+
+    ```html
+    <svg class="size-6"><use href="#heroicon-outline-bars-3" /></svg>
+    ```
+
+    The bundles are cached together with their gzip-compressed bodies.
+    """
+    if format not in ("json", "svg"):
+        raise ValueError(f"Invalid format: {format}. Must be either 'json' or 'svg'")
+    return _get_icon_bundle(key, format, app_settings.OPTIMIZE, app_settings.CSS_VARIABLES)
@@ -0,0 +1,114 @@
+"""
+Cache of rendered icons shared by all worker processes, through Django's cache framework.
+
+Enabled with the `cache` setting. Rendered icons are first looked up in the in-process cache,
+and only then in the shared cache. Only renders without custom attributes are cached.
+
+When an icon is not cached yet, only one thread per process renders it, and other processes wait
+a short moment for it to appear in the cache, before they render it themselves.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Callable, Dict
+
+from django.core.cache import BaseCache, caches
+
+from djc_heroicons.fingerprints import icon_cache_key
+from djc_heroicons.icons import IconName, VariantName
+
+SINGLE_FLIGHT_TIMEOUT = 5
+"""For how long, in seconds, a process may hold the lock for rendering an icon."""
+
+SINGLE_FLIGHT_WAIT = 0.1
+"""For how long, in seconds, to wait for an icon that is rendered by another process."""
+
+_SINGLE_FLIGHT_POLL = 0.01
+
+
+class _KeyLock:
+    """Lock for rendering a single icon, with the number of threads that hold it or wait for it."""
+
+    __slots__ = ("lock", "holders")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.holders = 0
+
+
+_locks: Dict[str, _KeyLock] = {}
+_locks_lock = threading.Lock()
+
+
+def get_svg_cache_key(
+    name: IconName,
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    optimize: bool,
+    css_variables: bool,
+) -> str:
+    """
+    Get the key under which a rendered icon is cached.
+
+    The key changes when the icon's data changes, or when djc_heroicons is upgraded.
+    The kwargs are hashed, so the key is safe to use with any cache backend.
+    """
+    kwargs = json.dumps([size, color, stroke_width, viewbox, optimize, css_variables])
+    kwargs_hash = hashlib.sha256(kwargs.encode("utf-8")).hexdigest()[:32]
+    return icon_cache_key("svg", kwargs_hash, name=name, variant=variant)
+
+
+def get_or_render(cache_alias: str, key: str, render: Callable[[], str]) -> str:
+    """Get the rendered icon from the cache, or render it and store it in the cache."""
+    cache = caches[cache_alias]
+    svg = cache.get(key)
+    if svg is not None:
+        return svg
+
+    # Only one thread in this process renders the icon, the others wait for it
+    with _locks_lock:
+        key_lock = _locks.get(key)
+        if key_lock is None:
+            key_lock = _locks[key] = _KeyLock()
+        key_lock.holders += 1
+
+    try:
+        with key_lock.lock:
+            svg = cache.get(key)
+            if svg is not None:
+                return svg
+            return _render_single_flight(cache, key, render)
+    finally:
+        # The lock is removed only by the last thread, so threads that come later still find it
+        with _locks_lock:
+            key_lock.holders -= 1
+            if not key_lock.holders:
+                del _locks[key]
+
+
+def _render_single_flight(cache: BaseCache, key: str, render: Callable[[], str]) -> str:
+    lock_key = f"{key}:lock"
+    acquired = cache.add(lock_key, 1, SINGLE_FLIGHT_TIMEOUT)
+    if not acquired:
+        # Another process is rendering the icon, so give it a moment to finish
+        deadline = time.monotonic() + SINGLE_FLIGHT_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(_SINGLE_FLIGHT_POLL)
+            svg = cache.get(key)
+            if svg is not None:
+                return svg
+
+    try:
+        svg = str(render())
+        # NOTE: The key changes with the icon's data, so the markup under a key never gets stale,
+        #       and it's kept until the cache evicts it, instead of the backend's default `TIMEOUT`
+        cache.set(key, svg, timeout=None)
+        return svg
+    finally:
+        if acquired:
+            cache.delete(lock_key)
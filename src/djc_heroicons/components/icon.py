@@ -1,10 +1,14 @@
-import difflib
-from typing import Any, Dict, NamedTuple, Optional
+import time
+from typing import Any, Dict, NamedTuple, Optional, Type
 
-from django.template import Context
+from django.template import Context, Template
+from django.utils.safestring import SafeString
 from django_components import Component, Empty, types
 
+from djc_heroicons.app_settings import app_settings
 from djc_heroicons.icons import ICONS, IconName, VariantName
+from djc_heroicons.render import FrozenAttrs, _rendered_icons, render_icon_svg
+from djc_heroicons.signals import icon_rendered
 
 
 class Icon(Component):
@@ -21,6 +25,8 @@ class Icon(Component):
         stroke_width: float
         viewbox: str
         attrs: Optional[Dict]
+        static: Optional[bool]
+        deferred: bool
 
     class Defaults:
         variant: VariantName = "outline"
@@ -29,54 +35,117 @@ class Icon(Component):
         stroke_width: float = 1.5
         viewbox: str = "0 0 24 24"
         attrs: Optional[Dict] = None
+        static: Optional[bool] = None
+        deferred: bool = False
+
+    preset_attrs: Optional[FrozenAttrs] = None
+    """Attributes of an icon preset, see `create_icon_preset()`."""
+
+    @classmethod
+    def _render_svg(cls, kwargs: Kwargs) -> SafeString:
+        """Render the `<svg>` element of the icon, with the attributes of the preset, if any."""
+        attrs = kwargs.attrs
+        if cls.preset_attrs:
+            attrs = {**cls.preset_attrs, **attrs} if attrs else cls.preset_attrs
+        # The icon is rendered by the same code as `render_icon()`, which caches the markup
+        return render_icon_svg(
+            name=kwargs.name,
+            variant=kwargs.variant,
+            size=kwargs.size,
+            color=kwargs.color,
+            stroke_width=kwargs.stroke_width,
+            viewbox=kwargs.viewbox,
+            attrs=attrs,
+            deferred=kwargs.deferred,
+        )
 
     def get_template_data(self, args: Empty, kwargs: Kwargs, slots: Empty, context: Context) -> Dict:
-        if kwargs.variant not in ["outline", "solid"]:
-            raise ValueError(f"Invalid variant: {kwargs.variant}. Must be either 'outline' or 'solid'")
-
-        variant_icons = ICONS[kwargs.variant]
-        if kwargs.name not in variant_icons:
-            # Give users a helpful message by fuzzy-search the closest key
-            msg = ""
-            icon_names = list(variant_icons.keys())
-            if icon_names:
-                fuzzy_matches = difflib.get_close_matches(kwargs.name, icon_names, n=3, cutoff=0.7)
-                if fuzzy_matches:
-                    suggestions = ", ".join([f"'{match}'" for match in fuzzy_matches])
-                    msg += f". Did you mean any of {suggestions}?"
-
-            raise ValueError(f"Invalid icon name: {kwargs.name}{msg}")
-
-        icon_paths = variant_icons[kwargs.name]
-
-        # These are set as "default" attributes, so users can override them
-        # by passing them in the `attrs` argument.
-        default_attrs: Dict[str, Any] = {
-            "viewBox": kwargs.viewbox,
-            "style": f"width: {kwargs.size}px; height: {kwargs.size}px",
-            "aria-hidden": "true",
-        }
-
-        # The SVG applies the color differently in "outline" and "solid" versions
-        if kwargs.variant == "outline":
-            default_attrs["fill"] = "none"
-            default_attrs["stroke"] = kwargs.color
-            default_attrs["stroke-width"] = kwargs.stroke_width
-        else:
-            default_attrs["fill"] = kwargs.color
-            default_attrs["stroke"] = "none"
-
-        return {
-            "icon_paths": icon_paths,
-            "default_attrs": default_attrs,
-            "attrs": kwargs.attrs,
-        }
+        start = time.perf_counter()
+        svg = self._render_svg(kwargs)
+        # Timings are sent with the `icon_rendered` signal, see `on_render_after()`
+        self._data_time = time.perf_counter() - start
+        self._svg = svg
+        return {"svg": svg}
+
+    def on_render_before(self, context: Context, template: Optional[Template]) -> None:
+        self._render_start = time.perf_counter()
+
+    def on_render_after(
+        self,
+        context: Context,
+        template: Optional[Template],
+        result: Optional[str],
+        error: Optional[Exception],
+    ) -> Optional[str]:
+        if error is not None or result is None:
+            return None
+
+        static = self.kwargs.static
+        if static is None:
+            static = app_settings.STATIC_MARKUP
+        # Replace the output, which has the `data-djc-id-...` attribute of this render, with the plain SVG
+        if static:
+            result = self._svg
+
+        sender = self.__class__
+        if icon_rendered.has_listeners(sender):
+            icon_rendered.send(
+                sender=sender,
+                kwargs=self.kwargs._asdict(),
+                data_time=self._data_time,
+                render_time=time.perf_counter() - self._render_start,
+                html=result,
+            )
+
+        if not static:
+            # The recorded plain SVG is not in the response, so record the output as it will appear there,
+            # see `djc_heroicons.middleware.IconBudgetMiddleware`
+            rendered_icons = _rendered_icons.get()
+            if rendered_icons is not None:
+                rendered_icons.append(result)
+
+        return result if static else None
 
     template: types.django_html = """
-        {% load component_tags %}
-        <svg {% html_attrs attrs default_attrs %}>
-            {% for path_attrs in icon_paths %}
-                <path {% html_attrs path_attrs %} />
-            {% endfor %}
-        </svg>
+        {{ svg }}
     """
+
+
+def create_icon_preset(name: str, preset: Dict[str, Any]) -> Type[Icon]:
+    """
+    Create a subclass of the `Icon` component, whose defaults are set by the `preset` dict,
+    e.g. `{"variant": "solid", "size": 16, "attrs": {"class": "btn-icon"}}`. See the `presets` setting.
+
+    Raises `ValueError` if the preset has unknown inputs, an invalid variant, or unhashable `attrs`.
+    """
+    unknown = sorted(set(preset) - (set(Icon.Kwargs._fields) - {"name"}))
+    if unknown:
+        raise ValueError(f"Invalid icon preset '{name}': Unknown inputs {', '.join(unknown)}")
+
+    variant = preset.get("variant", Icon.Defaults.variant)
+    if variant not in ICONS:
+        raise ValueError(
+            f"Invalid icon preset '{name}': Invalid variant: {variant}. Must be either 'outline' or 'solid'"
+        )
+
+    # Renders with the preset attrs are cached, so the attrs are used as cache keys
+    for key, value in (preset.get("attrs") or {}).items():
+        try:
+            hash(value)
+        except TypeError:
+            raise ValueError(
+                f"Invalid icon preset '{name}': Value of attribute '{key}' must be hashable, "
+                f"got {type(value).__name__}"
+            ) from None
+
+    # NOTE: The attrs are merged with the `attrs` given to each icon, so they are not part of the defaults
+    defaults = {key: value for key, value in preset.items() if key != "attrs"}
+    return type(  # type: ignore[return-value]
+        f"IconPreset_{name}",
+        (Icon,),
+        {
+            "__module__": __name__,
+            "Defaults": type("Defaults", (Icon.Defaults,), defaults),
+            "preset_attrs": FrozenAttrs(preset["attrs"]) if preset.get("attrs") else None,
+        },
+    )
@@ -0,0 +1,147 @@
+"""
+Compression of HTML responses with the shared compression dictionary, see `djc_heroicons/dictionary.py`.
+
+Requires [zstandard](https://pypi.org/project/zstandard/) to be installed. Responses are encoded
+as `dcz` (zstd with a dictionary), as defined by Compression Dictionary Transport.
+"""
+
+from functools import lru_cache
+from typing import Callable, List
+
+import zstandard
+from django.http import HttpRequest, HttpResponse
+from django.urls import NoReverseMatch, reverse
+from django.utils.cache import patch_vary_headers
+
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.dictionary import CompressionDictionary, load_dictionary
+from djc_heroicons.utils import accepts_encoding
+
+DCZ_MAGIC = b"\x5e\x2a\x4d\x18\x20\x00\x00\x00"
+"""Bytes at the start of each `dcz` response, followed by the SHA-256 hash of the dictionary."""
+
+COMPRESSION_LEVEL = 3
+"""zstd compression level. Higher levels compress only slightly better, but several times slower."""
+
+MIN_CONTENT_LENGTH = 200
+"""Responses shorter than this are not compressed, same as with Django's `GZipMiddleware`."""
+
+def train_dictionary(size: int, samples: List[bytes]) -> bytes:
+    """
+    Train a zstd dictionary of at most `size` bytes from the `samples`, e.g. from `get_dictionary_samples()`.
+
+    Trained dictionaries are smaller than raw-content dictionaries, but compress the icons less.
+    """
+    return zstandard.train_dictionary(size, samples).as_bytes()  # type: ignore[arg-type]
+
+
+@lru_cache(maxsize=None)
+def _get_zstd_dictionary(path: str) -> zstandard.ZstdCompressionDict:
+    dictionary = load_dictionary(path)
+    # NOTE: Trained dictionaries start with the zstd dictionary magic number, and anything else
+    #       is used as raw content, same as the browsers do
+    zstd_dict = zstandard.ZstdCompressionDict(dictionary.data, dict_type=zstandard.DICT_TYPE_AUTO)
+    # Prepare the dictionary once, so compressing each response doesn't have to
+    zstd_dict.precompute_compress(level=COMPRESSION_LEVEL)
+    return zstd_dict
+
+
+def compress_with_dictionary(content: bytes, path: str) -> bytes:
+    """
+    Compress the `content` with the dictionary from the file at `path`, as a `dcz` response body.
+
+    The body is the `DCZ_MAGIC`, the SHA-256 hash of the dictionary, and a zstd frame.
+    """
+    dictionary = load_dictionary(path)
+    # NOTE: Compressors can't be used by several threads at once, but creating one with a prepared
+    #       dictionary is cheap
+    compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL, dict_data=_get_zstd_dictionary(path))
+    return DCZ_MAGIC + dictionary.digest + compressor.compress(content)
+
+
+def decompress_with_dictionary(body: bytes, dictionary: CompressionDictionary) -> bytes:
+    """
+    Decompress a `dcz` response `body`, as the browsers do. Raises `ValueError` if the body
+    wasn't compressed with the `dictionary`.
+    """
+    header_length = len(DCZ_MAGIC) + len(dictionary.digest)
+    if body[:header_length] != DCZ_MAGIC + dictionary.digest:
+        raise ValueError("Response was not compressed with the dictionary")
+
+    zstd_dict = zstandard.ZstdCompressionDict(dictionary.data, dict_type=zstandard.DICT_TYPE_AUTO)
+    return zstandard.ZstdDecompressor(dict_data=zstd_dict).decompress(body[header_length:])
+
+
+class CompressionDictionaryMiddleware:
+    """
+    Compress HTML responses with the shared compression dictionary from the `compression_dictionary` setting.
+
+    Browsers that don't have the dictionary yet get the `Link` header that points to the
+    `djc_heroicons:compression_dictionary` endpoint, from which they download the dictionary when idle.
+    After that, the browsers advertise it in the `Available-Dictionary` header, and the responses
+    are compressed with the dictionary, with `Content-Encoding: dcz`.
+
+    Other responses are left to the next middleware, so put this after `GZipMiddleware`,
+    and before `IconBudgetMiddleware`:
+
+    **Example:**
+
+    ```python
+    MIDDLEWARE = [
+        "django.middleware.gzip.GZipMiddleware",
+        "djc_heroicons.compression.CompressionDictionaryMiddleware",
+        ...
+    ]
+    ```
+
+    Browsers accept `dcz` only over HTTPS (and from `localhost`).
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+
+        path = app_settings.COMPRESSION_DICTIONARY
+        if (
+            path is None
+            or response.status_code != 200
+            or getattr(response, "streaming", False)
+            or response.has_header("Content-Encoding")
+            or not response.get("Content-Type", "").startswith("text/html")
+        ):
+            return response
+
+        # The response depends on whether the browser has the dictionary
+        patch_vary_headers(response, ["Accept-Encoding", "Available-Dictionary"])
+
+        dictionary = load_dictionary(path)
+        available_dictionary = request.headers.get("Available-Dictionary", "").strip()
+        if available_dictionary != dictionary.hash:
+            self._link_dictionary(response)
+            return response
+
+        accepts_dcz = accepts_encoding(request.headers.get("Accept-Encoding", ""), "dcz")
+        if not accepts_dcz or len(response.content) < MIN_CONTENT_LENGTH:
+            return response
+
+        response.content = compress_with_dictionary(response.content, path)
+        response["Content-Length"] = str(len(response.content))
+        response["Content-Encoding"] = "dcz"
+        # The compressed and uncompressed responses are different representations, same as with gzip
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        return response
+
+    def _link_dictionary(self, response: HttpResponse) -> None:
+        try:
+            url = reverse("djc_heroicons:compression_dictionary")
+        except NoReverseMatch:
+            return
+
+        link = f'<{url}>; rel="compression-dictionary"'
+        if response.has_header("Link"):
+            link = f"{response['Link']}, {link}"
+        response["Link"] = link
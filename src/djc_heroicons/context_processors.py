@@ -0,0 +1,21 @@
+from typing import Dict
+
+from django.http import HttpRequest
+
+from djc_heroicons.fingerprints import get_markup_version
+
+
+def heroicons(request: HttpRequest) -> Dict[str, str]:
+    """
+    Add `HEROICONS_VERSION` to the template context. It holds the version of the rendered icon markup,
+    see `djc_heroicons.fingerprints.get_markup_version()`.
+
+    Use it to version cached template fragments:
+
+    ```django
+    {% cache 600 sidebar HEROICONS_VERSION %}
+      ...
+    {% endcache %}
+    ```
+    """
+    return {"HEROICONS_VERSION": get_markup_version()}
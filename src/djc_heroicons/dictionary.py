@@ -0,0 +1,75 @@
+"""
+Shared compression dictionary for the icon markup, used with
+[Compression Dictionary Transport](https://datatracker.ietf.org/doc/draft-ietf-httpbis-compression-dictionary/).
+
+Icons are the bulk of icon-heavy pages, and each icon's paths are unique, so general-purpose compression
+(gzip, zstd) can't compress them well. A dictionary that contains the markup of all icons lets the browser
+download the icons once, after which each icon on a page compresses to a few bytes that point
+into the dictionary.
+
+The dictionary is a file built with the `heroicons_dictionary` management command, and set with
+the `compression_dictionary` setting. It's served to browsers from the `djc_heroicons:compression_dictionary`
+endpoint, and used to compress the HTML responses by `djc_heroicons.compression.CompressionDictionaryMiddleware`.
+"""
+
+import base64
+import hashlib
+from functools import lru_cache
+from typing import List, NamedTuple
+
+from djc_heroicons.icons import ICONS
+from djc_heroicons.render import DEFAULT_COLOR, DEFAULT_SIZE, DEFAULT_STROKE_WIDTH, render_icon_svg
+
+DICTIONARY_MATCH = "/*"
+"""URL pattern of the pages that browsers use the dictionary for, see the `Use-As-Dictionary` header."""
+
+
+class CompressionDictionary(NamedTuple):
+    data: bytes
+    """Content of the dictionary."""
+    digest: bytes
+    """SHA-256 hash of the dictionary."""
+
+    @property
+    def hash(self) -> str:
+        """Hash of the dictionary as sent by browsers in the `Available-Dictionary` header, e.g. `:pZGm1A...=:`."""
+        return f":{base64.b64encode(self.digest).decode('ascii')}:"
+
+
+def get_dictionary_samples() -> List[bytes]:
+    """
+    Get the markup of all icons, as rendered with the current settings and with the default
+    size, color and stroke width.
+
+    The icons' markup differs between pages only in the attributes, so these samples contain
+    all the paths that may appear on a page.
+    """
+    return [
+        render_icon_svg(name, variant, DEFAULT_SIZE, DEFAULT_COLOR, DEFAULT_STROKE_WIDTH, "0 0 24 24", None).encode()
+        # NOTE: zstd encodes matches at smaller offsets in fewer bits. Content at the end of the dictionary
+        #       is the closest to the compressed page, so outline icons, which are the default, come last.
+        for variant, icons in sorted(ICONS.items(), reverse=True)
+        for name in icons
+    ]
+
+
+def build_raw_dictionary() -> bytes:
+    """
+    Build a raw-content dictionary, which is the markup of all icons one after another.
+
+    Pages can reference any icon in the dictionary, so icons compress better than with a trained
+    dictionary, which keeps only the content that is common to many icons, at the cost of a larger dictionary.
+    """
+    return b"".join(get_dictionary_samples())
+
+
+@lru_cache(maxsize=None)
+def load_dictionary(path: str) -> CompressionDictionary:
+    """
+    Read the dictionary from the file at `path`.
+
+    The file is read only once per process, so restart the server after the dictionary is rebuilt.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    return CompressionDictionary(data=data, digest=hashlib.sha256(data).digest())
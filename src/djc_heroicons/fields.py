@@ -0,0 +1,120 @@
+import logging
+from typing import Any, List, Optional, Tuple
+
+from django.core import checks, exceptions
+from django.core.validators import BaseValidator
+from django.db import models
+from django.utils.functional import cached_property
+
+from djc_heroicons.forms import IconChoiceField
+from djc_heroicons.icon_ids import get_icon_by_id, get_icon_id
+from djc_heroicons.icons import ICONS, IconName, VariantName
+
+logger = logging.getLogger("djc_heroicons")
+
+
+class IconField(models.PositiveSmallIntegerField):
+    """
+    Model field for an icon name of the given `variant`.
+
+    In Python, the value is the icon name, e.g. `"arrow-right-start-on-rectangle"`. In the database,
+    the icon is stored as a small integer ID, which takes less space than the name, also in indexes.
+    The IDs are stable, see `djc_heroicons.icon_ids`.
+
+    In forms, this field is represented by `IconChoiceField`.
+
+    **Example:**
+
+    ```python
+    from django.db import models
+    from djc_heroicons.fields import IconField
+
+    class MenuItem(models.Model):
+        icon = IconField(variant="solid")
+
+    MenuItem.objects.create(icon="academic-cap")
+    MenuItem.objects.filter(icon__in=["academic-cap", "bars-3"])
+    ```
+    """
+
+    description = "Icon name, stored as an integer ID"
+
+    default_error_messages = {
+        "invalid_choice": "Invalid icon name: %(value)s",
+    }
+
+    def __init__(self, *args: Any, variant: VariantName = "outline", **kwargs: Any) -> None:
+        self.variant = variant
+        super().__init__(*args, **kwargs)
+
+    def check(self, **kwargs: Any) -> List[checks.CheckMessage]:
+        errors = super().check(**kwargs)
+        if self.variant not in ICONS:
+            errors.append(
+                checks.Error(
+                    f"Invalid variant: {self.variant}. Must be either 'outline' or 'solid'",
+                    obj=self,
+                    id="djc_heroicons.E001",
+                )
+            )
+        return errors
+
+    def deconstruct(self) -> Tuple[Any, Any, Any, Any]:
+        name, path, args, kwargs = super().deconstruct()
+        if self.variant != "outline":
+            kwargs["variant"] = self.variant
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self) -> List[BaseValidator]:
+        # NOTE: The min/max validators of integer fields don't apply, because in Python the value is a string
+        return [*self.default_validators, *self._validators]
+
+    def from_db_value(self, value: Optional[int], expression: Any, connection: Any) -> Optional[IconName]:
+        if value is None:
+            return None
+        try:
+            return get_icon_by_id(value)[1]
+        except ValueError:
+            # E.g. the icon was removed from the icon set, so don't fail the whole query
+            logger.warning(f"Unknown icon ID {value} in field '{self.name}', using None instead")
+            return None
+
+    def to_python(self, value: Any) -> Optional[IconName]:
+        if value is None or isinstance(value, str):
+            return value  # type: ignore[return-value]
+        try:
+            variant, name = get_icon_by_id(int(value))
+        except (TypeError, ValueError):
+            variant, name = None, None
+        if variant != self.variant:
+            raise exceptions.ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+        return name
+
+    def get_prep_value(self, value: Any) -> Optional[int]:
+        value = models.Field.get_prep_value(self, value)
+        if value is None or value == "":
+            return None
+        if isinstance(value, int):
+            return value
+        try:
+            return get_icon_id(value, self.variant)
+        except ValueError as err:
+            raise ValueError(f"Field '{self.name}' expected an icon name but got {value!r}.") from err
+
+    def validate(self, value: Any, model_instance: Optional[models.Model]) -> None:
+        super().validate(value, model_instance)
+        if value not in self.empty_values and value not in ICONS[self.variant]:
+            raise exceptions.ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+
+    def formfield(self, **kwargs: Any) -> Any:
+        # NOTE: Skip the integer fields, which would pass `min_value` and `max_value` to the form field
+        return models.Field.formfield(self, **{"form_class": IconChoiceField, "variant": self.variant, **kwargs})
@@ -0,0 +1,89 @@
+"""
+Version fingerprints of the icon set, for use in cache keys and ETags.
+
+The content hashes are computed when the icons are generated (see `scripts/gen_fingerprints.py`),
+so reading them costs only a dictionary lookup.
+"""
+
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Optional
+
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.fingerprints_data import ICON_VERSIONS, ICONS_VERSION, VARIANT_VERSIONS
+from djc_heroicons.icons import IconName, VariantName
+from djc_heroicons.render import validate_icon
+
+CACHE_KEY_PREFIX = "djc_heroicons"
+
+
+def get_icons_version() -> str:
+    """
+    Get the content hash of the whole icon set.
+
+    The hash changes only when the icon data changes, e.g. when icons are added or modified.
+    """
+    return ICONS_VERSION
+
+
+def get_variant_version(variant: VariantName) -> str:
+    """Get the content hash of all icons of the given variant."""
+    if variant not in VARIANT_VERSIONS:
+        raise ValueError(f"Invalid variant: {variant}. Must be either 'outline' or 'solid'")
+    return VARIANT_VERSIONS[variant]
+
+
+def get_icon_version(name: IconName, variant: VariantName = "outline") -> str:
+    """Get the content hash of a single icon."""
+    validate_icon(name, variant)
+    return ICON_VERSIONS[variant][name]
+
+
+@lru_cache(maxsize=1)
+def _get_package_version() -> str:
+    try:
+        return version("djc_heroicons")
+    except PackageNotFoundError:
+        return "0"
+
+
+def _get_render_version() -> str:
+    # Part of the version that doesn't depend on the icon data
+    flags = ("o" if app_settings.OPTIMIZE else "") + ("c" if app_settings.CSS_VARIABLES else "")
+    return _get_package_version() + (f"-{flags}" if flags else "")
+
+
+def get_markup_version() -> str:
+    """
+    Get the version of the rendered icon markup.
+
+    Unlike `get_icons_version()`, this changes also when the package is upgraded, or when settings
+    that change the markup (`optimize`, `css_variables`) are changed. Use this to version
+    caches that hold rendered icons.
+    """
+    return f"{ICONS_VERSION}-{_get_render_version()}"
+
+
+def icon_cache_key(*parts: Any, name: Optional[IconName] = None, variant: VariantName = "outline") -> str:
+    """
+    Build a cache key that is invalidated when the icon markup changes.
+
+    The key is made of the markup version and the given `parts`. If the `name` of an icon is given,
+    the key depends only on that icon, so it isn't invalidated when other icons change.
+
+    **Example:**
+
+    ```python
+    from django.core.cache import cache
+    from djc_heroicons.fingerprints import icon_cache_key
+
+    key = icon_cache_key("sidebar", request.user.pk)
+    sidebar = cache.get_or_set(key, lambda: render_sidebar(request))
+    ```
+    """
+    if name is None:
+        version_key = get_markup_version()
+    else:
+        version_key = f"{get_icon_version(name, variant)}-{_get_render_version()}"
+
+    return ":".join([CACHE_KEY_PREFIX, version_key, *[str(part) for part in parts]])
@@ -0,0 +1,17 @@
+# fmt: off
+'''
+Content hashes of the icon data in `icons.py`.
+Generated by `scripts/gen_fingerprints.py`, DO NOT EDIT.
+
+Use the functions in `djc_heroicons.fingerprints` to access these.
+'''
+
+from typing import Dict
+
+ICONS_VERSION = "6c19d28ad6a34862"
+
+VARIANT_VERSIONS: Dict[str, str] = {"outline": "11c792542a84ff0a", "solid": "6570d2153076855e"}
+
+ICON_VERSIONS: Dict[str, Dict[str, str]] = {}
+ICON_VERSIONS["outline"] = {"academic-cap": "28490aa61f54552f", "adjustments-horizontal": "24b4edeba393ff39", "adjustments-vertical": "7eec861b111da6b9", "archive-box": "1cb0d2f6f9aad419", "archive-box-arrow-down": "90c1d1df354503da", "archive-box-x-mark": "db337442855baea2", "arrow-down": "a006e77e15f1b8d3", "arrow-down-circle": "85100c31695700db", "arrow-down-left": "4071736799fee83c", "arrow-down-on-square": "ce161417a9fd7927", "arrow-down-on-square-stack": "c6e426e1eedd190a", "arrow-down-right": "bbc768a283485ec2", "arrow-down-tray": "115de080d932c2cb", "arrow-left": "a8a80fb40da431ae", "arrow-left-circle": "a8cf781e1f538f82", "arrow-left-end-on-rectangle": "fb53f1ef5bc3d8aa", "arrow-left-start-on-rectangle": "d0272f97c8978158", "arrow-long-down": "d800e7a39c3166f5", "arrow-long-left": "fbf8c6dac10ccb8a", "arrow-long-right": "b8e6a2bf8cd31b86", "arrow-long-up": "ad3cd9fe486152c0", "arrow-path": "501d94f137f87c89", "arrow-path-rounded-square": "a8c775b9354e7c0d", "arrow-right": "06b1ea99806b269b", "arrow-right-circle": "ebbf08483a2b62a9", "arrow-right-end-on-rectangle": "f2c21b76a326d29b", "arrow-right-start-on-rectangle": "99952ded057c9abc", "arrow-top-right-on-square": "7a5d546558fa2193", "arrow-trending-down": "58714751a6dc764a", "arrow-trending-up": "73208d0ca40bb63a", "arrow-turn-down-left": "889e0a5f1122e8cd", "arrow-turn-down-right": "0368b9e955bef22d", "arrow-turn-left-down": "831540f1e1e4ae7e", "arrow-turn-left-up": "120eaf94aec6e130", "arrow-turn-right-down": "f4dce627956a3275", "arrow-turn-right-up": "055ab9be892e9f1e", "arrow-turn-up-left": "d31da244614b0d80", "arrow-turn-up-right": "7e04ebda0b97d76b", "arrow-up": "62f1ca3372750d6d", "arrow-up-circle": "2b0308fe5a65153e", "arrow-up-left": "72e19b1f0b79f606", "arrow-up-on-square": "b39c3c31bd5da1c4", "arrow-up-on-square-stack": "a5337fe021b936ac", "arrow-up-right": "ff7bba580a1ace80", "arrow-up-tray": "48a6302dd826893c", "arrow-uturn-down": "4bd19cbc773c58be", "arrow-uturn-left": "9f67e7fcdf752a1b", "arrow-uturn-right": "d0e0dba57d274012", "arrow-uturn-up": "b9308866ece7f7f4", "arrows-pointing-in": "7cd366ab5590f494", "arrows-pointing-out": "1066185868e8f5f7", "arrows-right-left": "16e9186123ea673f", "arrows-up-down": "eaa06b4fec4f4d35", "at-symbol": "47a3059c0df00459", "backspace": "abd1ad876bf54823", "backward": "8a99837e4b611bed", "banknotes": "85ee99d8b667d34c", "bars-2": "05f32ef9792bc06d", "bars-3": "04a0da51e3d7c060", "bars-3-bottom-left": "8ce4a62ce9ae7be1", "bars-3-bottom-right": "636e01e75da81885", "bars-3-center-left": "e3cd00f8f5700006", "bars-4": "5715f777ad68b559", "bars-arrow-down": "dd3dbb1e9dc0b32f", "bars-arrow-up": "cbedf8f9e65160da", "battery-0": "d6cae6432c510cd1", "battery-100": "a639f77055f2e40b", "battery-50": "5a9e086bd3fa73fa", "beaker": "6ff2b4000b06aaab", "bell": "15bc75cc18640c28", "bell-alert": "453866cc8f7526c5", "bell-slash": "95b5e7141891253b", "bell-snooze": "60eab1c5e7c4e280", "bold": "52ec3a21ca5336c8", "bolt": "9e6f78a722194a63", "bolt-slash": "385894b2b3fa0917", "book-open": "c520824b06f3c6fe", "bookmark": "1851add364fb12e0", "bookmark-slash": "be3f9d9615ac5655", "bookmark-square": "ad0b2a6f2443bf26", "briefcase": "8e6017eb9ddd8f42", "bug-ant": "382a54c409a5187a", "building-library": "c5dd3ca788a53c3b", "building-office": "e69e974b164ab284", "building-office-2": "447a431163ab03a8", "building-storefront": "82653b4fb6421d45", "cake": "e1f16349541e8b53", "calculator": "9aa98439040090a7", "calendar": "d986f4835f811bc0", "calendar-date-range": "5289ab15721ad907", "calendar-days": "29ad1844b7a1ac30", "camera": "3f28a43e6dd1c299", "chart-bar": "0ba0e9c28c2703ca", "chart-bar-square": "7100e017283cb80c", "chart-pie": "00cace95a44df153", "chat-bubble-bottom-center": "2a2091e2ce98fdf8", "chat-bubble-bottom-center-text": "17dbe43a7d250798", "chat-bubble-left": "64df422f7db30b95", "chat-bubble-left-ellipsis": "a761c974b08b6596", "chat-bubble-left-right": "12fd6f1c03353fd8", "chat-bubble-oval-left": "0953c47d9a7e243a", "chat-bubble-oval-left-ellipsis": "4012db8bcfed390b", "check": "4390f2be79ac8e2d", "check-badge": "1564331a4e818934", "check-circle": "ba0a03a75687661e", "chevron-double-down": "9a12560cf1f54d27", "chevron-double-left": "95c5de5b52ab9355", "chevron-double-right": "f504c12fb0c20d49", "chevron-double-up": "ada77515be4cc427", "chevron-down": "c015d1a4046789ab", "chevron-left": "20cac915a9944301", "chevron-right": "39bea467b86f351c", "chevron-up": "79c7016993048e43", "chevron-up-down": "c66fc53b4e3f5efd", "circle-stack": "f70bad0698d35bf9", "clipboard": "a1efa25aa8fb527a", "clipboard-document": "de9563b8bf8675ac", "clipboard-document-check": "561f53f3c6f981fc", "clipboard-document-list": "60f28c88b7349995", "clock": "0a756143b30f0c49", "cloud": "05ce94db7a4601da", "cloud-arrow-down": "576f87e639f149de", "cloud-arrow-up": "8bb36dbd912160c6", "code-bracket": "69c392af1910e392", "code-bracket-square": "dcc0363813e1fb05", "cog": "6153b433cb0b2209", "cog-6-tooth": "4798dd631d41ba11", "cog-8-tooth": "799cdb8ef432557a", "command-line": "76ef0d608a28b7cd", "computer-desktop": "1f2bc6958af50809", "cpu-chip": "47186a970e2145ab", "credit-card": "8e64e5d58b60dcc3", "cube": "9e0413c2374afa50", "cube-transparent": "ab5448155e71e63b", "currency-bangladeshi": "fdfb3c70f49dba11", "currency-dollar": "0bab252a28d6d85b", "currency-euro": "344bc03cd7ba006b", "currency-pound": "cb060d355ee87b56", "currency-rupee": "3d78fa5d4664df0d", "currency-yen": "1d7d2933bce51113", "cursor-arrow-rays": "3a698330bf55711b", "cursor-arrow-ripple": "7daca7de99cb3195", "device-phone-mobile": "325e96224743f2a0", "device-tablet": "08b4e03f50f0e18c", "divide": "e626741be40a878b", "document": "e19dc0b53b3e69b3", "document-arrow-down": "4c4a4a933b6cc694", "document-arrow-up": "6fd26063714d9ef0", "document-chart-bar": "139ac4187016c02d", "document-check": "b4d8a05ccd85fad0", "document-currency-bangladeshi": "e2d3f3678b9868e6", "document-currency-dollar": "7a40220fcf9a2c3a", "document-currency-euro": "084e1da9f2b83112", "document-currency-pound": "9774e1f986495a0a", "document-currency-rupee": "68214d7e9e3eb358", "document-currency-yen": "a5441a40e8649cf4", "document-duplicate": "f51c70ffb0078859", "document-magnifying-glass": "51cf65546562a8d3", "document-minus": "e734dd3544e8ad99", "document-plus": "a4b29bcc5b71cb35", "document-text": "cdd1340ae3733c34", "ellipsis-horizontal": "89f2bb9f7b3690de", "ellipsis-horizontal-circle": "0813c298323a7bf2", "ellipsis-vertical": "37bbceab649fa056", "envelope": "772c5fb074ac4a15", "envelope-open": "d1653546d79cbac7", "equals": "a559f708e1eb7c4b", "exclamation-circle": "11c9345417b090ee", "exclamation-triangle": "87233054a1ff3ab2", "eye": "faa78946516a0d5f", "eye-dropper": "0ae426a2db5468a9", "eye-slash": "e239c078f2ce0bbf", "face-frown": "65a724d579a65d98", "face-smile": "e53e423ae346b26b", "film": "2118ed48d662657a", "finger-print": "5aca3a87d536aaef", "fire": "db528dee9d5cec7d", "flag": "94d9b83db0fb14b4", "folder": "85835468786dd82b", "folder-arrow-down": "60b8a9c6998297a6", "folder-minus": "1471f69a18c37432", "folder-open": "71c8e77bb73052eb", "folder-plus": "a6c75abdf0e51011", "forward": "5679dbc50ac1fa37", "funnel": "e90e4d2f96f4ee0b", "gif": "7e16764ddf4201ea", "gift": "6df1c8e7df63882e", "gift-top": "296bad4ad0f8ccbc", "globe-alt": "8ca65d2fb13d806e", "globe-americas": "7055951f017a36a3", "globe-asia-australia": "8dbd990249549955", "globe-europe-africa": "8445c41bcbce4d87", "h1": "73ab0410d936828e", "h2": "abd7113b130c7432", "h3": "dcf67aa7277e98f8", "hand-raised": "4cd1eba9ffa04e1a", "hand-thumb-down": "595d945d0663d4b7", "hand-thumb-up": "74baeb7b0ee028ed", "hashtag": "c1874a9eef840da5", "heart": "0367edc9b421c77e", "home": "72d152b7755d2623", "home-modern": "0074386a6bb8c2cc", "identification": "36fe9907beb775de", "inbox": "c8b394e602e2789c", "inbox-arrow-down": "7d741c415283acaf", "inbox-stack": "7a6ff68224052885", "information-circle": "ef2ac3c2c56fdfc1", "italic": "e62195e8bef8c640", "key": "9b352ad2f2b8ef7c", "language": "ce28339a7ac57678", "lifebuoy": "af45ffae8e7082eb", "light-bulb": "3031c55932e70724", "link": "848611bef624ba80", "link-slash": "af9aa85391703239", "list-bullet": "41f771f43572df81", "lock-closed": "91749b5ee14ac85d", "lock-open": "3c96767edda5d2b8", "magnifying-glass": "19380e1dbb08a291", "magnifying-glass-circle": "8f446f9ef1219e89", "magnifying-glass-minus": "4fc4e555b0d7de7c", "magnifying-glass-plus": "e91a4c964621a095", "map": "dc956052a2301b46", "map-pin": "da06895be92537d0", "megaphone": "de253a0f3ecde761", "microphone": "5b760352c26881b1", "minus": "bf7aadc4a65a5c9a", "minus-circle": "e64cb006c55670f0", "moon": "df61e2f7c6bcd326", "musical-note": "0f670af8cd14c0ad", "newspaper": "66c59ae53392480b", "no-symbol": "dbc5455e06cff43c", "numbered-list": "c95599b7107a0186", "paint-brush": "caec9fa1986b5d7e", "paper-airplane": "d6b255d28afa2cea", "paper-clip": "52682827a8f8e8b8", "pause": "85101e21f9e7be4d", "pause-circle": "d3f058732cfb0c57", "pencil": "e68295e46564f6d9", "pencil-square": "f842ab7f109ffe07", "percent-badge": "977fa2bd85cf75df", "phone": "fe365d722bda6859", "phone-arrow-down-left": "24ed0e05a0010966", "phone-arrow-up-right": "be8c5181773af270", "phone-x-mark": "ebd8fea518c5a9f5", "photo": "2f4d1a43562d35a2", "play": "ca2af8babb7b536a", "play-circle": "858ff67c4d47ad46", "play-pause": "8aad28604702bd9f", "plus": "0774a99337515a04", "plus-circle": "af4381e1642cd5de", "power": "7878d00e1ef2544f", "presentation-chart-bar": "e687f46a978734e4", "presentation-chart-line": "8ecae3424a29dc23", "printer": "31c0584da0375426", "puzzle-piece": "5bea12b3894bf6c2", "qr-code": "77263254906363ae", "question-mark-circle": "d44986cbf9e02e0e", "queue-list": "abbe270aa657a905", "radio": "3b6e9e3d7aea5ece", "receipt-percent": "57b435b134afb627", "receipt-refund": "35a233aeba81417e", "rectangle-group": "8571d28d5fb67a38", "rectangle-stack": "b8a9cdabf5c0eac6", "rocket-launch": "b8b03e9b8b79a742", "rss": "55076177e0992fad", "scale": "67919caecf1cab17", "scissors": "aa454aa1255495a8", "server": "b3bebc93899b4bae", "server-stack": "d80236841eb06c8e", "share": "39309613e57f2609", "shield-check": "9ea63faed468da0a", "shield-exclamation": "da569dafacad5f90", "shopping-bag": "9f6a473c8469c1c3", "shopping-cart": "60f8a97b8ad8e503", "signal": "705f5d957e883cf2", "signal-slash": "34142d645d79052e", "slash": "ab9148baa654d3a0", "sparkles": "fe8dae51404d18f3", "speaker-wave": "f85341d5305f4d4a", "speaker-x-mark": "042383fbf8bb5fc6", "square-2-stack": "e39a0d092be299d7", "square-3-stack-3d": "3d0d5fa8abf65e81", "squares-2x2": "7d56eb09b54c7cbd", "squares-plus": "3be803944c41a3be", "star": "ea29b202f35c1126", "stop": "9499bed7f1a5f5fb", "stop-circle": "9ff3e2e253ac26fd", "strikethrough": "47fe663bf5fe6899", "sun": "952f097e35e60412", "swatch": "1e2fded9a0bd660c", "table-cells": "5af556bc7a8e84e2", "tag": "68ad53902db4a710", "ticket": "bd447f03e4991a3a", "trash": "4a19ecdd253dbb55", "trophy": "cedfd9c12b3bd677", "truck": "ffbd4b9a02d2c193", "tv": "a57a93291e07fed8", "underline": "021799698eb4ae33", "user": "e06fb133e175b847", "user-circle": "7a129eebb2e91131", "user-group": "a29499ea966405ad", "user-minus": "7fb6b6d593cc5ad5", "user-plus": "f7e14b7253d8cbac", "users": "a2a4ed08aa33ad51", "variable": "114b676d61c2f641", "video-camera": "bdcd5a91ed40c27f", "video-camera-slash": "25fe2e08c60259a8", "view-columns": "12887f9dcfefe23b", "viewfinder-circle": "68292b046eec343c", "wallet": "645743712077872b", "wifi": "876f4f1316a4a6e6", "window": "ee75a779a45bdb63", "wrench": "34a5f23a9a135424", "wrench-screwdriver": "b300345495f012bc", "x-circle": "6ea6da19bfb06ef2", "x-mark": "27b43290a846ece7"}
+ICON_VERSIONS["solid"] = {"academic-cap": "f3fa98e151883410", "adjustments-horizontal": "352d26108448be57", "adjustments-vertical": "963777aaa18083a7", "archive-box": "5483f89292e3a0f3", "archive-box-arrow-down": "9563d71da0f5e7e3", "archive-box-x-mark": "f8cb3a6074b3b875", "arrow-down": "6b696510d44b3667", "arrow-down-circle": "aadce588db750002", "arrow-down-left": "e398a27a7df646bc", "arrow-down-on-square": "184d45695ab3aa52", "arrow-down-on-square-stack": "568bb772da0452cc", "arrow-down-right": "5ddc83fe20ae492d", "arrow-down-tray": "9cf490f968375b96", "arrow-left": "b23bd74741f543a1", "arrow-left-circle": "3f07081954629686", "arrow-left-end-on-rectangle": "4a68f2717994487e", "arrow-left-start-on-rectangle": "d822a60cc0a12e4f", "arrow-long-down": "7f610766975e343f", "arrow-long-left": "57333cddfcd6a1f0", "arrow-long-right": "a0bbfdf2387a0303", "arrow-long-up": "4c49a06a96de907b", "arrow-path": "a46c61d11fe69954", "arrow-path-rounded-square": "0514d09731a0dd2b", "arrow-right": "901a176ae7780d9a", "arrow-right-circle": "a67f4d9dcd6c3ce5", "arrow-right-end-on-rectangle": "e04a18b2d9c7da67", "arrow-right-start-on-rectangle": "4bc9699e79306b3e", "arrow-top-right-on-square": "8990d55f925cde7d", "arrow-trending-down": "471164ac957cc097", "arrow-trending-up": "bd0b033181ff2c03", "arrow-turn-down-left": "1f9b0ece0d35df10", "arrow-turn-down-right": "e9aa6637f4fa0ad9", "arrow-turn-left-down": "40da519a22299630", "arrow-turn-left-up": "02de94994ac6c8fc", "arrow-turn-right-down": "810168fa3c9143ac", "arrow-turn-right-up": "f4dce02337835c5c", "arrow-turn-up-left": "296cadd71b8c90a3", "arrow-turn-up-right": "506d8f4d3a772a99", "arrow-up": "bddc896994731148", "arrow-up-circle": "15a37b02c8685c89", "arrow-up-left": "bbffecfc8fad2200", "arrow-up-on-square": "d1ce8dfa734e42ba", "arrow-up-on-square-stack": "e41d4441a81832ab", "arrow-up-right": "83d870840212379c", "arrow-up-tray": "6ebe303fad2d8eb9", "arrow-uturn-down": "9f300ab46d6953bd", "arrow-uturn-left": "1b894ab01d53b33c", "arrow-uturn-right": "b81b8aba46f99fd4", "arrow-uturn-up": "1e17abfc21666912", "arrows-pointing-in": "429c824846b9aed7", "arrows-pointing-out": "78121fb2f14c2ce0", "arrows-right-left": "5608ca754089fa58", "arrows-up-down": "d55a84751ed90ae5", "at-symbol": "c2b423fe69f49469", "backspace": "cd8cd1453bf7916d", "backward": "3a07ea697df94a56", "banknotes": "6d6e89a39e8e1340", "bars-2": "c48f2740fb514081", "bars-3": "fd014ea1960f3c93", "bars-3-bottom-left": "00abf36b5337079a", "bars-3-bottom-right": "97d05ce382a5ec9e", "bars-3-center-left": "b53804777f93b93b", "bars-4": "0de4a9331bd3f574", "bars-arrow-down": "c7f156448ec8d843", "bars-arrow-up": "a199e63bafe07294", "battery-0": "b86ebb4766b9b6f6", "battery-100": "462309b82a29323c", "battery-50": "3957c0078524bcb3", "beaker": "e899da0384b417e1", "bell": "04644ae321cad9ca", "bell-alert": "a3ea07dcf3f94507", "bell-slash": "94118683f59ef546", "bell-snooze": "5c48a705a786c52a", "bold": "7a3edd680a937772", "bolt": "d655f2cd218e678a", "bolt-slash": "4b6126819d912cce", "book-open": "96f45e95df5d6576", "bookmark": "8a7b053c324aa7ab", "bookmark-slash": "3bd60e2650015dee", "bookmark-square": "90f2edf1cc872b00", "briefcase": "10b847112b3c2296", "bug-ant": "3901b540dc249600", "building-library": "157ea57c008cd10f", "building-office": "f7d9e452fd1755eb", "building-office-2": "6c1cd64289859597", "building-storefront": "e56591b8fce5b652", "cake": "29085f935f50129d", "calculator": "beaee15eed756476", "calendar": "0789df4ed3be1be1", "calendar-date-range": "9f940a5dc4bf45b2", "calendar-days": "255e8d93acaac726", "camera": "8037e0fc5e6dd083", "chart-bar": "862ae82ed642674f", "chart-bar-square": "a8332dc3d027964e", "chart-pie": "fb34ef09db5be9e5", "chat-bubble-bottom-center": "94349590b51a76ca", "chat-bubble-bottom-center-text": "4a6b30d924edc3ee", "chat-bubble-left": "f8c4489e9385e4f2", "chat-bubble-left-ellipsis": "fe2118b529ba830f", "chat-bubble-left-right": "4445672a5970155b", "chat-bubble-oval-left": "60ec8000b37bde9d", "chat-bubble-oval-left-ellipsis": "18423d95343afbb1", "check": "18dad5fc82404af7", "check-badge": "da33681cdaad0139", "check-circle": "3da510313041748a", "chevron-double-down": "72f47a60e27db7cc", "chevron-double-left": "61c1299cc462c5a2", "chevron-double-right": "b107ca5c733c12d7", "chevron-double-up": "e715849a1c2c5add", "chevron-down": "8d9f3efe78645f64", "chevron-left": "702b557b43576e9d", "chevron-right": "8b3c53fe6caa71c0", "chevron-up": "e48d048f74f5ecfb", "chevron-up-down": "60d8d0e1ad7f9a83", "circle-stack": "0f5114f927d7950e", "clipboard": "ae9ee5f91b259ddd", "clipboard-document": "ca1b6986b8988fc7", "clipboard-document-check": "d62f4dd38810df37", "clipboard-document-list": "0dbcda3c121fc6b4", "clock": "72d48f9830af40b9", "cloud": "836c1ae131ed0bba", "cloud-arrow-down": "72b3a1750bd267ff", "cloud-arrow-up": "4909252eca13f2b1", "code-bracket": "cb7db5637eec5eea", "code-bracket-square": "8d40d3d5763f8996", "cog": "a26a1b90c6bd4ab8", "cog-6-tooth": "f271eeaf2a239712", "cog-8-tooth": "3f06661205740168", "command-line": "31b88d446c834094", "computer-desktop": "edb92deeaa26983d", "cpu-chip": "36300527f0157792", "credit-card": "16bdd910b4031df9", "cube": "6ec53a59a8f06ab7", "cube-transparent": "effae46402e4795c", "currency-bangladeshi": "0bc1f8fd21b4afbe", "currency-dollar": "05dba6037c6d15c4", "currency-euro": "dbbcbd842fb97a65", "currency-pound": "ae8ae10a0993e96a", "currency-rupee": "3cbfe0736dbee13f", "currency-yen": "9f26da901061a823", "cursor-arrow-rays": "2b33b22d9c298aca", "cursor-arrow-ripple": "765120006a3d96dc", "device-phone-mobile": "5b695be8af0a4662", "device-tablet": "22b5f770d3954738", "divide": "e7f36d5fb0831eef", "document": "ca857918b18ce930", "document-arrow-down": "3d5904a1f0329c3a", "document-arrow-up": "743d8e726ee998e8", "document-chart-bar": "fc5dfd8748a7fbd9", "document-check": "102be650832ac116", "document-currency-bangladeshi": "878fb3bb92abc224", "document-currency-dollar": "cb6a077891196f24", "document-currency-euro": "51370d765242db04", "document-currency-pound": "2ee1955900f4cc46", "document-currency-rupee": "55980af78efcd2b0", "document-currency-yen": "fb8b920db7348dfd", "document-duplicate": "53a97d1cef764e04", "document-magnifying-glass": "57c73c7e34edf52f", "document-minus": "2cfb172e3814810e", "document-plus": "2fc7f358515dfb3a", "document-text": "597f242e167e7470", "ellipsis-horizontal": "06fd098125353cfe", "ellipsis-horizontal-circle": "e1a6dbc79dee7a4b", "ellipsis-vertical": "e8e3e048466cde72", "envelope": "06927da2235345dc", "envelope-open": "e34571ab0cd2034a", "equals": "ff70239b33fe2d37", "exclamation-circle": "60e31bf8f6c04f71", "exclamation-triangle": "1fcb223b9d564578", "eye": "e42b5a81dcb95325", "eye-dropper": "ec9500dbc6406ad6", "eye-slash": "28513b27d1b3d7b1", "face-frown": "1a7bd2db7f20e80d", "face-smile": "48e49bdbf4649c5b", "film": "a6109338f69cbbda", "finger-print": "94ad266cf6635b02", "fire": "d46a75a1d40fd95b", "flag": "281054a869b1a87a", "folder": "c550d42608c8f499", "folder-arrow-down": "2a137f3874d92a06", "folder-minus": "0665380326abe2de", "folder-open": "dfe7e25b9773fe8b", "folder-plus": "cd2667ce6b332166", "forward": "9867b47c0381f381", "funnel": "e13cff9a4e6aee9c", "gif": "087b55dda645359d", "gift": "c8f354f73d7b00e9", "gift-top": "cc5b2c5bf4a825ef", "globe-alt": "a28168be37ae514d", "globe-americas": "f7186cc9e566e799", "globe-asia-australia": "ebe3fa2b3ba909e2", "globe-europe-africa": "c911d977a898a0d4", "h1": "fc3f60b3c1ef43ec", "h2": "76c5ecd5715a42f4", "h3": "d57c9f6d0f802198", "hand-raised": "e57db9d463ab73fc", "hand-thumb-down": "f338dd5f7bf8cd47", "hand-thumb-up": "ffe56aa98d5c1f5c", "hashtag": "04b979b2009ba77c", "heart": "201fbb90af6d0aa6", "home": "81f531f64468d2df", "home-modern": "4f7877b14d060b60", "identification": "e8f9f73e90633135", "inbox": "9aac713e57759563", "inbox-arrow-down": "e07976b3c84a6fa8", "inbox-stack": "b73d72e0633b1160", "information-circle": "43163667dd039760", "italic": "a0fdbd281953413a", "key": "1a705db7b062b106", "language": "496a0fafdb957306", "lifebuoy": "593d58734b3ac77c", "light-bulb": "69e7ff811d6257db", "link": "a530b2bde9daef08", "link-slash": "45537eac6fc1b0cd", "list-bullet": "7bee48a7db3cff25", "lock-closed": "629f45e632701c3a", "lock-open": "ed0dc2fb5fbdcfc6", "magnifying-glass": "14f236a456777a26", "magnifying-glass-circle": "d619a4bc1dcab8e0", "magnifying-glass-minus": "dc2fc7bda8f10b9b", "magnifying-glass-plus": "e48de2cce751c940", "map": "b1b05d4dfa14c8bc", "map-pin": "b1852044cd7fe728", "megaphone": "59faa6f86757c411", "microphone": "ef14c82814013198", "minus": "69fa6ea14ca63655", "minus-circle": "b9b97355eb5ac8e3", "moon": "83bee016e5047913", "musical-note": "e0ee2a18b26e1c2a", "newspaper": "3a2aa28fc6540084", "no-symbol": "bf15f2f832ece55e", "numbered-list": "d5492195648c9d06", "paint-brush": "f81953cb4ad69f93", "paper-airplane": "8e3beda1e43359c4", "paper-clip": "8ac2404c29fe9da0", "pause": "52466a1f77dd628a", "pause-circle": "f572ecaf1f397e12", "pencil": "dc8bdb26818ed441", "pencil-square": "d0fcaf5fd16e6f5b", "percent-badge": "8f50e19e2f1bad4d", "phone": "510051fcdbee78bd", "phone-arrow-down-left": "4d01f26b4afa0be3", "phone-arrow-up-right": "4ebf600255f6bdf9", "phone-x-mark": "9db0a8c97a51c3d5", "photo": "c0fd79dfef8e01be", "play": "27eed3223371d64f", "play-circle": "31b530c61bf01252", "play-pause": "88d022164c19fda3", "plus": "54941974c8a0e8e9", "plus-circle": "44f093b9a6890ddd", "power": "4f397001a59ad81e", "presentation-chart-bar": "9c47b857353e3a66", "presentation-chart-line": "803d2adc5a438179", "printer": "45585faf97404993", "puzzle-piece": "c644f94b26700523", "qr-code": "97e5d5db32ee62f6", "question-mark-circle": "2a767f6cdfdf570e", "queue-list": "def6cd8f8650d21f", "radio": "e8f69cd1e1071e40", "receipt-percent": "c7f3707793678989", "receipt-refund": "616c7ac79f02ace3", "rectangle-group": "b778dd50e4d064e5", "rectangle-stack": "a0c9d6d410b5f0e4", "rocket-launch": "149383006370cd68", "rss": "811cd6d4e9c27ec4", "scale": "d713c674526c5f06", "scissors": "5e094900ef906962", "server": "5285248462f907ab", "server-stack": "3f9adcc5cba17e79", "share": "47862874be5a3049", "shield-check": "233bbbd1c9a4a5c2", "shield-exclamation": "8bf08811f9d17678", "shopping-bag": "d0b76fa4424dd608", "shopping-cart": "6e5d2e746b10fcbf", "signal": "9b78fff494371f3c", "signal-slash": "f33cbbe7a7d262ea", "slash": "b57a669f333c8541", "sparkles": "1e057d8033fcb636", "speaker-wave": "9ba64f9a9d91d86e", "speaker-x-mark": "692f34aaa1c94af2", "square-2-stack": "53b35dbafe3864bb", "square-3-stack-3d": "73abd7b3518fa4db", "squares-2x2": "0576adef514951f1", "squares-plus": "4459ab1bf93d84c9", "star": "9172e6baba28f24d", "stop": "49670be8160ff5b0", "stop-circle": "205be38f072f4fae", "strikethrough": "0fc8e84b6a85c50e", "sun": "1738a14d5a0e76fd", "swatch": "a28e3ae0e3fe3e75", "table-cells": "cdd8eeda66cfbd2c", "tag": "3ee6a77165173efd", "ticket": "bfd497f550dfab25", "trash": "cc2840687ff84006", "trophy": "3ec93295fed36398", "truck": "cf362470c83b32e8", "tv": "72296b9172e7a7f9", "underline": "9fa856276f63730f", "user": "ebe1f056c6848ee0", "user-circle": "771a6a08bcceb531", "user-group": "62a3661f42d0b9ad", "user-minus": "c4c868d75228cda9", "user-plus": "f12ffa825bd737da", "users": "0ff390c2eeabd95c", "variable": "794be7353f42d47d", "video-camera": "88612024541dc809", "video-camera-slash": "cb014305a9fd162e", "view-columns": "7a04dac7bff4dd57", "viewfinder-circle": "c5e1c1ee2b7f5d7e", "wallet": "e08cbb8fcc3f3ee2", "wifi": "aef6553ed99acf29", "window": "545851ee3ffaf924", "wrench": "e34a5cb3e36fcc0e", "wrench-screwdriver": "70f73810545e5a54", "x-circle": "e8ff5a588ab2d7ea", "x-mark": "f33564fa353aa5f7"}
@@ -0,0 +1,88 @@
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+from django import forms
+from django.urls import reverse
+
+from djc_heroicons.icons import ICONS, VariantName
+from djc_heroicons.views import PICKER_PAGE_SIZE, get_icon_picker_page
+
+
+def get_icon_choices(variant: VariantName = "outline") -> List[Tuple[str, str]]:
+    """All icon names of the `variant` as form choices, in the format `[(name, name), ...]`."""
+    if variant not in ICONS:
+        raise ValueError(f"Invalid variant: {variant}. Must be either 'outline' or 'solid'")
+    return [(name, name) for name in ICONS[variant].keys()]
+
+
+class IconPickerWidget(forms.Widget):
+    """
+    Form widget for picking an icon.
+
+    Renders a text input for the icon name, and a grid with previews of the icons.
+
+    Only the first page of previews is rendered into the HTML. Further pages are fetched
+    from the `djc_heroicons:icon_picker` endpoint as the user scrolls. For this, add
+    `djc_heroicons.urls` to your URL config:
+
+    ```python
+    urlpatterns = [
+        path("heroicons/", include("djc_heroicons.urls")),
+    ]
+    ```
+    """
+
+    template_name = "djc_heroicons/widgets/icon_picker.html"
+
+    class Media:
+        css = {"all": ["djc_heroicons/icon_picker.css"]}
+        js = ["djc_heroicons/icon_picker.js"]
+
+    def __init__(
+        self,
+        attrs: Optional[Dict[str, Any]] = None,
+        variant: VariantName = "outline",
+        page_size: int = PICKER_PAGE_SIZE,
+        url: Optional[str] = None,
+    ) -> None:
+        super().__init__(attrs)
+        self.variant = variant
+        self.page_size = page_size
+        self.url = url
+
+    def get_context(self, name: str, value: Any, attrs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        context = super().get_context(name, value, attrs)
+
+        first_page = get_icon_picker_page(self.variant, 1, page_size=self.page_size)
+        context["widget"].update(
+            {
+                "variant": self.variant,
+                "url": self.url if self.url is not None else reverse("djc_heroicons:icon_picker"),
+                "icons": first_page["icons"],
+                "next_page": first_page["next_page"],
+            }
+        )
+        return context
+
+
+class IconChoiceField(forms.ChoiceField):
+    """
+    Form field for choosing an icon. The value is validated against the available icon names.
+
+    By default uses the `IconPickerWidget` to display the previews of the `variant` icons.
+    If `variant` is not given, it's taken from the `IconPickerWidget` widget, or defaults to `"outline"`.
+    """
+
+    widget = IconPickerWidget
+
+    def __init__(self, *, variant: Optional[VariantName] = None, **kwargs: Any) -> None:
+        widget = kwargs.get("widget")
+        if variant is None:
+            variant = widget.variant if isinstance(widget, IconPickerWidget) else "outline"
+
+        kwargs.setdefault("choices", partial(get_icon_choices, variant))
+        super().__init__(**kwargs)
+        self.variant = variant
+
+        if isinstance(self.widget, IconPickerWidget):
+            self.widget.variant = variant
@@ -0,0 +1,33 @@
+"""
+Stable integer IDs of the icons, used by `IconField` to store icons in the database.
+
+The IDs are generated together with the icons (see `scripts/gen_icon_ids.py`), and never change.
+"""
+
+from typing import Dict, Tuple
+
+from djc_heroicons.icon_ids_data import ICON_IDS, ICON_IDS_VERSION
+from djc_heroicons.icons import IconName, VariantName
+
+_ICON_IDS_BY_ICON: Dict[Tuple[str, str], int] = {icon: icon_id for icon_id, icon in ICON_IDS.items()}
+
+
+def get_icon_id(name: IconName, variant: VariantName = "outline") -> int:
+    """Get the ID of an icon. Raises `ValueError` if the icon has no ID."""
+    try:
+        return _ICON_IDS_BY_ICON[(variant, name)]
+    except KeyError:
+        raise ValueError(f"Invalid icon: {variant}:{name}") from None
+
+
+def get_icon_by_id(icon_id: int) -> Tuple[VariantName, IconName]:
+    """Get the `(variant, name)` of the icon with the given ID. Raises `ValueError` if there is no such ID."""
+    try:
+        return ICON_IDS[icon_id]  # type: ignore[return-value]
+    except KeyError:
+        raise ValueError(f"Invalid icon ID: {icon_id}") from None
+
+
+def get_icon_ids_version() -> int:
+    """Get the version of the ID table. It's incremented each time new icons get their IDs."""
+    return ICON_IDS_VERSION
@@ -0,0 +1,648 @@
+# fmt: off
+'''
+Stable integer IDs of the icons, as `ID: (variant, name)`.
+Generated by `scripts/gen_icon_ids.py`, DO NOT EDIT.
+
+This table is append-only. IDs are stored in databases by `IconField`, so they must never change.
+
+Use the functions in `djc_heroicons.icon_ids` to access these.
+'''
+
+from typing import Dict, Tuple
+
+ICON_IDS_VERSION = 1
+
+ICON_IDS: Dict[int, Tuple[str, str]] = {
+    1: ("outline", "academic-cap"),
+    2: ("outline", "adjustments-horizontal"),
+    3: ("outline", "adjustments-vertical"),
+    4: ("outline", "archive-box"),
+    5: ("outline", "archive-box-arrow-down"),
+    6: ("outline", "archive-box-x-mark"),
+    7: ("outline", "arrow-down"),
+    8: ("outline", "arrow-down-circle"),
+    9: ("outline", "arrow-down-left"),
+    10: ("outline", "arrow-down-on-square"),
+    11: ("outline", "arrow-down-on-square-stack"),
+    12: ("outline", "arrow-down-right"),
+    13: ("outline", "arrow-down-tray"),
+    14: ("outline", "arrow-left"),
+    15: ("outline", "arrow-left-circle"),
+    16: ("outline", "arrow-left-end-on-rectangle"),
+    17: ("outline", "arrow-left-start-on-rectangle"),
+    18: ("outline", "arrow-long-down"),
+    19: ("outline", "arrow-long-left"),
+    20: ("outline", "arrow-long-right"),
+    21: ("outline", "arrow-long-up"),
+    22: ("outline", "arrow-path"),
+    23: ("outline", "arrow-path-rounded-square"),
+    24: ("outline", "arrow-right"),
+    25: ("outline", "arrow-right-circle"),
+    26: ("outline", "arrow-right-end-on-rectangle"),
+    27: ("outline", "arrow-right-start-on-rectangle"),
+    28: ("outline", "arrow-top-right-on-square"),
+    29: ("outline", "arrow-trending-down"),
+    30: ("outline", "arrow-trending-up"),
+    31: ("outline", "arrow-turn-down-left"),
+    32: ("outline", "arrow-turn-down-right"),
+    33: ("outline", "arrow-turn-left-down"),
+    34: ("outline", "arrow-turn-left-up"),
+    35: ("outline", "arrow-turn-right-down"),
+    36: ("outline", "arrow-turn-right-up"),
+    37: ("outline", "arrow-turn-up-left"),
+    38: ("outline", "arrow-turn-up-right"),
+    39: ("outline", "arrow-up"),
+    40: ("outline", "arrow-up-circle"),
+    41: ("outline", "arrow-up-left"),
+    42: ("outline", "arrow-up-on-square"),
+    43: ("outline", "arrow-up-on-square-stack"),
+    44: ("outline", "arrow-up-right"),
+    45: ("outline", "arrow-up-tray"),
+    46: ("outline", "arrow-uturn-down"),
+    47: ("outline", "arrow-uturn-left"),
+    48: ("outline", "arrow-uturn-right"),
+    49: ("outline", "arrow-uturn-up"),
+    50: ("outline", "arrows-pointing-in"),
+    51: ("outline", "arrows-pointing-out"),
+    52: ("outline", "arrows-right-left"),
+    53: ("outline", "arrows-up-down"),
+    54: ("outline", "at-symbol"),
+    55: ("outline", "backspace"),
+    56: ("outline", "backward"),
+    57: ("outline", "banknotes"),
+    58: ("outline", "bars-2"),
+    59: ("outline", "bars-3"),
+    60: ("outline", "bars-3-bottom-left"),
+    61: ("outline", "bars-3-bottom-right"),
+    62: ("outline", "bars-3-center-left"),
+    63: ("outline", "bars-4"),
+    64: ("outline", "bars-arrow-down"),
+    65: ("outline", "bars-arrow-up"),
+    66: ("outline", "battery-0"),
+    67: ("outline", "battery-100"),
+    68: ("outline", "battery-50"),
+    69: ("outline", "beaker"),
+    70: ("outline", "bell"),
+    71: ("outline", "bell-alert"),
+    72: ("outline", "bell-slash"),
+    73: ("outline", "bell-snooze"),
+    74: ("outline", "bold"),
+    75: ("outline", "bolt"),
+    76: ("outline", "bolt-slash"),
+    77: ("outline", "book-open"),
+    78: ("outline", "bookmark"),
+    79: ("outline", "bookmark-slash"),
+    80: ("outline", "bookmark-square"),
+    81: ("outline", "briefcase"),
+    82: ("outline", "bug-ant"),
+    83: ("outline", "building-library"),
+    84: ("outline", "building-office"),
+    85: ("outline", "building-office-2"),
+    86: ("outline", "building-storefront"),
+    87: ("outline", "cake"),
+    88: ("outline", "calculator"),
+    89: ("outline", "calendar"),
+    90: ("outline", "calendar-date-range"),
+    91: ("outline", "calendar-days"),
+    92: ("outline", "camera"),
+    93: ("outline", "chart-bar"),
+    94: ("outline", "chart-bar-square"),
+    95: ("outline", "chart-pie"),
+    96: ("outline", "chat-bubble-bottom-center"),
+    97: ("outline", "chat-bubble-bottom-center-text"),
+    98: ("outline", "chat-bubble-left"),
+    99: ("outline", "chat-bubble-left-ellipsis"),
+    100: ("outline", "chat-bubble-left-right"),
+    101: ("outline", "chat-bubble-oval-left"),
+    102: ("outline", "chat-bubble-oval-left-ellipsis"),
+    103: ("outline", "check"),
+    104: ("outline", "check-badge"),
+    105: ("outline", "check-circle"),
+    106: ("outline", "chevron-double-down"),
+    107: ("outline", "chevron-double-left"),
+    108: ("outline", "chevron-double-right"),
+    109: ("outline", "chevron-double-up"),
+    110: ("outline", "chevron-down"),
+    111: ("outline", "chevron-left"),
+    112: ("outline", "chevron-right"),
+    113: ("outline", "chevron-up"),
+    114: ("outline", "chevron-up-down"),
+    115: ("outline", "circle-stack"),
+    116: ("outline", "clipboard"),
+    117: ("outline", "clipboard-document"),
+    118: ("outline", "clipboard-document-check"),
+    119: ("outline", "clipboard-document-list"),
+    120: ("outline", "clock"),
+    121: ("outline", "cloud"),
+    122: ("outline", "cloud-arrow-down"),
+    123: ("outline", "cloud-arrow-up"),
+    124: ("outline", "code-bracket"),
+    125: ("outline", "code-bracket-square"),
+    126: ("outline", "cog"),
+    127: ("outline", "cog-6-tooth"),
+    128: ("outline", "cog-8-tooth"),
+    129: ("outline", "command-line"),
+    130: ("outline", "computer-desktop"),
+    131: ("outline", "cpu-chip"),
+    132: ("outline", "credit-card"),
+    133: ("outline", "cube"),
+    134: ("outline", "cube-transparent"),
+    135: ("outline", "currency-bangladeshi"),
+    136: ("outline", "currency-dollar"),
+    137: ("outline", "currency-euro"),
+    138: ("outline", "currency-pound"),
+    139: ("outline", "currency-rupee"),
+    140: ("outline", "currency-yen"),
+    141: ("outline", "cursor-arrow-rays"),
+    142: ("outline", "cursor-arrow-ripple"),
+    143: ("outline", "device-phone-mobile"),
+    144: ("outline", "device-tablet"),
+    145: ("outline", "divide"),
+    146: ("outline", "document"),
+    147: ("outline", "document-arrow-down"),
+    148: ("outline", "document-arrow-up"),
+    149: ("outline", "document-chart-bar"),
+    150: ("outline", "document-check"),
+    151: ("outline", "document-currency-bangladeshi"),
+    152: ("outline", "document-currency-dollar"),
+    153: ("outline", "document-currency-euro"),
+    154: ("outline", "document-currency-pound"),
+    155: ("outline", "document-currency-rupee"),
+    156: ("outline", "document-currency-yen"),
+    157: ("outline", "document-duplicate"),
+    158: ("outline", "document-magnifying-glass"),
+    159: ("outline", "document-minus"),
+    160: ("outline", "document-plus"),
+    161: ("outline", "document-text"),
+    162: ("outline", "ellipsis-horizontal"),
+    163: ("outline", "ellipsis-horizontal-circle"),
+    164: ("outline", "ellipsis-vertical"),
+    165: ("outline", "envelope"),
+    166: ("outline", "envelope-open"),
+    167: ("outline", "equals"),
+    168: ("outline", "exclamation-circle"),
+    169: ("outline", "exclamation-triangle"),
+    170: ("outline", "eye"),
+    171: ("outline", "eye-dropper"),
+    172: ("outline", "eye-slash"),
+    173: ("outline", "face-frown"),
+    174: ("outline", "face-smile"),
+    175: ("outline", "film"),
+    176: ("outline", "finger-print"),
+    177: ("outline", "fire"),
+    178: ("outline", "flag"),
+    179: ("outline", "folder"),
+    180: ("outline", "folder-arrow-down"),
+    181: ("outline", "folder-minus"),
+    182: ("outline", "folder-open"),
+    183: ("outline", "folder-plus"),
+    184: ("outline", "forward"),
+    185: ("outline", "funnel"),
+    186: ("outline", "gif"),
+    187: ("outline", "gift"),
+    188: ("outline", "gift-top"),
+    189: ("outline", "globe-alt"),
+    190: ("outline", "globe-americas"),
+    191: ("outline", "globe-asia-australia"),
+    192: ("outline", "globe-europe-africa"),
+    193: ("outline", "h1"),
+    194: ("outline", "h2"),
+    195: ("outline", "h3"),
+    196: ("outline", "hand-raised"),
+    197: ("outline", "hand-thumb-down"),
+    198: ("outline", "hand-thumb-up"),
+    199: ("outline", "hashtag"),
+    200: ("outline", "heart"),
+    201: ("outline", "home"),
+    202: ("outline", "home-modern"),
+    203: ("outline", "identification"),
+    204: ("outline", "inbox"),
+    205: ("outline", "inbox-arrow-down"),
+    206: ("outline", "inbox-stack"),
+    207: ("outline", "information-circle"),
+    208: ("outline", "italic"),
+    209: ("outline", "key"),
+    210: ("outline", "language"),
+    211: ("outline", "lifebuoy"),
+    212: ("outline", "light-bulb"),
+    213: ("outline", "link"),
+    214: ("outline", "link-slash"),
+    215: ("outline", "list-bullet"),
+    216: ("outline", "lock-closed"),
+    217: ("outline", "lock-open"),
+    218: ("outline", "magnifying-glass"),
+    219: ("outline", "magnifying-glass-circle"),
+    220: ("outline", "magnifying-glass-minus"),
+    221: ("outline", "magnifying-glass-plus"),
+    222: ("outline", "map"),
+    223: ("outline", "map-pin"),
+    224: ("outline", "megaphone"),
+    225: ("outline", "microphone"),
+    226: ("outline", "minus"),
+    227: ("outline", "minus-circle"),
+    228: ("outline", "moon"),
+    229: ("outline", "musical-note"),
+    230: ("outline", "newspaper"),
+    231: ("outline", "no-symbol"),
+    232: ("outline", "numbered-list"),
+    233: ("outline", "paint-brush"),
+    234: ("outline", "paper-airplane"),
+    235: ("outline", "paper-clip"),
+    236: ("outline", "pause"),
+    237: ("outline", "pause-circle"),
+    238: ("outline", "pencil"),
+    239: ("outline", "pencil-square"),
+    240: ("outline", "percent-badge"),
+    241: ("outline", "phone"),
+    242: ("outline", "phone-arrow-down-left"),
+    243: ("outline", "phone-arrow-up-right"),
+    244: ("outline", "phone-x-mark"),
+    245: ("outline", "photo"),
+    246: ("outline", "play"),
+    247: ("outline", "play-circle"),
+    248: ("outline", "play-pause"),
+    249: ("outline", "plus"),
+    250: ("outline", "plus-circle"),
+    251: ("outline", "power"),
+    252: ("outline", "presentation-chart-bar"),
+    253: ("outline", "presentation-chart-line"),
+    254: ("outline", "printer"),
+    255: ("outline", "puzzle-piece"),
+    256: ("outline", "qr-code"),
+    257: ("outline", "question-mark-circle"),
+    258: ("outline", "queue-list"),
+    259: ("outline", "radio"),
+    260: ("outline", "receipt-percent"),
+    261: ("outline", "receipt-refund"),
+    262: ("outline", "rectangle-group"),
+    263: ("outline", "rectangle-stack"),
+    264: ("outline", "rocket-launch"),
+    265: ("outline", "rss"),
+    266: ("outline", "scale"),
+    267: ("outline", "scissors"),
+    268: ("outline", "server"),
+    269: ("outline", "server-stack"),
+    270: ("outline", "share"),
+    271: ("outline", "shield-check"),
+    272: ("outline", "shield-exclamation"),
+    273: ("outline", "shopping-bag"),
+    274: ("outline", "shopping-cart"),
+    275: ("outline", "signal"),
+    276: ("outline", "signal-slash"),
+    277: ("outline", "slash"),
+    278: ("outline", "sparkles"),
+    279: ("outline", "speaker-wave"),
+    280: ("outline", "speaker-x-mark"),
+    281: ("outline", "square-2-stack"),
+    282: ("outline", "square-3-stack-3d"),
+    283: ("outline", "squares-2x2"),
+    284: ("outline", "squares-plus"),
+    285: ("outline", "star"),
+    286: ("outline", "stop"),
+    287: ("outline", "stop-circle"),
+    288: ("outline", "strikethrough"),
+    289: ("outline", "sun"),
+    290: ("outline", "swatch"),
+    291: ("outline", "table-cells"),
+    292: ("outline", "tag"),
+    293: ("outline", "ticket"),
+    294: ("outline", "trash"),
+    295: ("outline", "trophy"),
+    296: ("outline", "truck"),
+    297: ("outline", "tv"),
+    298: ("outline", "underline"),
+    299: ("outline", "user"),
+    300: ("outline", "user-circle"),
+    301: ("outline", "user-group"),
+    302: ("outline", "user-minus"),
+    303: ("outline", "user-plus"),
+    304: ("outline", "users"),
+    305: ("outline", "variable"),
+    306: ("outline", "video-camera"),
+    307: ("outline", "video-camera-slash"),
+    308: ("outline", "view-columns"),
+    309: ("outline", "viewfinder-circle"),
+    310: ("outline", "wallet"),
+    311: ("outline", "wifi"),
+    312: ("outline", "window"),
+    313: ("outline", "wrench"),
+    314: ("outline", "wrench-screwdriver"),
+    315: ("outline", "x-circle"),
+    316: ("outline", "x-mark"),
+    317: ("solid", "academic-cap"),
+    318: ("solid", "adjustments-horizontal"),
+    319: ("solid", "adjustments-vertical"),
+    320: ("solid", "archive-box"),
+    321: ("solid", "archive-box-arrow-down"),
+    322: ("solid", "archive-box-x-mark"),
+    323: ("solid", "arrow-down"),
+    324: ("solid", "arrow-down-circle"),
+    325: ("solid", "arrow-down-left"),
+    326: ("solid", "arrow-down-on-square"),
+    327: ("solid", "arrow-down-on-square-stack"),
+    328: ("solid", "arrow-down-right"),
+    329: ("solid", "arrow-down-tray"),
+    330: ("solid", "arrow-left"),
+    331: ("solid", "arrow-left-circle"),
+    332: ("solid", "arrow-left-end-on-rectangle"),
+    333: ("solid", "arrow-left-start-on-rectangle"),
+    334: ("solid", "arrow-long-down"),
+    335: ("solid", "arrow-long-left"),
+    336: ("solid", "arrow-long-right"),
+    337: ("solid", "arrow-long-up"),
+    338: ("solid", "arrow-path"),
+    339: ("solid", "arrow-path-rounded-square"),
+    340: ("solid", "arrow-right"),
+    341: ("solid", "arrow-right-circle"),
+    342: ("solid", "arrow-right-end-on-rectangle"),
+    343: ("solid", "arrow-right-start-on-rectangle"),
+    344: ("solid", "arrow-top-right-on-square"),
+    345: ("solid", "arrow-trending-down"),
+    346: ("solid", "arrow-trending-up"),
+    347: ("solid", "arrow-turn-down-left"),
+    348: ("solid", "arrow-turn-down-right"),
+    349: ("solid", "arrow-turn-left-down"),
+    350: ("solid", "arrow-turn-left-up"),
+    351: ("solid", "arrow-turn-right-down"),
+    352: ("solid", "arrow-turn-right-up"),
+    353: ("solid", "arrow-turn-up-left"),
+    354: ("solid", "arrow-turn-up-right"),
+    355: ("solid", "arrow-up"),
+    356: ("solid", "arrow-up-circle"),
+    357: ("solid", "arrow-up-left"),
+    358: ("solid", "arrow-up-on-square"),
+    359: ("solid", "arrow-up-on-square-stack"),
+    360: ("solid", "arrow-up-right"),
+    361: ("solid", "arrow-up-tray"),
+    362: ("solid", "arrow-uturn-down"),
+    363: ("solid", "arrow-uturn-left"),
+    364: ("solid", "arrow-uturn-right"),
+    365: ("solid", "arrow-uturn-up"),
+    366: ("solid", "arrows-pointing-in"),
+    367: ("solid", "arrows-pointing-out"),
+    368: ("solid", "arrows-right-left"),
+    369: ("solid", "arrows-up-down"),
+    370: ("solid", "at-symbol"),
+    371: ("solid", "backspace"),
+    372: ("solid", "backward"),
+    373: ("solid", "banknotes"),
+    374: ("solid", "bars-2"),
+    375: ("solid", "bars-3"),
+    376: ("solid", "bars-3-bottom-left"),
+    377: ("solid", "bars-3-bottom-right"),
+    378: ("solid", "bars-3-center-left"),
+    379: ("solid", "bars-4"),
+    380: ("solid", "bars-arrow-down"),
+    381: ("solid", "bars-arrow-up"),
+    382: ("solid", "battery-0"),
+    383: ("solid", "battery-100"),
+    384: ("solid", "battery-50"),
+    385: ("solid", "beaker"),
+    386: ("solid", "bell"),
+    387: ("solid", "bell-alert"),
+    388: ("solid", "bell-slash"),
+    389: ("solid", "bell-snooze"),
+    390: ("solid", "bold"),
+    391: ("solid", "bolt"),
+    392: ("solid", "bolt-slash"),
+    393: ("solid", "book-open"),
+    394: ("solid", "bookmark"),
+    395: ("solid", "bookmark-slash"),
+    396: ("solid", "bookmark-square"),
+    397: ("solid", "briefcase"),
+    398: ("solid", "bug-ant"),
+    399: ("solid", "building-library"),
+    400: ("solid", "building-office"),
+    401: ("solid", "building-office-2"),
+    402: ("solid", "building-storefront"),
+    403: ("solid", "cake"),
+    404: ("solid", "calculator"),
+    405: ("solid", "calendar"),
+    406: ("solid", "calendar-date-range"),
+    407: ("solid", "calendar-days"),
+    408: ("solid", "camera"),
+    409: ("solid", "chart-bar"),
+    410: ("solid", "chart-bar-square"),
+    411: ("solid", "chart-pie"),
+    412: ("solid", "chat-bubble-bottom-center"),
+    413: ("solid", "chat-bubble-bottom-center-text"),
+    414: ("solid", "chat-bubble-left"),
+    415: ("solid", "chat-bubble-left-ellipsis"),
+    416: ("solid", "chat-bubble-left-right"),
+    417: ("solid", "chat-bubble-oval-left"),
+    418: ("solid", "chat-bubble-oval-left-ellipsis"),
+    419: ("solid", "check"),
+    420: ("solid", "check-badge"),
+    421: ("solid", "check-circle"),
+    422: ("solid", "chevron-double-down"),
+    423: ("solid", "chevron-double-left"),
+    424: ("solid", "chevron-double-right"),
+    425: ("solid", "chevron-double-up"),
+    426: ("solid", "chevron-down"),
+    427: ("solid", "chevron-left"),
+    428: ("solid", "chevron-right"),
+    429: ("solid", "chevron-up"),
+    430: ("solid", "chevron-up-down"),
+    431: ("solid", "circle-stack"),
+    432: ("solid", "clipboard"),
+    433: ("solid", "clipboard-document"),
+    434: ("solid", "clipboard-document-check"),
+    435: ("solid", "clipboard-document-list"),
+    436: ("solid", "clock"),
+    437: ("solid", "cloud"),
+    438: ("solid", "cloud-arrow-down"),
+    439: ("solid", "cloud-arrow-up"),
+    440: ("solid", "code-bracket"),
+    441: ("solid", "code-bracket-square"),
+    442: ("solid", "cog"),
+    443: ("solid", "cog-6-tooth"),
+    444: ("solid", "cog-8-tooth"),
+    445: ("solid", "command-line"),
+    446: ("solid", "computer-desktop"),
+    447: ("solid", "cpu-chip"),
+    448: ("solid", "credit-card"),
+    449: ("solid", "cube"),
+    450: ("solid", "cube-transparent"),
+    451: ("solid", "currency-bangladeshi"),
+    452: ("solid", "currency-dollar"),
+    453: ("solid", "currency-euro"),
+    454: ("solid", "currency-pound"),
+    455: ("solid", "currency-rupee"),
+    456: ("solid", "currency-yen"),
+    457: ("solid", "cursor-arrow-rays"),
+    458: ("solid", "cursor-arrow-ripple"),
+    459: ("solid", "device-phone-mobile"),
+    460: ("solid", "device-tablet"),
+    461: ("solid", "divide"),
+    462: ("solid", "document"),
+    463: ("solid", "document-arrow-down"),
+    464: ("solid", "document-arrow-up"),
+    465: ("solid", "document-chart-bar"),
+    466: ("solid", "document-check"),
+    467: ("solid", "document-currency-bangladeshi"),
+    468: ("solid", "document-currency-dollar"),
+    469: ("solid", "document-currency-euro"),
+    470: ("solid", "document-currency-pound"),
+    471: ("solid", "document-currency-rupee"),
+    472: ("solid", "document-currency-yen"),
+    473: ("solid", "document-duplicate"),
+    474: ("solid", "document-magnifying-glass"),
+    475: ("solid", "document-minus"),
+    476: ("solid", "document-plus"),
+    477: ("solid", "document-text"),
+    478: ("solid", "ellipsis-horizontal"),
+    479: ("solid", "ellipsis-horizontal-circle"),
+    480: ("solid", "ellipsis-vertical"),
+    481: ("solid", "envelope"),
+    482: ("solid", "envelope-open"),
+    483: ("solid", "equals"),
+    484: ("solid", "exclamation-circle"),
+    485: ("solid", "exclamation-triangle"),
+    486: ("solid", "eye"),
+    487: ("solid", "eye-dropper"),
+    488: ("solid", "eye-slash"),
+    489: ("solid", "face-frown"),
+    490: ("solid", "face-smile"),
+    491: ("solid", "film"),
+    492: ("solid", "finger-print"),
+    493: ("solid", "fire"),
+    494: ("solid", "flag"),
+    495: ("solid", "folder"),
+    496: ("solid", "folder-arrow-down"),
+    497: ("solid", "folder-minus"),
+    498: ("solid", "folder-open"),
+    499: ("solid", "folder-plus"),
+    500: ("solid", "forward"),
+    501: ("solid", "funnel"),
+    502: ("solid", "gif"),
+    503: ("solid", "gift"),
+    504: ("solid", "gift-top"),
+    505: ("solid", "globe-alt"),
+    506: ("solid", "globe-americas"),
+    507: ("solid", "globe-asia-australia"),
+    508: ("solid", "globe-europe-africa"),
+    509: ("solid", "h1"),
+    510: ("solid", "h2"),
+    511: ("solid", "h3"),
+    512: ("solid", "hand-raised"),
+    513: ("solid", "hand-thumb-down"),
+    514: ("solid", "hand-thumb-up"),
+    515: ("solid", "hashtag"),
+    516: ("solid", "heart"),
+    517: ("solid", "home"),
+    518: ("solid", "home-modern"),
+    519: ("solid", "identification"),
+    520: ("solid", "inbox"),
+    521: ("solid", "inbox-arrow-down"),
+    522: ("solid", "inbox-stack"),
+    523: ("solid", "information-circle"),
+    524: ("solid", "italic"),
+    525: ("solid", "key"),
+    526: ("solid", "language"),
+    527: ("solid", "lifebuoy"),
+    528: ("solid", "light-bulb"),
+    529: ("solid", "link"),
+    530: ("solid", "link-slash"),
+    531: ("solid", "list-bullet"),
+    532: ("solid", "lock-closed"),
+    533: ("solid", "lock-open"),
+    534: ("solid", "magnifying-glass"),
+    535: ("solid", "magnifying-glass-circle"),
+    536: ("solid", "magnifying-glass-minus"),
+    537: ("solid", "magnifying-glass-plus"),
+    538: ("solid", "map"),
+    539: ("solid", "map-pin"),
+    540: ("solid", "megaphone"),
+    541: ("solid", "microphone"),
+    542: ("solid", "minus"),
+    543: ("solid", "minus-circle"),
+    544: ("solid", "moon"),
+    545: ("solid", "musical-note"),
+    546: ("solid", "newspaper"),
+    547: ("solid", "no-symbol"),
+    548: ("solid", "numbered-list"),
+    549: ("solid", "paint-brush"),
+    550: ("solid", "paper-airplane"),
+    551: ("solid", "paper-clip"),
+    552: ("solid", "pause"),
+    553: ("solid", "pause-circle"),
+    554: ("solid", "pencil"),
+    555: ("solid", "pencil-square"),
+    556: ("solid", "percent-badge"),
+    557: ("solid", "phone"),
+    558: ("solid", "phone-arrow-down-left"),
+    559: ("solid", "phone-arrow-up-right"),
+    560: ("solid", "phone-x-mark"),
+    561: ("solid", "photo"),
+    562: ("solid", "play"),
+    563: ("solid", "play-circle"),
+    564: ("solid", "play-pause"),
+    565: ("solid", "plus"),
+    566: ("solid", "plus-circle"),
+    567: ("solid", "power"),
+    568: ("solid", "presentation-chart-bar"),
+    569: ("solid", "presentation-chart-line"),
+    570: ("solid", "printer"),
+    571: ("solid", "puzzle-piece"),
+    572: ("solid", "qr-code"),
+    573: ("solid", "question-mark-circle"),
+    574: ("solid", "queue-list"),
+    575: ("solid", "radio"),
+    576: ("solid", "receipt-percent"),
+    577: ("solid", "receipt-refund"),
+    578: ("solid", "rectangle-group"),
+    579: ("solid", "rectangle-stack"),
+    580: ("solid", "rocket-launch"),
+    581: ("solid", "rss"),
+    582: ("solid", "scale"),
+    583: ("solid", "scissors"),
+    584: ("solid", "server"),
+    585: ("solid", "server-stack"),
+    586: ("solid", "share"),
+    587: ("solid", "shield-check"),
+    588: ("solid", "shield-exclamation"),
+    589: ("solid", "shopping-bag"),
+    590: ("solid", "shopping-cart"),
+    591: ("solid", "signal"),
+    592: ("solid", "signal-slash"),
+    593: ("solid", "slash"),
+    594: ("solid", "sparkles"),
+    595: ("solid", "speaker-wave"),
+    596: ("solid", "speaker-x-mark"),
+    597: ("solid", "square-2-stack"),
+    598: ("solid", "square-3-stack-3d"),
+    599: ("solid", "squares-2x2"),
+    600: ("solid", "squares-plus"),
+    601: ("solid", "star"),
+    602: ("solid", "stop"),
+    603: ("solid", "stop-circle"),
+    604: ("solid", "strikethrough"),
+    605: ("solid", "sun"),
+    606: ("solid", "swatch"),
+    607: ("solid", "table-cells"),
+    608: ("solid", "tag"),
+    609: ("solid", "ticket"),
+    610: ("solid", "trash"),
+    611: ("solid", "trophy"),
+    612: ("solid", "truck"),
+    613: ("solid", "tv"),
+    614: ("solid", "underline"),
+    615: ("solid", "user"),
+    616: ("solid", "user-circle"),
+    617: ("solid", "user-group"),
+    618: ("solid", "user-minus"),
+    619: ("solid", "user-plus"),
+    620: ("solid", "users"),
+    621: ("solid", "variable"),
+    622: ("solid", "video-camera"),
+    623: ("solid", "video-camera-slash"),
+    624: ("solid", "view-columns"),
+    625: ("solid", "viewfinder-circle"),
+    626: ("solid", "wallet"),
+    627: ("solid", "wifi"),
+    628: ("solid", "window"),
+    629: ("solid", "wrench"),
+    630: ("solid", "wrench-screwdriver"),
+    631: ("solid", "x-circle"),
+    632: ("solid", "x-mark"),
+}
@@ -0,0 +1,64 @@
+"""
+Icons in templates rendered with [Jinja2](https://jinja.palletsprojects.com/), e.g. with Django's
+`Jinja2` template backend.
+
+Add the extension to the Jinja2 environment:
+
+```python
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.jinja2.Jinja2",
+        "OPTIONS": {
+            "extensions": ["djc_heroicons.jinja2.HeroIconsExtension"],
+        },
+        ...
+    },
+]
+```
+
+And then render icons with the `heroicon()` global:
+
+```jinja
+{{ heroicon("academic-cap", variant="solid", size=20, class_="p-4") }}
+```
+"""
+
+from typing import Any, Dict, Optional
+
+from jinja2 import Environment
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+from djc_heroicons.icons import IconName, VariantName
+from djc_heroicons.render import DEFAULT_COLOR, DEFAULT_SIZE, DEFAULT_STROKE_WIDTH, kwargs_to_attrs, render_icon_svg
+
+
+def heroicon(
+    name: IconName,
+    variant: VariantName = "outline",
+    size: int = DEFAULT_SIZE,
+    color: str = DEFAULT_COLOR,
+    stroke_width: float = DEFAULT_STROKE_WIDTH,
+    viewbox: str = "0 0 24 24",
+    attrs: Optional[Dict] = None,
+    deferred: bool = False,
+    **extra_attrs: Any,
+) -> Markup:
+    """
+    Render an icon in a Jinja2 template. Renders the same markup as the `Icon` component,
+    with the same validation, and shares its caches.
+
+    Accepts the same inputs as the `Icon` component. Other keyword arguments are set as HTML attributes
+    on the `<svg>` element, same as with `render_icon()`.
+    """
+    if extra_attrs:
+        attrs = {**(attrs or {}), **kwargs_to_attrs(extra_attrs)}
+    return Markup(render_icon_svg(name, variant, size, color, stroke_width, viewbox, attrs, deferred))
+
+
+class HeroIconsExtension(Extension):
+    """Jinja2 extension that adds the `heroicon()` global."""
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        environment.globals["heroicon"] = heroicon
@@ -0,0 +1,218 @@
+"""
+Template loader that folds `{% component "icon" %}` tags with literal inputs, when the template is compiled.
+
+Icons are usually rendered with only literal inputs, e.g. `{% component "icon" name="check" size=16 / %}`.
+With static markup (the `static_markup` setting, or `static=True`), such an icon renders the same markup
+every time, so `Loader` replaces the tag with `FoldedIconComponentNode`, which renders the icon once,
+and then reuses the markup. The loader caches the compiled templates same as Django's cached template loader,
+so the folded tags are kept for the lifetime of the process.
+
+Tags of icon presets are folded too. Tags with variables, filters, `...` spreads, or slot fills
+are rendered as usual.
+"""
+
+import ast
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+from django.template import Context, Node, NodeList, Template
+from django.template.base import TextNode
+from django.template.defaulttags import IfNode
+from django.template.loaders import cached
+from django.utils.safestring import SafeString
+from django_components import ComponentNode, NotRegistered
+
+from djc_heroicons import render
+from djc_heroicons.app_settings import HeroIconsSettings, app_settings
+from djc_heroicons.components.icon import Icon
+from djc_heroicons.signals import icon_rendered
+
+_LITERAL_KINDS = ("string", "int", "float")
+_LITERAL_NAMES = {"True": True, "False": False, "None": None}
+
+
+class FoldedIconComponentNode(Node):
+    """
+    `{% component "icon" %}` tag with only literal inputs. The icon is rendered on the first render,
+    and the markup is then reused, same as with the folded `{% icon %}` tags.
+
+    The tag is rendered by the component as usual when the static markup is not in effect,
+    or when the component is replaced in the registry. The icon is rendered again when the settings
+    change, or when the renders are traced or recorded.
+    """
+
+    def __init__(self, node: ComponentNode, component_cls: Type[Icon], kwargs: Icon.Kwargs) -> None:
+        self.node = node
+        self.component_cls = component_cls
+        self.kwargs = kwargs
+        self.token = node.token
+        self.origin = node.origin
+        # NOTE: Settings and markup are replaced together, so other threads never see a mismatched pair
+        self._folded: Optional[Tuple[HeroIconsSettings, SafeString]] = None
+
+    def render(self, context: Context) -> str:
+        static = self.kwargs.static
+        if static is None:
+            static = app_settings.STATIC_MARKUP
+        try:
+            component_cls = self.node.registry.get(self.node.name)
+        except NotRegistered:
+            component_cls = None
+        if not static or component_cls is not self.component_cls:
+            return self.node.render(context)
+
+        start = time.perf_counter()
+        snapshot = app_settings._settings
+        folded = self._folded
+        if folded is None or folded[0] is not snapshot or snapshot.tracer is not None or render._record_usage:
+            svg = self.component_cls._render_svg(self.kwargs)
+            self._folded = (snapshot, svg)
+        else:
+            svg = folded[1]
+            rendered_icons = render._rendered_icons.get()
+            if rendered_icons is not None:
+                rendered_icons.append(svg)
+
+        sender = self.component_cls
+        if icon_rendered.has_listeners(sender):
+            render_time = time.perf_counter() - start
+            icon_rendered.send(
+                sender=sender,
+                kwargs=self.kwargs._asdict(),
+                data_time=render_time,
+                render_time=render_time,
+                html=svg,
+            )
+        return svg
+
+
+def fold_icon_components(nodelist: NodeList) -> None:
+    """
+    Replace the `{% component "icon" %}` tags (and the tags of icon presets) with literal inputs
+    in the `nodelist` with `FoldedIconComponentNode`. Nested tags, e.g. in `{% if %}` or `{% block %}`,
+    are replaced too.
+    """
+    for index, node in enumerate(nodelist):
+        if isinstance(node, ComponentNode):
+            folded = _fold_icon_component(node)
+            if folded is not None:
+                nodelist[index] = folded
+                continue
+
+        for child_nodelist in _get_child_nodelists(node):
+            fold_icon_components(child_nodelist)
+
+
+def _get_child_nodelists(node: Node) -> Iterator[NodeList]:
+    if isinstance(node, IfNode):
+        for _, child_nodelist in node.conditions_nodelists:
+            yield child_nodelist
+        return
+
+    for attr in node.child_nodelists:
+        child_nodelist = getattr(node, attr, None)
+        if child_nodelist:
+            yield child_nodelist
+
+
+def _fold_icon_component(node: ComponentNode) -> Optional[FoldedIconComponentNode]:
+    try:
+        component_cls = node.registry.get(node.name)
+    except NotRegistered:
+        return None
+    if not isinstance(component_cls, type) or not issubclass(component_cls, Icon):
+        return None
+
+    # Icons don't have slots, so there's nothing to fill
+    if any(not isinstance(child, TextNode) or child.s.strip() for child in node.nodelist or []):
+        return None
+
+    inputs = _get_literal_inputs(node)
+    if inputs is None:
+        return None
+
+    defaults_cls = component_cls.Defaults
+    defaults = {key: getattr(defaults_cls, key) for key in Icon.Kwargs._fields if hasattr(defaults_cls, key)}
+    try:
+        kwargs = component_cls.Kwargs(**{**defaults, **inputs})
+    except TypeError:
+        # E.g. unknown or missing inputs. Left to the component, which raises a helpful error.
+        return None
+    # Without static markup, each render has its own `data-djc-id-...` attribute
+    if kwargs.static is False:
+        return None
+
+    return FoldedIconComponentNode(node, component_cls, kwargs)
+
+
+def _get_literal_inputs(node: ComponentNode) -> Optional[Dict[str, Any]]:
+    """Get the inputs of the tag, or `None` if the tag has other inputs than literals."""
+    inputs: Dict[str, Any] = {}
+    try:
+        for param in node.params:
+            value = param.value
+            if param.is_flag or param.key is None or value.spread or value.filters:
+                return None
+
+            content = value.value.content
+            kind = str(value.kind)
+            if kind == "variable" and content in _LITERAL_NAMES:
+                literal = _LITERAL_NAMES[content]
+            elif kind in _LITERAL_KINDS and "\\" not in content:
+                literal = ast.literal_eval(content)
+            else:
+                return None
+
+            # E.g. `attrs:class="p-4"` is the same as `attrs={"class": "p-4"}`
+            key, _, attr = param.key.content.partition(":")
+            if attr:
+                attrs = inputs.setdefault(key, {})
+                if not isinstance(attrs, dict) or attr in attrs:
+                    return None
+                attrs[attr] = literal
+            elif key in inputs:
+                return None
+            else:
+                inputs[key] = literal
+    except (AttributeError, ValueError, SyntaxError):
+        # Inputs that are parsed differently by other versions of django-components are not folded
+        return None
+    return inputs
+
+
+class Loader(cached.Loader):
+    """
+    Cached template loader that folds `{% component "icon" %}` tags with literal inputs,
+    see `fold_icon_components()`. Use it instead of `django.template.loaders.cached.Loader`:
+
+    **Example:**
+
+    ```python
+    TEMPLATES = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "OPTIONS": {
+                "loaders": [
+                    (
+                        "djc_heroicons.loaders.Loader",
+                        [
+                            "django.template.loaders.filesystem.Loader",
+                            "django.template.loaders.app_directories.Loader",
+                            "django_components.template_loader.Loader",
+                        ],
+                    ),
+                ],
+            },
+        },
+    ]
+    ```
+    """
+
+    def get_template(self, template_name: str, skip: Optional[list] = None) -> Template:
+        template = super().get_template(template_name, skip)
+        # NOTE: The cached templates are folded only once. Templates folded at the same time by
+        #       two threads end up with equal nodes, so that's harmless.
+        if not getattr(template, "_heroicons_folded", False):
+            fold_icon_components(template.nodelist)
+            template._heroicons_folded = True  # type: ignore[attr-defined]
+        return template
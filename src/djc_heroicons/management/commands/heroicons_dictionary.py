@@ -0,0 +1,50 @@
+import hashlib
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.dictionary import CompressionDictionary, build_raw_dictionary, get_dictionary_samples
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the shared compression dictionary from the markup of all icons, as rendered with the current settings. "
+        "Set the `compression_dictionary` setting to the path of the file to use the dictionary."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--output",
+            help="Path of the dictionary file. Defaults to the `compression_dictionary` setting.",
+        )
+        parser.add_argument(
+            "--size",
+            type=int,
+            help=(
+                "Train a zstd dictionary of at most this many bytes, instead of using the markup of all icons "
+                "as the dictionary. Requires zstandard to be installed."
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = options["output"] or app_settings.COMPRESSION_DICTIONARY
+        if not path:
+            raise CommandError("No output file given. Use --output or set the `compression_dictionary` setting.")
+
+        start = time.perf_counter()
+        if options["size"] is not None:
+            # NOTE: Imported here, so zstandard is needed only to train dictionaries
+            from djc_heroicons.compression import train_dictionary
+
+            data = train_dictionary(options["size"], get_dictionary_samples())
+        else:
+            data = build_raw_dictionary()
+        elapsed = time.perf_counter() - start
+
+        with open(path, "wb") as file:
+            file.write(data)
+
+        dictionary = CompressionDictionary(data=data, digest=hashlib.sha256(data).digest())
+        self.stdout.write(f"Wrote {len(data)} bytes to {path} in {elapsed * 1000:.1f}ms (hash {dictionary.hash})")
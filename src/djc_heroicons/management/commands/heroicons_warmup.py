@@ -0,0 +1,52 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.warmup import load_profile, warmup, warmup_all
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the most used icons from the warmup profile, or all icons with --all, and report how long it took. "
+        "If the `cache` setting is set, this also stores the icons in the shared cache."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--profile",
+            help="Path to the profile file. Defaults to the `warmup_profile` setting.",
+        )
+        parser.add_argument(
+            "--count",
+            type=int,
+            help="Number of the most used icons to render. Defaults to the `warmup_count` setting.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Render all icons with the default size, color and stroke width, instead of using the profile.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["all"]:
+            start = time.perf_counter()
+            rendered = warmup_all()
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f"Rendered {len(rendered)} icons in {elapsed * 1000:.1f}ms")
+            return
+
+        path = options["profile"] or app_settings.WARMUP_PROFILE
+        if not path:
+            raise CommandError("No profile file given. Use --profile or set the `warmup_profile` setting.")
+        count = options["count"] if options["count"] is not None else app_settings.WARMUP_COUNT
+
+        total = len(load_profile(path))
+        start = time.perf_counter()
+        rendered = warmup(path, count)
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            f"Rendered {len(rendered)} of {total} icons from {path} in {elapsed * 1000:.1f}ms",
+        )
@@ -0,0 +1,127 @@
+import gzip
+import logging
+from typing import Callable, List, NamedTuple
+
+from django.http import HttpRequest, HttpResponse
+
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.render import _rendered_icons
+
+logger = logging.getLogger("djc_heroicons")
+
+
+class IconBudgetReport(NamedTuple):
+    icon_count: int
+    """Number of icons in the response."""
+    icon_bytes: int
+    """Bytes taken by the icons."""
+    response_bytes: int
+    """Size of the whole response."""
+    gzip_icon_bytes: int
+    """Estimate of the bytes taken by the icons after the response is compressed with gzip."""
+    gzip_response_bytes: int
+    """Size of the whole response compressed with gzip."""
+
+    @property
+    def share(self) -> float:
+        return self.icon_bytes / self.response_bytes if self.response_bytes else 0
+
+    @property
+    def gzip_share(self) -> float:
+        return self.gzip_icon_bytes / self.gzip_response_bytes if self.gzip_response_bytes else 0
+
+
+def measure_icon_bytes(content: bytes, icons: List[str]) -> IconBudgetReport:
+    """
+    Measure how many bytes of the response `content` are taken by the rendered `icons`.
+
+    The gzip size of the icons is estimated as the difference between the compressed sizes
+    of the response with and without the icons.
+    """
+    count = 0
+    icon_bytes = 0
+    content_without_icons = content
+    # NOTE: Longest icons first, so that an icon isn't removed from inside another icon's markup
+    for svg in sorted({svg.encode("utf-8") for svg in icons if svg}, key=len, reverse=True):
+        occurrences = content_without_icons.count(svg)
+        if occurrences:
+            count += occurrences
+            icon_bytes += occurrences * len(svg)
+            content_without_icons = content_without_icons.replace(svg, b"")
+
+    gzip_response_bytes = len(gzip.compress(content))
+    gzip_icon_bytes = gzip_response_bytes - len(gzip.compress(content_without_icons)) if count else 0
+
+    return IconBudgetReport(
+        icon_count=count,
+        icon_bytes=icon_bytes,
+        response_bytes=len(content),
+        gzip_icon_bytes=max(gzip_icon_bytes, 0),
+        gzip_response_bytes=gzip_response_bytes,
+    )
+
+
+class IconBudgetMiddleware:
+    """
+    Measure the share of HTML response bytes taken by icons, and warn when it exceeds
+    the `byte_budget` setting.
+
+    Each HTML response with icons gets a `Server-Timing` header with the number of icons
+    and their share of the response, raw and after gzip compression, e.g.:
+
+    ```
+    Server-Timing: heroicons;desc="12 icons, 8204 B, 23.4% raw, 6.1% gzip"
+    ```
+
+    Measuring compresses each HTML response twice, so use this in development, CI or staging.
+
+    **Example:**
+
+    ```python
+    MIDDLEWARE = [
+        "django.middleware.gzip.GZipMiddleware",
+        "djc_heroicons.middleware.IconBudgetMiddleware",
+        ...
+    ]
+    ```
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        icons: List[str] = []
+        token = _rendered_icons.set(icons)
+        try:
+            response = self.get_response(request)
+        finally:
+            _rendered_icons.reset(token)
+
+        if (
+            not icons
+            or getattr(response, "streaming", False)
+            or response.has_header("Content-Encoding")
+            or not response.get("Content-Type", "").startswith("text/html")
+        ):
+            return response
+
+        report = measure_icon_bytes(response.content, icons)
+        if not report.icon_count:
+            return response
+
+        server_timing = (
+            f'heroicons;desc="{report.icon_count} icons, {report.icon_bytes} B, '
+            f'{report.share:.1%} raw, {report.gzip_share:.1%} gzip"'
+        )
+        if response.has_header("Server-Timing"):
+            server_timing = f"{response['Server-Timing']}, {server_timing}"
+        response["Server-Timing"] = server_timing
+
+        budget = app_settings.BYTE_BUDGET
+        if report.share > budget:
+            logger.warning(
+                f"Icons take {report.share:.1%} of the response to {request.path} "
+                f"({report.icon_count} icons, {report.icon_bytes} of {report.response_bytes} bytes, "
+                f"{report.gzip_share:.1%} after gzip), over the budget of {budget:.1%}"
+            )
+        return response
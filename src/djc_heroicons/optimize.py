@@ -0,0 +1,104 @@
+"""
+Optimization pass over the SVG paths in `ICONS` that reduces the number of DOM nodes per icon,
+while keeping the rendered icon visually identical:
+
+1. Consecutive `<path>` elements of the `"outline"` icons that have the same attributes
+   are merged into a single `<path>` by concatenating their `d` data.
+
+   This is done only for the `"outline"` variant, because the outline icons are only stroked.
+   For the `"solid"` icons the paths are filled, and merging them could change which areas
+   are filled where the paths overlap.
+
+2. Inherited presentation attributes that have the same value on all paths
+   (e.g. `stroke-linecap="round"`) are hoisted from the `<path>` elements to the `<svg>` element.
+
+NOTE: The merged paths are identical as long as the stroke is opaque, which is the default.
+If you set e.g. `stroke-opacity` on the icon, the overlaps of the merged paths will be blended
+only once instead of once per path.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+from djc_heroicons.icons import ICONS, IconName, VariantName
+
+# Presentation attributes that are inherited by the `<path>` elements when set on the `<svg>` element.
+HOISTABLE_ATTRS = ("stroke-linecap", "stroke-linejoin", "fill-rule", "clip-rule")
+
+_PATH_TOKEN_RE = re.compile(r"[A-Za-z]|[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+
+class OptimizedIcon(NamedTuple):
+    svg_attrs: Dict[str, str]
+    """Attributes hoisted from the paths, to be set on the `<svg>` element."""
+    paths: List[Dict[str, str]]
+    """Remaining paths, each as a dictionary of `<path>` attributes."""
+
+
+def _to_absolute_start(path_data: str) -> Optional[str]:
+    """
+    Prepare path data so it can be appended to another path.
+
+    A path must start with a "moveto" command. A relative `m` at the start of a path is treated
+    as absolute, but once appended to another path it would become relative to the previous point.
+    So we make it an absolute `M`. Returns `None` if the path data can't be safely converted.
+    """
+    path_data = path_data.strip()
+    if path_data.startswith("M"):
+        return path_data
+    if not path_data.startswith("m"):
+        return None
+
+    # Coordinate pairs after the first pair of `m` are relative "lineto" commands,
+    # which would become absolute if we changed `m` to `M`.
+    tokens = _PATH_TOKEN_RE.findall(path_data, 0, 200)
+    if len(tokens) < 4 or not tokens[3].isalpha():
+        return None
+    return "M" + path_data[1:]
+
+
+def _merge_paths(paths: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    merged: List[Dict[str, str]] = []
+    for path in paths:
+        if merged:
+            prev = merged[-1]
+            prev_attrs = {key: val for key, val in prev.items() if key != "d"}
+            curr_attrs = {key: val for key, val in path.items() if key != "d"}
+            path_data = _to_absolute_start(path.get("d", ""))
+            if prev_attrs == curr_attrs and path_data is not None and "d" in prev:
+                merged[-1] = {**prev, "d": prev["d"] + path_data}
+                continue
+        merged.append(dict(path))
+    return merged
+
+
+def _hoist_attrs(paths: List[Dict[str, str]]) -> OptimizedIcon:
+    svg_attrs: Dict[str, str] = {}
+    for attr in HOISTABLE_ATTRS:
+        values = {path.get(attr) for path in paths}
+        if len(values) == 1:
+            value = values.pop()
+            if value is not None:
+                svg_attrs[attr] = value
+
+    hoisted_paths = [{key: val for key, val in path.items() if key not in svg_attrs} for path in paths]
+    return OptimizedIcon(svg_attrs=svg_attrs, paths=hoisted_paths)
+
+
+def optimize_icon(variant: VariantName, paths: List[Dict[str, str]]) -> OptimizedIcon:
+    """Merge compatible paths and hoist shared attributes of a single icon."""
+    if variant == "outline":
+        paths = _merge_paths(paths)
+    return _hoist_attrs(paths)
+
+
+@lru_cache(maxsize=None)
+def get_optimized_icon(variant: VariantName, name: IconName) -> OptimizedIcon:
+    """
+    Get the optimized version of the icon from `ICONS`.
+
+    Icons are optimized the first time they are requested, and then cached.
+    The cache is safe to use from multiple threads, also without the GIL.
+    """
+    return optimize_icon(variant, ICONS[variant][name])
@@ -0,0 +1,101 @@
+"""
+Panel for [django-debug-toolbar](https://django-debug-toolbar.readthedocs.io/) that lists
+the icons rendered during the request.
+
+Add it to the `DEBUG_TOOLBAR_PANELS` setting:
+
+```python
+DEBUG_TOOLBAR_PANELS = [
+    ...
+    "djc_heroicons.panels.IconsPanel",
+]
+```
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Type
+
+from debug_toolbar.panels import Panel
+from django.http import HttpRequest, HttpResponse
+
+from djc_heroicons.signals import icon_rendered
+
+
+class IconsPanel(Panel):
+    """
+    Lists every icon rendered during the request, with its kwargs, time spent in
+    `Icon.get_template_data()` and in rendering the template, and the bytes it added to the response.
+    """
+
+    title = "Icons"
+    template = "djc_heroicons/debug_toolbar/icons_panel.html"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._records: List[Dict[str, Any]] = []
+        self._thread_id: Optional[int] = None
+
+    @property
+    def nav_subtitle(self) -> str:
+        stats = self.get_stats()
+        if not stats:
+            return ""
+        return f"{stats['count']} icons, {stats['total_time']:.2f}ms, {stats['total_bytes']} B"
+
+    def enable_instrumentation(self) -> None:
+        # The signal is global, so remember which thread handles this request
+        # to ignore icons rendered by other requests.
+        self._thread_id = threading.get_ident()
+        icon_rendered.connect(self._on_icon_rendered, dispatch_uid=f"djc_heroicons_panel_{id(self)}")
+
+    def disable_instrumentation(self) -> None:
+        icon_rendered.disconnect(dispatch_uid=f"djc_heroicons_panel_{id(self)}")
+
+    def _on_icon_rendered(
+        self,
+        sender: Type,
+        kwargs: Dict[str, Any],
+        data_time: float,
+        render_time: float,
+        html: str,
+        **extra: Any,
+    ) -> None:
+        if threading.get_ident() != self._thread_id:
+            return
+
+        self._records.append(
+            {
+                "kwargs": kwargs,
+                "data_time": data_time * 1000,
+                "render_time": render_time * 1000,
+                "bytes": len(html.encode("utf-8")),
+            }
+        )
+
+    def generate_stats(self, request: HttpRequest, response: HttpResponse) -> None:
+        icons = []
+        duplicates: Dict[str, int] = {}
+        for record in self._records:
+            key = ", ".join(f"{k}={v!r}" for k, v in record["kwargs"].items() if v is not None)
+            duplicates[key] = duplicates.get(key, 0) + 1
+            icons.append({**record, "kwargs": key})
+
+        response_bytes = len(response.content) if not response.streaming else 0
+        total_bytes = sum(icon["bytes"] for icon in icons)
+
+        self.record_stats(
+            {
+                "icons": icons,
+                "count": len(icons),
+                "duplicates": sorted(
+                    [(key, count) for key, count in duplicates.items() if count > 1],
+                    key=lambda item: -item[1],
+                ),
+                "total_data_time": sum(icon["data_time"] for icon in icons),
+                "total_render_time": sum(icon["render_time"] for icon in icons),
+                "total_time": sum(icon["data_time"] + icon["render_time"] for icon in icons),
+                "total_bytes": total_bytes,
+                "response_bytes": response_bytes,
+                "bytes_share": (total_bytes / response_bytes * 100) if response_bytes else 0,
+            }
+        )
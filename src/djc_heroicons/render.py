@@ -0,0 +1,522 @@
+"""
+Core of the icon rendering, shared by the `Icon` component and `render_icon()`.
+
+The markup of each icon's paths is rendered only once and cached. The `<svg>` element is then
+formatted for the given size, color, etc. Renders without custom attributes are cached as a whole.
+"""
+
+import difflib
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.utils.safestring import SafeString, mark_safe
+from django_components import format_attributes, merge_attributes
+
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.icons import ICONS, IconName, VariantName
+from djc_heroicons.optimize import get_optimized_icon
+from djc_heroicons.tracing import IconSpan, IconTracer, record_span
+
+# CSS custom properties that set the size, color and stroke width in the `css_variables` mode
+CSS_VAR_SIZE = "--heroicon-size"
+CSS_VAR_COLOR = "--heroicon-color"
+CSS_VAR_STROKE_WIDTH = "--heroicon-stroke-width"
+
+DEFAULT_SIZE = 24
+DEFAULT_COLOR = "currentColor"
+DEFAULT_STROKE_WIDTH = 1.5
+
+# NOTE: The whitespace matches the original template of the `Icon` component,
+#       so the markup stays the same.
+_PATH_TEMPLATE = "\n            \n                <path {attrs} />"
+_SVG_TEMPLATE = "<svg {attrs}>{paths}\n            \n        </svg>"
+
+# Attribute with the `variant:name` of deferred icons, whose paths are loaded by `deferred_icons.js`
+DEFERRED_ATTR = "data-heroicon"
+
+logger = logging.getLogger("djc_heroicons")
+
+# Error messages of invalid icons, keyed by `(variant, name)`. When the same invalid icon is requested
+# again, the message is taken from here, instead of searching for similar names again.
+# The oldest entries are removed once the cache is full.
+INVALID_ICONS_CACHE_SIZE = 1024
+_invalid_icons: Dict[Tuple[str, str], str] = {}
+_invalid_icons_lock = threading.Lock()
+
+# Called with `(variant, name, size, color, stroke_width, viewbox)` of each render while
+# the usage is recorded, see `djc_heroicons.warmup.start_recording()`
+_record_usage: Optional[Callable[[Tuple[str, str, int, str, float, str]], None]] = None
+
+# Collects the rendered icons while a request is measured by `IconBudgetMiddleware`
+_rendered_icons: ContextVar[Optional[List[str]]] = ContextVar("djc_heroicons_rendered_icons", default=None)
+
+
+class FrozenAttrs(Dict[str, Any]):
+    """
+    HTML attributes that are not changed after they are created, e.g. the `attrs` of icon presets.
+
+    Unlike with other custom attributes, renders with these attributes are cached. The values must be hashable.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # NOTE: Equal dicts may have different order of keys, so the hash must not depend on it
+        self._hash = hash(frozenset(self.items()))
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return self._hash
+
+
+def _as_frozen(attrs: Optional[Dict[str, Any]]) -> Optional[FrozenAttrs]:
+    # Use only for `attrs` that are empty or `FrozenAttrs`, which are passed to the cached renders
+    return attrs or None  # type: ignore[return-value]
+
+
+def _format_icon_error(name: str, variant: str) -> str:
+    if variant not in ["outline", "solid"]:
+        return f"Invalid variant: {variant}. Must be either 'outline' or 'solid'"
+
+    # Give users a helpful message by fuzzy-search the closest key
+    msg = ""
+    icon_names = list(ICONS[variant].keys())  # type: ignore[index]
+    if icon_names:
+        fuzzy_matches = difflib.get_close_matches(name, icon_names, n=3, cutoff=0.7)
+        if fuzzy_matches:
+            suggestions = ", ".join([f"'{match}'" for match in fuzzy_matches])
+            msg += f". Did you mean any of {suggestions}?"
+
+    return f"Invalid icon name: {name}{msg}"
+
+
+def get_icon_error(name: str, variant: str) -> Optional[str]:
+    """
+    Get the error message for an invalid icon name or variant, or `None` if the icon exists.
+
+    Each invalid icon is logged once, when it's first seen.
+    """
+    variant_icons = ICONS.get(variant)  # type: ignore[call-overload]
+    if variant_icons is not None and name in variant_icons:
+        return None
+
+    key = (variant, name)
+    error = _invalid_icons.get(key)
+    if error is not None:
+        return error
+
+    error = _format_icon_error(name, variant)
+    with _invalid_icons_lock:
+        if key not in _invalid_icons:
+            if len(_invalid_icons) >= INVALID_ICONS_CACHE_SIZE:
+                del _invalid_icons[next(iter(_invalid_icons))]
+            _invalid_icons[key] = error
+            logger.warning(error)
+    return error
+
+
+def validate_icon(name: str, variant: str) -> None:
+    """Raise `ValueError` if the icon name or variant is not valid."""
+    error = get_icon_error(name, variant)
+    if error is not None:
+        raise ValueError(error)
+
+
+def get_default_attrs(
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    css_variables: bool = False,
+) -> Dict[str, Any]:
+    """
+    Get the attributes of the `<svg>` element for given icon settings.
+
+    These are set as "default" attributes, so users can override them with custom attributes.
+
+    If `css_variables` is `True`, `size`, `color` and `stroke_width` are ignored, and are instead
+    taken from CSS custom properties. So the attributes are the same for all renders of the icon.
+    """
+    if css_variables:
+        return _get_css_variables_attrs(variant, viewbox)
+
+    default_attrs: Dict[str, Any] = {
+        "viewBox": viewbox,
+        "style": f"width: {size}px; height: {size}px",
+        "aria-hidden": "true",
+    }
+
+    # The SVG applies the color differently in "outline" and "solid" versions
+    if variant == "outline":
+        default_attrs["fill"] = "none"
+        default_attrs["stroke"] = color
+        default_attrs["stroke-width"] = stroke_width
+    else:
+        default_attrs["fill"] = color
+        default_attrs["stroke"] = "none"
+
+    return default_attrs
+
+
+def _get_css_variables_attrs(variant: VariantName, viewbox: str) -> Dict[str, Any]:
+    size = f"var({CSS_VAR_SIZE}, {DEFAULT_SIZE}px)"
+    color = f"var({CSS_VAR_COLOR}, {DEFAULT_COLOR})"
+    default_attrs: Dict[str, Any] = {
+        "viewBox": viewbox,
+        "aria-hidden": "true",
+    }
+
+    # Presentation attributes like `stroke="..."` can't use CSS variables, so the values are set as styles
+    if variant == "outline":
+        default_attrs["fill"] = "none"
+        style = f"stroke: {color}; stroke-width: var({CSS_VAR_STROKE_WIDTH}, {DEFAULT_STROKE_WIDTH})"
+    else:
+        default_attrs["stroke"] = "none"
+        style = f"fill: {color}"
+
+    default_attrs["style"] = f"width: {size}; height: {size}; {style}"
+    return default_attrs
+
+
+def icon_css_vars(
+    size: Optional[int] = None,
+    color: Optional[str] = None,
+    stroke_width: Optional[float] = None,
+) -> str:
+    """
+    Get the CSS custom properties that set the size, color and stroke width of icons rendered
+    in the `css_variables` mode. Use this in the `style` of an element that wraps the icons.
+
+    **Example:**
+
+    ```python
+    icon_css_vars(size=16, color="red")
+    # "--heroicon-size: 16px; --heroicon-color: red"
+    ```
+    """
+    css_vars = []
+    if size is not None:
+        css_vars.append(f"{CSS_VAR_SIZE}: {size}px")
+    if color is not None:
+        css_vars.append(f"{CSS_VAR_COLOR}: {color}")
+    if stroke_width is not None:
+        css_vars.append(f"{CSS_VAR_STROKE_WIDTH}: {stroke_width}")
+    return "; ".join(css_vars)
+
+
+@lru_cache(maxsize=None)
+def _get_icon_body(variant: VariantName, name: IconName, optimize: bool) -> Tuple[Dict[str, str], str]:
+    """Get the attributes hoisted to the `<svg>` element, and the rendered `<path>` elements of an icon."""
+    if optimize:
+        optimized_icon = get_optimized_icon(variant, name)
+        svg_attrs, icon_paths = optimized_icon.svg_attrs, optimized_icon.paths
+    else:
+        svg_attrs, icon_paths = {}, ICONS[variant][name]
+
+    paths = "".join(_PATH_TEMPLATE.format(attrs=format_attributes(path_attrs)) for path_attrs in icon_paths)
+    return svg_attrs, paths
+
+
+# NOTE: `typed=True` so that e.g. `size=24` and `size=24.0` are cached separately
+@lru_cache(maxsize=4096, typed=True)
+def _get_svg_attrs_html(
+    name: IconName,
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    optimize: bool,
+    css_variables: bool,
+) -> Dict[str, str]:
+    """
+    Get the default attributes of the `<svg>` element, already formatted as HTML, e.g.
+    `{"viewBox": 'viewBox="0 0 24 24"', ...}`.
+
+    The formatted `style` attribute is always last.
+    """
+    validate_icon(name, variant)
+
+    svg_attrs, _ = _get_icon_body(variant, name, optimize)
+    default_attrs = get_default_attrs(variant, size, color, stroke_width, viewbox, css_variables)
+    default_attrs.update(svg_attrs)
+    style = default_attrs.pop("style")
+
+    attrs_html = {key: format_attributes({key: value}) for key, value in default_attrs.items()}
+    attrs_html["style"] = format_attributes(merge_attributes({"style": style}))
+    return attrs_html
+
+
+def _format_attr_uncached(key: str, value: Any) -> str:
+    if key in ("class", "style"):
+        return format_attributes(merge_attributes({key: value}))
+    return format_attributes({key: value})
+
+
+_format_attr_cached = lru_cache(maxsize=4096, typed=True)(_format_attr_uncached)
+
+
+def _format_attr(key: str, value: Any) -> str:
+    """Format a single attribute as HTML. Attributes with plain string or number values are cached."""
+    if type(value) in (str, int, float):
+        return _format_attr_cached(key, value)
+    return _format_attr_uncached(key, value)
+
+
+def _format_svg_attrs(default_attrs_html: Dict[str, str], attrs: Dict[str, Any]) -> str:
+    """
+    Merge the default attributes with custom attributes, and format them as HTML.
+
+    This gives the same result as `{% html_attrs attrs default_attrs %}`, but only the custom attributes
+    need to be formatted. The custom attributes replace the defaults, `class` and `style` are placed last.
+    """
+    parts = []
+    for key, attr_html in default_attrs_html.items():
+        if key == "style":
+            continue
+        parts.append(_format_attr(key, attrs[key]) if key in attrs else attr_html)
+
+    for key, value in attrs.items():
+        if key not in default_attrs_html and key != "class":
+            parts.append(_format_attr(key, value))
+
+    if "class" in attrs:
+        parts.append(_format_attr("class", attrs["class"]))
+    if "style" in attrs:
+        parts.append(_format_attr("style", attrs["style"]))
+    else:
+        parts.append(default_attrs_html["style"])
+
+    return " ".join(part for part in parts if part)
+
+
+def _format_svg(
+    name: IconName,
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    attrs: Optional[Dict[str, Any]],
+    optimize: bool,
+    css_variables: bool,
+) -> SafeString:
+    default_attrs_html = _get_svg_attrs_html(
+        name, variant, size, color, stroke_width, viewbox, optimize, css_variables
+    )
+    if attrs:
+        attrs_html = _format_svg_attrs(default_attrs_html, attrs)
+    else:
+        attrs_html = " ".join(default_attrs_html.values())
+
+    _, paths = _get_icon_body(variant, name, optimize)
+    return mark_safe(_SVG_TEMPLATE.format(attrs=attrs_html, paths=paths))
+
+
+def _format_svg_shared(
+    name: IconName,
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    attrs: Optional[FrozenAttrs],
+    optimize: bool,
+    css_variables: bool,
+) -> SafeString:
+    """
+    Render the icon without custom attributes, or with `FrozenAttrs`. Icons without custom attributes
+    are shared through the cache from the `cache` setting, if set.
+    """
+    cache_alias = app_settings.CACHE
+    if cache_alias is None or attrs:
+        return _format_svg(name, variant, size, color, stroke_width, viewbox, attrs, optimize, css_variables)
+
+    # NOTE: Imported here to avoid circular imports. This runs only on misses of the in-process cache.
+    from djc_heroicons.cache import get_or_render, get_svg_cache_key
+
+    key = get_svg_cache_key(name, variant, size, color, stroke_width, viewbox, optimize, css_variables)
+    svg = get_or_render(
+        cache_alias,
+        key,
+        lambda: _format_svg(name, variant, size, color, stroke_width, viewbox, None, optimize, css_variables),
+    )
+    return mark_safe(svg)
+
+
+# Renders without custom attributes (or with `FrozenAttrs`) are fully determined by the arguments,
+# so they are cached.
+_format_svg_cached = lru_cache(maxsize=4096, typed=True)(_format_svg_shared)
+
+
+def _format_icon(
+    name: IconName,
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    attrs: Optional[Dict[str, Any]],
+    optimize: bool,
+    css_variables: bool,
+) -> SafeString:
+    if not attrs or type(attrs) is FrozenAttrs:
+        return _format_svg_cached(
+            name, variant, size, color, stroke_width, viewbox, _as_frozen(attrs), optimize, css_variables
+        )
+    return _format_svg(name, variant, size, color, stroke_width, viewbox, attrs, optimize, css_variables)
+
+
+def _format_icon_traced(
+    tracer: IconTracer,
+    name: IconName,
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    attrs: Optional[Dict[str, Any]],
+    optimize: bool,
+    css_variables: bool,
+) -> SafeString:
+    # The render is a cache hit if the markup (or with custom attributes, the default attributes)
+    # came from the cache. With concurrent renders, a hit may be attributed to a different render.
+    cached_func = _get_svg_attrs_html if attrs and type(attrs) is not FrozenAttrs else _format_svg_cached
+    hits = cached_func.cache_info().hits
+    start = time.perf_counter()
+
+    svg = _format_icon(name, variant, size, color, stroke_width, viewbox, attrs, optimize, css_variables)
+
+    duration = time.perf_counter() - start
+    cache_hit = cached_func.cache_info().hits > hits
+    record_span(tracer, IconSpan(name, variant, cache_hit, len(svg.encode("utf-8")), duration))
+    return svg
+
+
+def _format_placeholder(
+    name: IconName,
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    attrs: Optional[Dict[str, Any]],
+    optimize: bool,
+    css_variables: bool,
+) -> SafeString:
+    default_attrs_html = _get_svg_attrs_html(
+        name, variant, size, color, stroke_width, viewbox, optimize, css_variables
+    )
+    attrs_html = _format_svg_attrs(default_attrs_html, {**(attrs or {}), DEFERRED_ATTR: f"{variant}:{name}"})
+    return mark_safe(f"<svg {attrs_html}></svg>")
+
+
+_format_placeholder_cached = lru_cache(maxsize=4096, typed=True)(_format_placeholder)
+
+
+def render_icon_svg(
+    name: IconName,
+    variant: VariantName,
+    size: int,
+    color: str,
+    stroke_width: float,
+    viewbox: str,
+    attrs: Optional[Dict[str, Any]],
+    deferred: bool = False,
+) -> SafeString:
+    """
+    Render the icon's `<svg>` element. Attributes in `attrs` are used as they are.
+
+    If the icon doesn't exist, this raises `ValueError`, or renders the `fallback_icon` if set.
+
+    If `deferred` is `True`, the `<svg>` element is rendered without the paths, which are loaded
+    in the browser once the icon scrolls into view, see `djc_heroicons/deferred_icons.js`.
+    """
+    fallback_icon = app_settings.FALLBACK_ICON
+    if fallback_icon is not None and get_icon_error(name, variant) is not None:
+        if not fallback_icon:
+            return mark_safe("")
+        name = fallback_icon  # type: ignore[assignment]
+        variant = variant if variant in ICONS else "outline"
+
+    optimize = app_settings.OPTIMIZE
+    css_variables = app_settings.CSS_VARIABLES
+    if css_variables:
+        # Size, color and stroke width are set with CSS, so all renders of an icon share the same markup
+        size, color, stroke_width = DEFAULT_SIZE, DEFAULT_COLOR, DEFAULT_STROKE_WIDTH
+
+    if deferred:
+        # NOTE: The icon itself is rendered by the bundle endpoint, so only the placeholder is rendered here
+        if not attrs or type(attrs) is FrozenAttrs:
+            svg = _format_placeholder_cached(
+                name, variant, size, color, stroke_width, viewbox, _as_frozen(attrs), optimize, css_variables
+            )
+        else:
+            svg = _format_placeholder(
+                name, variant, size, color, stroke_width, viewbox, attrs, optimize, css_variables
+            )
+        rendered_icons = _rendered_icons.get()
+        if rendered_icons is not None:
+            rendered_icons.append(svg)
+        return svg
+
+    if _record_usage is not None:
+        _record_usage((variant, name, size, color, stroke_width, viewbox))
+
+    tracer = app_settings.TRACER
+    if tracer is None:
+        if not attrs or type(attrs) is FrozenAttrs:
+            svg = _format_svg_cached(
+                name, variant, size, color, stroke_width, viewbox, _as_frozen(attrs), optimize, css_variables
+            )
+        else:
+            svg = _format_svg(name, variant, size, color, stroke_width, viewbox, attrs, optimize, css_variables)
+    else:
+        svg = _format_icon_traced(
+            tracer, name, variant, size, color, stroke_width, viewbox, attrs, optimize, css_variables
+        )
+
+    rendered_icons = _rendered_icons.get()
+    if rendered_icons is not None:
+        rendered_icons.append(svg)
+    return svg
+
+
+def render_icon(
+    name: IconName,
+    variant: VariantName = "outline",
+    size: int = DEFAULT_SIZE,
+    color: str = DEFAULT_COLOR,
+    stroke_width: float = DEFAULT_STROKE_WIDTH,
+    viewbox: str = "0 0 24 24",
+    deferred: bool = False,
+    **attrs: Any,
+) -> SafeString:
+    """
+    Render an icon to an SVG string, without the need for a template or a `Context`.
+
+    Accepts the same inputs as the `Icon` component, and renders the same markup.
+    Extra keyword arguments are set as HTML attributes on the `<svg>` element.
+    Underscores in their names are converted to dashes, and a trailing underscore is removed,
+    so you can pass e.g. `class_` or `data_id`.
+
+    **Example:**
+
+    ```python
+    from djc_heroicons import render_icon
+
+    svg = render_icon("academic-cap", variant="solid", size=48, class_="p-4", data_id="123")
+    ```
+    """
+    return render_icon_svg(name, variant, size, color, stroke_width, viewbox, kwargs_to_attrs(attrs), deferred)
+
+
+def kwargs_to_attrs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert keyword arguments to HTML attributes, e.g. `{"class_": "x", "data_id": 1}`
+    to `{"class": "x", "data-id": 1}`.
+    """
+    return {key.rstrip("_").replace("_", "-"): value for key, value in kwargs.items()}
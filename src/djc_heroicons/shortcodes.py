@@ -0,0 +1,103 @@
+"""
+Shortcodes for inline icons in text, e.g. in articles or user-generated content.
+
+A shortcode is either `:variant:name:`, e.g. `:solid:check-circle:`, or only `:name:`, e.g. `:check-circle:`,
+which uses the default variant. Only the names of existing icons are replaced, other text is left as it is.
+
+The text is scanned once with a regex of all icon names, and each distinct icon is rendered once per text.
+The names in the regex are merged into a trie, e.g. `bars-(?:2|3(?:-bottom-left)?)`, so at each position
+the regex checks only the characters that can follow, instead of trying each icon name.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Match, Pattern, Tuple
+
+from django.utils.safestring import SafeData, mark_safe
+
+from djc_heroicons.icons import ICON_NAMES, ICONS, VariantName
+from djc_heroicons.render import (
+    DEFAULT_COLOR,
+    DEFAULT_SIZE,
+    DEFAULT_STROKE_WIDTH,
+    get_icon_error,
+    kwargs_to_attrs,
+    render_icon_svg,
+)
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def to_regex(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + to_regex(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        # NOTE: The optional group is greedy, so longer names, e.g. `bars-3-bottom-left`, are preferred
+        group = f"(?:{'|'.join(branches)})"
+        return f"{group}?" if "" in node else group
+
+    return to_regex(trie)
+
+
+@lru_cache(maxsize=1)
+def get_shortcode_pattern() -> Pattern:
+    """Regex that matches the shortcodes of all icons. It's compiled once, on first use."""
+    variants = "|".join(re.escape(variant) for variant in ICONS)
+    return re.compile(f":(?:({variants}):)?({_trie_regex(ICON_NAMES)}):")
+
+
+def render_shortcodes(
+    text: str,
+    variant: VariantName = "outline",
+    size: int = DEFAULT_SIZE,
+    color: str = DEFAULT_COLOR,
+    stroke_width: float = DEFAULT_STROKE_WIDTH,
+    **attrs: Any,
+) -> str:
+    """
+    Replace the icon shortcodes in `text` with the icons' `<svg>` markup.
+
+    Shortcodes without a variant, e.g. `:check-circle:`, are rendered with the given `variant`.
+    Other kwargs are the same as for `render_icon()`.
+
+    The rest of the text is NOT escaped. If the text comes from users, escape it first.
+    If `text` is marked as safe, so is the result.
+
+    **Example:**
+
+    ```python
+    from djc_heroicons.shortcodes import render_shortcodes
+
+    html = render_shortcodes("Done :solid:check-circle:", size=16, class_="inline")
+    ```
+    """
+    if ":" not in text:
+        return text
+
+    svg_attrs = kwargs_to_attrs(attrs) or None
+    rendered: Dict[Tuple[str, str], str] = {}
+
+    def replace(match: Match) -> str:
+        icon_variant = match.group(1) or variant
+        name = match.group(2)
+        key = (icon_variant, name)
+        svg = rendered.get(key)
+        if svg is None:
+            if get_icon_error(name, icon_variant) is not None:
+                return match.group(0)
+            svg = render_icon_svg(
+                name, icon_variant, size, color, stroke_width, "0 0 24 24", svg_attrs  # type: ignore[arg-type]
+            )
+            rendered[key] = svg
+        return svg
+
+    result = get_shortcode_pattern().sub(replace, text)
+    return mark_safe(result) if isinstance(text, SafeData) else result
@@ -0,0 +1,24 @@
+from django.dispatch import Signal
+
+icon_rendered = Signal()
+"""
+Sent after an `Icon` component has been rendered.
+
+The `sender` is the `Icon` class. The signal is sent with following arguments:
+
+- `kwargs` - Dictionary of the kwargs the icon was rendered with.
+- `data_time` - Time in seconds spent in `Icon.get_template_data()`.
+- `render_time` - Time in seconds spent rendering the icon's template.
+- `html` - The rendered HTML.
+
+**Example:**
+
+```python
+from djc_heroicons.signals import icon_rendered
+
+def on_icon_rendered(sender, kwargs, data_time, render_time, html, **extra):
+    print(f"Rendered {kwargs['name']} in {(data_time + render_time) * 1000:.3f}ms")
+
+icon_rendered.connect(on_icon_rendered)
+```
+"""
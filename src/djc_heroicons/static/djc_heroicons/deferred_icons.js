@@ -0,0 +1,94 @@
+(() => {
+  // Fill in the paths of deferred icons (`<svg data-heroicon="variant:name">`) once they scroll into view.
+  // Icons that become visible together are fetched in a single request from the icon bundle endpoint,
+  // whose URL is given as `data-url` of this script's `<script>` tag.
+  const ATTR = "data-heroicon";
+  const BATCH_SIZE = 100; // Same as `BUNDLE_MAX_ICONS`
+
+  const bundleUrl = document.currentScript.dataset.url;
+  const loaded = new Map(); // "variant:name" -> `<svg>` element with the icon's paths
+  const waiting = new Map(); // "variant:name" -> placeholders waiting for the icon
+  const fetching = new Set(); // "variant:name" of icons that are being fetched
+  let scheduled = false;
+
+  const fill = (placeholder, icon) => {
+    placeholder.replaceChildren(...Array.from(icon.childNodes, (node) => node.cloneNode(true)));
+    placeholder.removeAttribute(ATTR);
+  };
+
+  const fetchBatch = async (keys) => {
+    const url = new URL(bundleUrl, window.location.href);
+    // Sorted, so the same icons give the same URL, which can be cached by the browser
+    url.searchParams.set("icons", keys.sort().join(","));
+    keys.forEach((key) => fetching.add(key));
+    let icons = {};
+    try {
+      const resp = await fetch(url);
+      if (resp.ok) icons = (await resp.json()).icons;
+    } catch (err) {
+      // Network error or invalid response, the placeholders stay empty
+    } finally {
+      keys.forEach((key) => fetching.delete(key));
+    }
+
+    const template = document.createElement("template");
+    Object.entries(icons).forEach(([key, svg]) => {
+      template.innerHTML = svg;
+      const icon = template.content.firstElementChild;
+      loaded.set(key, icon);
+      (waiting.get(key) || []).forEach((placeholder) => fill(placeholder, icon));
+    });
+    // NOTE: Icons that failed to load are not fetched again, otherwise the next `flush()`
+    //       would retry them in a loop, e.g. while the server returns errors
+    keys.forEach((key) => waiting.delete(key));
+  };
+
+  const flush = () => {
+    scheduled = false;
+    const keys = Array.from(waiting.keys()).filter((key) => !fetching.has(key));
+    for (let i = 0; i < keys.length; i += BATCH_SIZE) {
+      fetchBatch(keys.slice(i, i + BATCH_SIZE));
+    }
+  };
+
+  const observer = new IntersectionObserver(
+    (entries) => {
+      entries.forEach((entry) => {
+        if (!entry.isIntersecting) return;
+        const placeholder = entry.target;
+        observer.unobserve(placeholder);
+
+        const key = placeholder.getAttribute(ATTR);
+        if (loaded.has(key)) {
+          fill(placeholder, loaded.get(key));
+          return;
+        }
+        if (!waiting.has(key)) waiting.set(key, []);
+        waiting.get(key).push(placeholder);
+      });
+
+      if (waiting.size && !scheduled) {
+        scheduled = true;
+        requestAnimationFrame(flush);
+      }
+    },
+    // Start loading a bit before the icons scroll into view
+    { rootMargin: "200px" },
+  );
+
+  const observe = (root) => {
+    if (root.matches && root.matches(`svg[${ATTR}]`)) observer.observe(root);
+    if (root.querySelectorAll) root.querySelectorAll(`svg[${ATTR}]`).forEach((el) => observer.observe(el));
+  };
+
+  // Also handle icons added to the page later, e.g. with HTMX
+  new MutationObserver((mutations) => {
+    mutations.forEach((mutation) => mutation.addedNodes.forEach(observe));
+  }).observe(document.documentElement, { childList: true, subtree: true });
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", () => observe(document));
+  } else {
+    observe(document);
+  }
+})();
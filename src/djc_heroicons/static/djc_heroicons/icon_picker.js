@@ -0,0 +1,75 @@
+(() => {
+  // Load further pages of icons as the user scrolls to the bottom of the grid
+  const initPicker = (picker) => {
+    if (picker.dataset.initialized) return;
+    picker.dataset.initialized = "true";
+
+    const input = picker.querySelector("input");
+    const grid = picker.querySelector(".djc-icon-picker__grid");
+    let loading = false;
+
+    const markSelected = () => {
+      grid.querySelectorAll(".djc-icon-picker__icon").forEach((btn) => {
+        btn.setAttribute("aria-pressed", String(btn.dataset.name === input.value));
+      });
+    };
+
+    const addIcon = (icon) => {
+      const btn = document.createElement("button");
+      btn.type = "button";
+      btn.className = "djc-icon-picker__icon";
+      btn.dataset.name = icon.name;
+      btn.title = icon.name;
+      btn.innerHTML = icon.svg;
+      btn.setAttribute("aria-pressed", String(icon.name === input.value));
+      grid.appendChild(btn);
+    };
+
+    const loadNextPage = async () => {
+      const nextPage = picker.dataset.nextPage;
+      if (loading || !nextPage) return;
+      loading = true;
+      try {
+        const url = new URL(picker.dataset.url, window.location.href);
+        url.searchParams.set("page", nextPage);
+        url.searchParams.set("variant", picker.dataset.variant);
+        const resp = await fetch(url);
+        if (!resp.ok) return;
+        const data = await resp.json();
+        data.icons.forEach(addIcon);
+        if (data.next_page) {
+          picker.dataset.nextPage = data.next_page;
+        } else {
+          delete picker.dataset.nextPage;
+        }
+      } finally {
+        loading = false;
+      }
+    };
+
+    grid.addEventListener("click", (event) => {
+      const btn = event.target.closest(".djc-icon-picker__icon");
+      if (!btn) return;
+      input.value = btn.dataset.name;
+      input.dispatchEvent(new Event("change", { bubbles: true }));
+      markSelected();
+    });
+    input.addEventListener("input", markSelected);
+
+    grid.addEventListener("scroll", () => {
+      if (grid.scrollTop + grid.clientHeight >= grid.scrollHeight - 48) {
+        loadNextPage();
+      }
+    });
+
+    markSelected();
+  };
+
+  const initAll = () => document.querySelectorAll(".djc-icon-picker").forEach(initPicker);
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", initAll);
+  } else {
+    initAll();
+  }
+})();
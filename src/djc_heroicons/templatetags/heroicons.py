@@ -0,0 +1,141 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from django import template
+from django.template.base import FilterExpression, Parser, Token, Variable
+from django.template.library import SimpleNode
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
+
+from djc_heroicons import render
+from djc_heroicons.app_settings import HeroIconsSettings, app_settings
+from djc_heroicons.fingerprints import get_icon_version, get_markup_version
+from djc_heroicons.icons import IconName, VariantName
+from djc_heroicons.render import DEFAULT_COLOR, DEFAULT_SIZE, DEFAULT_STROKE_WIDTH, kwargs_to_attrs, render_icon_svg
+from djc_heroicons.shortcodes import render_shortcodes
+
+register = template.Library()
+
+
+@register.simple_tag
+def icon(
+    name: IconName,
+    variant: VariantName = "outline",
+    size: int = DEFAULT_SIZE,
+    color: str = DEFAULT_COLOR,
+    stroke_width: float = DEFAULT_STROKE_WIDTH,
+    viewbox: str = "0 0 24 24",
+    attrs: Optional[Dict] = None,
+    deferred: bool = False,
+    **extra_attrs: Any,
+) -> SafeString:
+    """
+    Render an icon. This is a lightweight alternative to `{% component "icon" %}`, which renders
+    the same markup, but without creating a component instance.
+
+    Accepts the same inputs as the `Icon` component. Other keyword arguments are set as HTML attributes
+    on the `<svg>` element, with underscores converted to dashes.
+
+    If all arguments are literals, the markup is rendered only once, and reused on the next renders.
+    `{% component "icon" %}` tags are folded by the `djc_heroicons.loaders.Loader` template loader.
+
+    **Example:**
+
+    ```django
+    {% load heroicons %}
+    {% icon "academic-cap" variant="solid" size=20 class="p-4" data_id="123" %}
+    ```
+    """
+    if extra_attrs:
+        attrs = {**(attrs or {}), **kwargs_to_attrs(extra_attrs)}
+    return render_icon_svg(name, variant, size, color, stroke_width, viewbox, attrs, deferred)
+
+
+def _is_literal(expr: FilterExpression) -> bool:
+    if expr.filters:
+        return False
+    # NOTE: Quoted strings are resolved already when parsed, numbers are kept as `Variable` with a `literal`
+    return not isinstance(expr.var, Variable) or expr.var.literal is not None
+
+
+class FoldedIconNode(template.Node):
+    """
+    `{% icon %}` tag with only literal arguments. The icon is rendered on the first render, and the markup
+    is then reused. With the cached template loader, the markup is kept for as long as the template.
+
+    The icon is rendered again when the settings change, or when the renders are traced or recorded.
+    """
+
+    def __init__(self, args: List[Any], kwargs: Dict[str, Any]) -> None:
+        self.args = args
+        self.kwargs = kwargs
+        # NOTE: Settings and markup are replaced together, so other threads never see a mismatched pair
+        self._folded: Optional[Tuple[HeroIconsSettings, SafeString]] = None
+
+    def render(self, context: template.Context) -> SafeString:
+        snapshot = app_settings._settings
+        folded = self._folded
+        if folded is None or folded[0] is not snapshot or snapshot.tracer is not None or render._record_usage:
+            svg = icon(*self.args, **self.kwargs)
+            self._folded = (snapshot, svg)
+            return svg
+
+        svg = folded[1]
+        rendered_icons = render._rendered_icons.get()
+        if rendered_icons is not None:
+            rendered_icons.append(svg)
+        return svg
+
+
+_compile_icon = register.tags["icon"]
+
+
+@register.tag("icon")
+def _compile_folded_icon(parser: Parser, token: Token) -> template.Node:
+    node: SimpleNode = _compile_icon(parser, token)
+    if node.target_var is not None or not all(_is_literal(arg) for arg in [*node.args, *node.kwargs.values()]):
+        return node
+
+    empty_context = template.Context()
+    args = [arg.resolve(empty_context) for arg in node.args]
+    kwargs = {key: value.resolve(empty_context) for key, value in node.kwargs.items()}
+    return FoldedIconNode(args, kwargs)
+
+
+@register.simple_tag
+def heroicons_version(name: Optional[IconName] = None, variant: VariantName = "outline") -> str:
+    """
+    Output the version of the rendered icon markup. If the `name` of an icon is given,
+    output the content hash of that icon instead.
+
+    **Example:**
+
+    ```django
+    {% load cache heroicons %}
+    {% heroicons_version as icons_version %}
+    {% cache 600 sidebar icons_version %}
+      ...
+    {% endcache %}
+    ```
+    """
+    if name is None:
+        return get_markup_version()
+    return get_icon_version(name, variant)
+
+
+@register.filter(needs_autoescape=True)
+def icon_shortcodes(value: str, size: int = DEFAULT_SIZE, autoescape: bool = True) -> SafeString:
+    """
+    Replace icon shortcodes like `:solid:check-circle:` or `:check-circle:` with the icons.
+    See `djc_heroicons.shortcodes`.
+
+    Unless the text is marked as safe, it's escaped first, same as other text in templates.
+
+    **Example:**
+
+    ```django
+    {% load heroicons %}
+    {{ article.body|icon_shortcodes:16 }}
+    ```
+    """
+    text = conditional_escape(value) if autoescape else str(value)
+    return mark_safe(render_shortcodes(text, size=int(size)))
@@ -0,0 +1,186 @@
+"""
+Tracing of icon renders, enabled with the `tracer` setting.
+
+Each icon render is recorded as an `IconSpan`. To avoid flooding the traces, spans are not exported
+one by one. Instead, the spans of a single template render are aggregated into an `IconTraceSummary`,
+which is passed to `IconTracer.export()`.
+
+Template renders are traced when the templates are rendered with the `TracingDjangoTemplates` backend.
+Other parts of code can be traced with `trace_icons()`.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from django.template.backends.django import DjangoTemplates
+
+from djc_heroicons.app_settings import app_settings
+
+
+class IconSpan(NamedTuple):
+    """A single icon render."""
+
+    name: str
+    variant: str
+    cache_hit: bool
+    """Whether the icon markup was taken from the cache."""
+    bytes: int
+    """Size of the rendered markup."""
+    duration: float
+    """Time in seconds it took to render the icon."""
+
+
+class IconTraceSummary(NamedTuple):
+    """Icon renders aggregated over a single template render, or a `trace_icons()` block."""
+
+    label: Optional[str]
+    """Name of the template, or the label given to `trace_icons()`. `None` for icons rendered outside of both."""
+    icon_count: int
+    cache_hits: int
+    bytes: int
+    duration: float
+    """Total time in seconds spent rendering the icons."""
+    icons: Dict[str, int]
+    """How many times each icon was rendered, as `{"variant:name": count}`."""
+
+    @property
+    def cache_misses(self) -> int:
+        return self.icon_count - self.cache_hits
+
+
+class IconTracer:
+    """
+    Base class for tracers. Subclass it and override `export()` to send the traces e.g. to OpenTelemetry.
+
+    This base class does nothing with the traces.
+    """
+
+    def export(self, summary: IconTraceSummary) -> None:
+        pass
+
+
+class InMemoryIconTracer(IconTracer):
+    """Tracer that keeps the traces in the `summaries` list. Useful in tests."""
+
+    def __init__(self) -> None:
+        self.summaries: List[IconTraceSummary] = []
+
+    def export(self, summary: IconTraceSummary) -> None:
+        self.summaries.append(summary)
+
+    def clear(self) -> None:
+        self.summaries.clear()
+
+
+class _TraceScope:
+    def __init__(self, label: Optional[str]) -> None:
+        self.label = label
+        self.count = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.duration = 0.0
+        self.icons: Counter = Counter()
+
+    def add(self, span: IconSpan) -> None:
+        self.count += 1
+        self.cache_hits += span.cache_hit
+        self.bytes += span.bytes
+        self.duration += span.duration
+        self.icons[f"{span.variant}:{span.name}"] += 1
+
+    def summary(self) -> IconTraceSummary:
+        return IconTraceSummary(
+            label=self.label,
+            icon_count=self.count,
+            cache_hits=self.cache_hits,
+            bytes=self.bytes,
+            duration=self.duration,
+            icons=dict(self.icons),
+        )
+
+
+_scope: ContextVar[Optional[_TraceScope]] = ContextVar("djc_heroicons_trace_scope", default=None)
+
+
+def record_span(tracer: IconTracer, span: IconSpan) -> None:
+    """
+    Add the span to the current `trace_icons()` block. Outside of any block, the span is exported
+    right away, as a summary with a single icon.
+    """
+    scope = _scope.get()
+    if scope is not None:
+        scope.add(span)
+        return
+
+    scope = _TraceScope(None)
+    scope.add(span)
+    tracer.export(scope.summary())
+
+
+@contextmanager
+def trace_icons(label: str) -> Iterator[None]:
+    """
+    Aggregate the icons rendered inside this block into a single trace. When the block ends,
+    the trace is exported by the tracer from the `tracer` setting.
+
+    If the blocks are nested, icons are added to the innermost block.
+
+    **Example:**
+
+    ```python
+    with trace_icons("sidebar"):
+        html = render_sidebar()
+    ```
+    """
+    if app_settings.TRACER is None:
+        yield
+        return
+
+    scope = _TraceScope(label)
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+        tracer = app_settings.TRACER
+        if tracer is not None and scope.count:
+            tracer.export(scope.summary())
+
+
+class _TracingTemplate:
+    def __init__(self, template: Any) -> None:
+        self.template = template
+
+    @property
+    def origin(self) -> Any:
+        return self.template.origin
+
+    def render(self, context: Optional[Dict] = None, request: Any = None) -> str:
+        with trace_icons(self.template.origin.template_name or "<unknown source>"):
+            return self.template.render(context, request)
+
+
+class TracingDjangoTemplates(DjangoTemplates):
+    """
+    Django template backend that traces icons rendered in each template render.
+
+    The icons of included templates and of components are aggregated into the trace
+    of the template in which they are rendered.
+
+    ```python
+    TEMPLATES = [
+        {
+            "BACKEND": "djc_heroicons.tracing.TracingDjangoTemplates",
+            ...
+        },
+    ]
+    ```
+    """
+
+    def from_string(self, template_code: str) -> _TracingTemplate:
+        return _TracingTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name: str) -> _TracingTemplate:
+        return _TracingTemplate(super().get_template(template_name))
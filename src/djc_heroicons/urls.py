@@ -0,0 +1,11 @@
+from django.urls import path
+
+from djc_heroicons import views
+
+app_name = "djc_heroicons"
+
+urlpatterns = [
+    path("picker/", views.icon_picker_page, name="icon_picker"),
+    path("bundle/", views.icon_bundle, name="icon_bundle"),
+    path("dictionary/", views.compression_dictionary, name="compression_dictionary"),
+]
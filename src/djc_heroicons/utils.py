@@ -6,3 +6,27 @@ if sys.version_info >= (3, 11):
 else:
     # for Python <3.11 with (Not)Required
     from typing_extensions import NotRequired, TypedDict  # noqa: F401
+
+
+def accepts_encoding(accept_encoding: str, coding: str) -> bool:
+    """
+    Whether the `Accept-Encoding` header value allows the content `coding`, e.g. `"gzip"`.
+
+    Codings with `q=0` are refused, e.g. `gzip;q=0`. Codings that are not listed are accepted
+    only if `*` is accepted.
+    """
+    qvalues = {}
+    for entry in accept_encoding.split(","):
+        name, _, params = entry.partition(";")
+        qvalue = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    qvalue = float(value)
+                except ValueError:
+                    qvalue = 0.0
+        qvalues[name.strip().lower()] = qvalue
+
+    qvalue = qvalues.get(coding.lower(), qvalues.get("*", 0.0))
+    return qvalue > 0
@@ -0,0 +1,151 @@
+from typing import Dict, List
+
+from django.core.paginator import Paginator
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBase, JsonResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_GET
+
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.bundle import get_bundle_etag, get_icon_bundle, parse_bundle_icons
+from djc_heroicons.dictionary import DICTIONARY_MATCH, load_dictionary
+from djc_heroicons.icons import ICONS, VariantName
+from djc_heroicons.render import render_icon
+from djc_heroicons.utils import accepts_encoding
+
+PICKER_PAGE_SIZE = 48
+"""Number of icons served per page of the icon picker."""
+
+
+def get_icon_picker_page(variant: VariantName, page: int, query: str = "", page_size: int = PICKER_PAGE_SIZE) -> Dict:
+    """
+    Get a single page of icon previews for the icon picker.
+
+    Returns a dictionary with the `icons` on the page, each as a `{"name": ..., "svg": ...}` dict,
+    and the number of the `next_page`, or `None` if this is the last page.
+    """
+    if variant not in ICONS:
+        raise ValueError(f"Invalid variant: {variant}. Must be either 'outline' or 'solid'")
+
+    names: List[str] = list(ICONS[variant].keys())
+    if query:
+        names = [name for name in names if query in name]
+
+    paginator = Paginator(names, page_size)
+    page_obj = paginator.get_page(page)
+    # `get_page()` falls back to the last page for out-of-range pages, so return nothing instead
+    if page_obj.number != page:
+        return {"icons": [], "next_page": None}
+
+    icons = [
+        {
+            "name": name,
+            "svg": render_icon(name, variant=variant),
+        }
+        for name in page_obj.object_list
+    ]
+
+    return {
+        "icons": icons,
+        "next_page": page_obj.next_page_number() if page_obj.has_next() else None,
+    }
+
+
+@require_GET
+def icon_picker_page(request: HttpRequest) -> JsonResponse:
+    """
+    Serve a page of icon previews as JSON, so the icon picker widget can load icons as the user scrolls.
+
+    Query params:
+    - `page` - Page number, starting at 1.
+    - `variant` - `"outline"` or `"solid"`. Defaults to `"outline"`.
+    - `q` - Optional substring to filter the icon names by.
+    """
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        return JsonResponse({"error": "Invalid page"}, status=400)
+
+    variant = request.GET.get("variant", "outline")
+    if variant not in ICONS:
+        return JsonResponse({"error": f"Invalid variant: {variant}"}, status=400)
+
+    query = request.GET.get("q", "").strip()
+
+    data = get_icon_picker_page(variant, page, query=query)  # type: ignore[arg-type]
+    response = JsonResponse(data)
+    # The icons are static, so the pages can be cached by the browser
+    response["Cache-Control"] = "public, max-age=86400"
+    return response
+
+
+@require_GET
+def icon_bundle(request: HttpRequest) -> HttpResponseBase:
+    """
+    Serve several icons in a single response, so clients don't have to fetch the icons one by one.
+
+    Query params:
+    - `icons` - Comma-separated list of icons as `variant:name`, or only `name` for outline icons,
+      e.g. `solid:bars-3,academic-cap`. The order doesn't matter.
+    - `format` - `"json"` or `"svg"` for an SVG sprite. Defaults to `"json"`.
+
+    See `djc_heroicons.bundle.get_icon_bundle()` for the format of the response.
+    """
+    bundle_format = request.GET.get("format", "json")
+    if bundle_format not in ("json", "svg"):
+        return JsonResponse({"error": f"Invalid format: {bundle_format}"}, status=400)
+
+    try:
+        key = parse_bundle_icons(request.GET.get("icons", ""))
+    except ValueError as err:
+        return JsonResponse({"error": str(err)}, status=400)
+
+    use_gzip = accepts_encoding(request.headers.get("Accept-Encoding", ""), "gzip")
+    # The compressed and uncompressed responses are different representations, so they need different ETags
+    etag = quote_etag(get_bundle_etag(key, bundle_format) + ("-gzip" if use_gzip else ""))  # type: ignore[arg-type]
+
+    response: HttpResponseBase
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        response = not_modified
+    else:
+        bundle = get_icon_bundle(key, bundle_format)  # type: ignore[arg-type]
+        response = HttpResponse(bundle.gzip_body if use_gzip else bundle.body, content_type=bundle.content_type)
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+
+    response["ETag"] = etag
+    # The icons are static, so the bundles can be cached by the browser
+    response["Cache-Control"] = "public, max-age=86400"
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
+
+@require_GET
+def compression_dictionary(request: HttpRequest) -> HttpResponseBase:
+    """
+    Serve the shared compression dictionary from the `compression_dictionary` setting.
+
+    The `Use-As-Dictionary` header tells browsers to advertise the dictionary in the `Available-Dictionary`
+    header of the following page requests, so `djc_heroicons.compression.CompressionDictionaryMiddleware`
+    can compress the pages with it.
+    """
+    path = app_settings.COMPRESSION_DICTIONARY
+    if path is None:
+        raise Http404("No compression dictionary")
+
+    dictionary = load_dictionary(path)
+    etag = quote_etag(dictionary.digest.hex()[:16])
+
+    response: HttpResponseBase
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        response = not_modified
+    else:
+        response = HttpResponse(dictionary.data, content_type="application/octet-stream")
+
+    response["ETag"] = etag
+    response["Use-As-Dictionary"] = f'match="{DICTIONARY_MATCH}", match-dest=("document")'
+    # Browsers use the dictionary only until it expires, so it is cached like the other icon responses
+    response["Cache-Control"] = "public, max-age=86400"
+    return response
@@ -0,0 +1,208 @@
+"""
+Profile-guided warmup of the icon caches.
+
+While recording, a sample of the renders is counted by `UsageRecorder`, and the counts are periodically
+added to a JSON profile file. When a new process starts, the most rendered icons from the profile
+are rendered in advance, so the first requests are served from the caches.
+
+The profile file looks like this:
+
+```json
+{
+  "icons": [
+    {"variant": "outline", "name": "bars-3", "size": 24, "color": "currentColor",
+     "stroke_width": 1.5, "viewbox": "0 0 24 24", "count": 1520},
+    ...
+  ]
+}
+```
+"""
+
+import atexit
+import json
+import logging
+import os
+import random
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from djc_heroicons import render
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.icons import ICONS
+
+logger = logging.getLogger("djc_heroicons")
+
+PROFILE_FLUSH_INTERVAL = 60
+"""How often, in seconds, the recorded usage is written to the profile file."""
+
+UsageKey = Tuple[str, str, int, str, float, str]
+"""`(variant, name, size, color, stroke_width, viewbox)` of a render."""
+
+_KEY_FIELDS = ("variant", "name", "size", "color", "stroke_width", "viewbox")
+
+
+def load_profile(path: Union[str, Path]) -> Dict[UsageKey, int]:
+    """
+    Load the render counts from a profile file. Returns an empty dict if the file doesn't exist
+    or can't be read.
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        counts: Dict[UsageKey, int] = {}
+        for entry in data["icons"]:
+            counts[tuple(entry[field] for field in _KEY_FIELDS)] = entry["count"]  # type: ignore[index]
+        return counts
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError) as err:
+        logger.warning(f"Failed to load icon profile {path}: {err}")
+        return {}
+
+
+def save_profile(path: Union[str, Path], counts: Dict[UsageKey, int]) -> None:
+    """Write the render counts to a profile file, the most rendered icons first."""
+    entries = [
+        {**dict(zip(_KEY_FIELDS, key)), "count": count}
+        for key, count in sorted(counts.items(), key=lambda item: item[1], reverse=True)
+    ]
+    # Write to a temporary file first, so that other processes never read a half-written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump({"icons": entries}, file, indent=1)
+    os.replace(tmp_path, path)
+
+
+class UsageRecorder:
+    """
+    Count a sample of the renders, and periodically add the counts to the profile file.
+
+    The counts are written by a background thread, so the renders never wait for the file.
+
+    The file is read and written as a whole, so when several processes write to the same file
+    at the same time, some counts may be lost. That's fine for the purpose of finding the most used icons.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        sample_rate: float,
+        flush_interval: float = PROFILE_FLUSH_INTERVAL,
+    ) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.flush_interval = flush_interval
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+        # Held while the file is written, as the background thread and `stop()` may flush at the same time
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher_pid: Optional[int] = None
+
+    def record(self, key: UsageKey) -> None:
+        if random.random() >= self.sample_rate:
+            return
+
+        with self._lock:
+            self._counts[key] += 1
+            # NOTE: The thread is started by the first sample, and not when the recording starts,
+            #       so that each worker process forked from the main process starts its own thread
+            if self._flusher_pid != os.getpid():
+                self._flusher_pid = os.getpid()
+                threading.Thread(target=self._flush_periodically, name="djc-heroicons-profile", daemon=True).start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """Add the counts recorded so far to the profile file."""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        if not counts:
+            return
+
+        with self._flush_lock:
+            try:
+                counts.update(load_profile(self.path))
+                save_profile(self.path, counts)
+            except OSError as err:
+                logger.warning(f"Failed to write icon profile {self.path}: {err}")
+
+    def stop(self) -> None:
+        """Stop the background thread, and write the remaining counts to the profile file."""
+        self._stopped.set()
+        self.flush()
+
+
+_recorder: Optional[UsageRecorder] = None
+
+
+def start_recording(path: Union[str, Path], sample_rate: float) -> UsageRecorder:
+    """Start recording a sample of the renders to the profile file at `path`."""
+    global _recorder
+    stop_recording()
+
+    _recorder = UsageRecorder(path, sample_rate)
+    render._record_usage = _recorder.record
+    return _recorder
+
+
+def stop_recording() -> None:
+    """Stop recording the renders, and write the remaining counts to the profile file."""
+    global _recorder
+    render._record_usage = None
+    if _recorder is not None:
+        _recorder.stop()
+        _recorder = None
+
+
+atexit.register(stop_recording)
+
+
+def warmup(path: Union[str, Path], count: int) -> List[UsageKey]:
+    """
+    Render the `count` most rendered icons from the profile file, so that they are cached.
+
+    Icons that no longer exist are skipped. Returns the rendered icons.
+    """
+    counts = load_profile(path)
+    top_keys = sorted(counts, key=lambda key: counts[key], reverse=True)[:count]
+
+    rendered: List[UsageKey] = []
+    for key in top_keys:
+        variant, name, size, color, stroke_width, viewbox = key
+        if render.get_icon_error(name, variant) is not None:
+            continue
+        render.render_icon_svg(name, variant, size, color, stroke_width, viewbox, None)  # type: ignore[arg-type]
+        rendered.append(key)
+    return rendered
+
+
+def warmup_all() -> List[UsageKey]:
+    """
+    Render all icons of all variants with the default size, color and stroke width.
+
+    Use this to fill the shared cache (see the `cache` setting) when there is no profile.
+    """
+    rendered: List[UsageKey] = []
+    for variant, icons in ICONS.items():
+        for name in icons:
+            size, color, stroke_width = render.DEFAULT_SIZE, render.DEFAULT_COLOR, render.DEFAULT_STROKE_WIDTH
+            render.render_icon_svg(name, variant, size, color, stroke_width, "0 0 24 24", None)
+            rendered.append((variant, name, size, color, stroke_width, "0 0 24 24"))
+    return rendered
+
+
+def setup_warmup() -> None:
+    """Start recording and warm up the caches, as configured in the settings."""
+    path = app_settings.WARMUP_PROFILE
+    if path is None:
+        return
+
+    # NOTE: Warm up first, so the warmup renders are not recorded
+    warmup(path, app_settings.WARMUP_COUNT)
+    if app_settings.WARMUP_SAMPLE_RATE > 0:
+        start_recording(path, app_settings.WARMUP_SAMPLE_RATE)
@@ -0,0 +1,122 @@
+import gzip
+import json
+
+import pytest
+from django.test import Client
+from django_components.testing import djc_test
+
+from djc_heroicons.bundle import BUNDLE_MAX_ICONS, get_bundle_key, get_icon_bundle, parse_bundle_icons
+from djc_heroicons.icons import ICONS
+from djc_heroicons.render import render_icon
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+@djc_test
+class TestIconBundle:
+    def test_key_is_canonical(self):
+        key = parse_bundle_icons("solid:bars-3, academic-cap,outline:academic-cap")
+        assert key == (("outline", "academic-cap"), ("solid", "bars-3"))
+        assert parse_bundle_icons("academic-cap,solid:bars-3") == key
+
+    def test_key_invalid(self):
+        with pytest.raises(ValueError, match="Invalid icon name: bars-33"):
+            parse_bundle_icons("solid:bars-33")
+        with pytest.raises(ValueError, match="Invalid variant: regular"):
+            parse_bundle_icons("regular:bars-3")
+        with pytest.raises(ValueError, match="Too many icons"):
+            get_bundle_key([("outline", name) for name in list(ICONS["outline"])[: BUNDLE_MAX_ICONS + 1]])
+
+    def test_json(self):
+        bundle = get_icon_bundle(parse_bundle_icons("solid:bars-3,academic-cap"))
+
+        assert bundle.content_type == "application/json"
+        assert json.loads(bundle.body) == {
+            "icons": {
+                "outline:academic-cap": render_icon("academic-cap"),
+                "solid:bars-3": render_icon("bars-3", variant="solid"),
+            }
+        }
+        assert gzip.decompress(bundle.gzip_body) == bundle.body
+
+    def test_sprite(self):
+        bundle = get_icon_bundle(parse_bundle_icons("solid:bars-3,academic-cap"), format="svg")
+        body = bundle.body.decode()
+
+        assert bundle.content_type == "image/svg+xml"
+        assert body.startswith('<svg xmlns="http://www.w3.org/2000/svg" style="display: none">')
+        assert body.count("<symbol") == 2
+        assert (
+            '<symbol id="heroicon-outline-academic-cap" viewBox="0 0 24 24" fill="none" '
+            'stroke="currentColor" stroke-width="1.5">'
+        ) in body
+        assert '<symbol id="heroicon-solid-bars-3" viewBox="0 0 24 24" fill="currentColor" stroke="none">' in body
+
+    @djc_test(django_settings={"DJC_HEROICONS": {"css_variables": True}})
+    def test_sprite_css_variables(self):
+        bundle = get_icon_bundle(parse_bundle_icons("solid:bars-3"), format="svg")
+
+        assert (
+            '<symbol id="heroicon-solid-bars-3" viewBox="0 0 24 24" stroke="none" '
+            'style="fill: var(--heroicon-color, currentColor)">'
+        ) in bundle.body.decode()
+
+
+@djc_test
+class TestIconBundleView:
+    def test_response(self):
+        response = Client().get("/heroicons/bundle/", {"icons": "solid:bars-3,academic-cap"})
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response["Cache-Control"] == "public, max-age=86400"
+        assert response["Vary"] == "Accept-Encoding"
+        assert set(response.json()["icons"]) == {"outline:academic-cap", "solid:bars-3"}
+
+    def test_etag_order_independent(self):
+        client = Client()
+        response_a = client.get("/heroicons/bundle/", {"icons": "solid:bars-3,academic-cap"})
+        response_b = client.get("/heroicons/bundle/", {"icons": "academic-cap,solid:bars-3"})
+        response_svg = client.get("/heroicons/bundle/", {"icons": "academic-cap,solid:bars-3", "format": "svg"})
+
+        assert response_a["ETag"] == response_b["ETag"]
+        assert response_a.content == response_b.content
+        assert response_a["ETag"] != response_svg["ETag"]
+
+        not_modified = client.get(
+            "/heroicons/bundle/", {"icons": "solid:bars-3,academic-cap"}, HTTP_IF_NONE_MATCH=response_a["ETag"]
+        )
+        assert not_modified.status_code == 304
+        assert not_modified["ETag"] == response_a["ETag"]
+
+    def test_gzip(self):
+        client = Client()
+        plain = client.get("/heroicons/bundle/", {"icons": "bars-3", "format": "svg"})
+        compressed = client.get(
+            "/heroicons/bundle/", {"icons": "bars-3", "format": "svg"}, HTTP_ACCEPT_ENCODING="gzip, br"
+        )
+
+        assert compressed["Content-Encoding"] == "gzip"
+        assert compressed["Content-Type"] == "image/svg+xml"
+        assert gzip.decompress(compressed.content) == plain.content
+        assert compressed["ETag"] != plain["ETag"]
+
+        for accept_encoding in ("gzip;q=0, br", "br, GZIP; q=0.0", "identity", "*;q=0"):
+            response = client.get(
+                "/heroicons/bundle/", {"icons": "bars-3", "format": "svg"}, HTTP_ACCEPT_ENCODING=accept_encoding
+            )
+            assert not response.has_header("Content-Encoding"), accept_encoding
+            assert response.content == plain.content
+
+        for accept_encoding in ("br;q=1.0, gzip;q=0.5", "*", "x;q=0, *;q=0.1"):
+            response = client.get(
+                "/heroicons/bundle/", {"icons": "bars-3", "format": "svg"}, HTTP_ACCEPT_ENCODING=accept_encoding
+            )
+            assert response["Content-Encoding"] == "gzip", accept_encoding
+
+    def test_invalid_params(self):
+        client = Client()
+        assert client.get("/heroicons/bundle/", {"icons": "bars-33"}).status_code == 400
+        assert client.get("/heroicons/bundle/", {"icons": "bars-3", "format": "png"}).status_code == 400
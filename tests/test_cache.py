@@ -0,0 +1,136 @@
+import threading
+import time
+from io import StringIO
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django_components.testing import djc_test
+
+from djc_heroicons import render_icon
+from djc_heroicons.cache import _locks, get_or_render, get_svg_cache_key
+from djc_heroicons.icons import ICONS
+from djc_heroicons.render import _format_svg_cached
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+CACHE_SETTINGS = {
+    "CACHES": {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "icons": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "icons"},
+    },
+    "DJC_HEROICONS": {"cache": "icons"},
+}
+
+
+@djc_test(django_settings=CACHE_SETTINGS)
+class TestSharedCache:
+    def setup_method(self):
+        _format_svg_cached.cache_clear()
+
+    def test_stores_render(self):
+        caches["icons"].clear()
+        svg = render_icon("bars-3", size=16)
+
+        key = get_svg_cache_key("bars-3", "outline", 16, "currentColor", 1.5, "0 0 24 24", False, False)
+        assert caches["icons"].get(key) == svg
+        # Stored without expiry, so icons from `heroicons_warmup --all` are not lost after the default timeout
+        assert caches["icons"]._expire_info[caches["icons"].make_key(key)] is None  # type: ignore[attr-defined]
+
+    def test_reads_from_shared_cache(self):
+        # E.g. rendered by another process
+        key = get_svg_cache_key("bars-3", "solid", 24, "currentColor", 1.5, "0 0 24 24", False, False)
+        caches["icons"].set(key, "<svg>cached</svg>")
+
+        assert render_icon("bars-3", variant="solid") == "<svg>cached</svg>"
+
+    def test_custom_attrs_not_cached(self):
+        caches["icons"].clear()
+        render_icon("bars-3", class_="p-4")
+        assert caches["icons"]._cache == {}  # type: ignore[attr-defined]
+
+    def test_key(self):
+        key = get_svg_cache_key("bars-3", "outline", 24, "rgb(0, 0, 0)", 1.5, "0 0 24 24", False, False)
+        other = get_svg_cache_key("bars-3", "outline", 16, "rgb(0, 0, 0)", 1.5, "0 0 24 24", False, False)
+
+        assert key.startswith("djc_heroicons:")
+        assert " " not in key
+        assert key != other
+
+    def test_single_flight(self):
+        caches["icons"].clear()
+        renders = []
+
+        def render():
+            renders.append(1)
+            time.sleep(0.05)
+            return "<svg />"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_render("icons", "key", render))) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["<svg />"] * 8
+        assert len(renders) == 1
+
+    def test_lock_kept_while_waiting(self):
+        caches["icons"].clear()
+        rendering = threading.Event()
+        finish = threading.Event()
+
+        def render():
+            rendering.set()
+            finish.wait(5)
+            return "<svg />"
+
+        threads = [threading.Thread(target=get_or_render, args=("icons", "key", render)) for _ in range(2)]
+        threads[0].start()
+        rendering.wait(5)
+        threads[1].start()
+        # The second thread waits for the lock of the first one
+        deadline = time.monotonic() + 5
+        while _locks["key"].holders < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert _locks["key"].holders == 2
+
+        finish.set()
+        for thread in threads:
+            thread.join()
+        assert "key" not in _locks
+
+    def test_setting_change_clears_renders(self):
+        caches["icons"].clear()
+        render_icon("bars-3", size=20)
+        assert _format_svg_cached.cache_info().currsize == 1
+
+        @djc_test(django_settings={"DJC_HEROICONS": {}})
+        def run():
+            # Not looked up in the shared cache, which is no longer set
+            assert _format_svg_cached.cache_info().currsize == 0
+
+        run()
+
+    def test_waits_for_other_process(self):
+        cache = caches["icons"]
+        cache.clear()
+        # Another process holds the lock and renders the icon
+        cache.add("key:lock", 1)
+        threading.Timer(0.02, lambda: cache.set("key", "<svg>other</svg>")).start()
+
+        assert get_or_render("icons", "key", lambda: "<svg>this</svg>") == "<svg>other</svg>"
+
+    def test_warmup_command(self):
+        caches["icons"].clear()
+        out = StringIO()
+        call_command("heroicons_warmup", all=True, stdout=out)
+
+        total = sum(len(icons) for icons in ICONS.values())
+        assert out.getvalue().startswith(f"Rendered {total} icons in ")
+        key = get_svg_cache_key("x-mark", "solid", 24, "currentColor", 1.5, "0 0 24 24", False, False)
+        assert caches["icons"].get(key) is not None
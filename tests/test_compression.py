@@ -0,0 +1,163 @@
+import gzip
+import hashlib
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.http import HttpResponse
+from django.test import Client, RequestFactory
+from django_components.testing import djc_test
+
+from djc_heroicons import render_icon
+from djc_heroicons.dictionary import CompressionDictionary, build_raw_dictionary, load_dictionary
+from djc_heroicons.icons import ICONS
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+zstandard = pytest.importorskip("zstandard")
+
+from djc_heroicons.compression import (  # noqa: E402
+    DCZ_MAGIC,
+    CompressionDictionaryMiddleware,
+    decompress_with_dictionary,
+)
+
+# Table with a different icon in each row
+PAGE = "<html><body><table>{}</table></body></html>".format(
+    "".join(f"<tr><td>{name}</td><td>{render_icon(name, size=16)}</td></tr>" for name in list(ICONS["outline"])[:50])
+)
+
+
+def page_view(request):
+    response = HttpResponse(PAGE)
+    response["ETag"] = '"page"'
+    return response
+
+
+def build_dictionary(tmp_path, size=None) -> str:
+    path = str(tmp_path / "heroicons.dict")
+    call_command("heroicons_dictionary", output=path, size=size, stdout=StringIO())
+    return path
+
+
+@djc_test
+class TestDictionary:
+    def test_command(self, tmp_path):
+        path = str(tmp_path / "heroicons.dict")
+        out = StringIO()
+        call_command("heroicons_dictionary", output=path, stdout=out)
+
+        dictionary = load_dictionary(path)
+        assert dictionary.data == build_raw_dictionary()
+        assert render_icon("check-circle").encode() in dictionary.data
+        assert dictionary.hash.startswith(":") and dictionary.hash.endswith("=:")
+        assert out.getvalue().startswith(f"Wrote {len(dictionary.data)} bytes to {path} in ")
+        assert out.getvalue().endswith(f"(hash {dictionary.hash})\n")
+
+        with pytest.raises(CommandError, match="No output file given"):
+            call_command("heroicons_dictionary")
+
+    def test_trained(self, tmp_path):
+        path = build_dictionary(tmp_path, size=16_384)
+        dictionary = load_dictionary(path)
+
+        assert 0 < len(dictionary.data) <= 16_384
+        assert dictionary.data.startswith(b"\x37\xa4\x30\xec")  # zstd dictionary magic number
+
+    def test_view(self, tmp_path):
+        path = build_dictionary(tmp_path)
+
+        @djc_test(django_settings={"DJC_HEROICONS": {"compression_dictionary": path}})
+        def run():
+            client = Client()
+            response = client.get("/heroicons/dictionary/")
+            assert response.status_code == 200
+            assert response.content == load_dictionary(path).data
+            assert response["Use-As-Dictionary"] == 'match="/*", match-dest=("document")'
+
+            response_cached = client.get("/heroicons/dictionary/", headers={"If-None-Match": response["ETag"]})
+            assert response_cached.status_code == 304
+
+        run()
+
+    def test_view_without_dictionary(self):
+        assert Client().get("/heroicons/dictionary/").status_code == 404
+
+
+@djc_test
+class TestCompressionDictionaryMiddleware:
+    def test_compress(self, tmp_path):
+        path = build_dictionary(tmp_path)
+        dictionary = load_dictionary(path)
+
+        @djc_test(django_settings={"DJC_HEROICONS": {"compression_dictionary": path}})
+        def run():
+            request = RequestFactory().get(
+                "/page/",
+                headers={"Accept-Encoding": "gzip, br, zstd, dcz", "Available-Dictionary": dictionary.hash},
+            )
+            response = CompressionDictionaryMiddleware(page_view)(request)
+
+            assert response["Content-Encoding"] == "dcz"
+            assert response["Vary"] == "Accept-Encoding, Available-Dictionary"
+            assert response["ETag"] == 'W/"page"'
+            assert response["Content-Length"] == str(len(response.content))
+            assert response.content.startswith(DCZ_MAGIC + dictionary.digest)
+            assert decompress_with_dictionary(response.content, dictionary) == PAGE.encode()
+            # Icons point into the dictionary, so the page is much smaller than with gzip
+            assert len(response.content) * 2 < len(gzip.compress(PAGE.encode()))
+
+        run()
+
+    def test_link_dictionary(self, tmp_path):
+        path = build_dictionary(tmp_path)
+
+        @djc_test(django_settings={"DJC_HEROICONS": {"compression_dictionary": path}})
+        def run():
+            for headers in ({}, {"Accept-Encoding": "dcz", "Available-Dictionary": ":b2xk:"}):
+                response = CompressionDictionaryMiddleware(page_view)(RequestFactory().get("/", headers=headers))
+
+                assert not response.has_header("Content-Encoding")
+                assert response.content == PAGE.encode()
+                assert response["Link"] == '</heroicons/dictionary/>; rel="compression-dictionary"'
+                assert response["Vary"] == "Accept-Encoding, Available-Dictionary"
+
+        run()
+
+    def test_skips_other_responses(self, tmp_path):
+        path = build_dictionary(tmp_path)
+        headers = {"Accept-Encoding": "dcz", "Available-Dictionary": load_dictionary(path).hash}
+
+        def json_view(request):
+            return HttpResponse("{}" * 200, content_type="application/json")
+
+        def short_view(request):
+            return HttpResponse("<p>Hi</p>")
+
+        @djc_test(django_settings={"DJC_HEROICONS": {"compression_dictionary": path}})
+        def run():
+            for view in (json_view, short_view):
+                response = CompressionDictionaryMiddleware(view)(RequestFactory().get("/", headers=headers))
+                assert not response.has_header("Content-Encoding")
+
+            # Browser has the dictionary, but doesn't accept `dcz`
+            for accept_encoding in ("gzip", "gzip, dcz;q=0"):
+                request = RequestFactory().get("/", headers={**headers, "Accept-Encoding": accept_encoding})
+                response = CompressionDictionaryMiddleware(page_view)(request)
+                assert not response.has_header("Content-Encoding")
+
+        run()
+
+        # Without the setting, the responses are left as they are
+        response = CompressionDictionaryMiddleware(page_view)(RequestFactory().get("/", headers=headers))
+        assert not response.has_header("Content-Encoding")
+        assert not response.has_header("Vary")
+
+    def test_decompress_other_dictionary(self, tmp_path):
+        dictionary = load_dictionary(build_dictionary(tmp_path))
+        other = CompressionDictionary(data=b"other", digest=hashlib.sha256(b"other").digest())
+
+        with pytest.raises(ValueError, match="Response was not compressed with the dictionary"):
+            decompress_with_dictionary(DCZ_MAGIC + dictionary.digest + b"...", other)
@@ -0,0 +1,146 @@
+import importlib.util
+import logging
+from pathlib import Path
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection, models
+from django.forms import modelform_factory
+from django_components.testing import djc_test
+
+from djc_heroicons.fields import IconField
+from djc_heroicons.forms import IconChoiceField
+from djc_heroicons.icon_ids import get_icon_by_id, get_icon_id
+from djc_heroicons.icon_ids_data import ICON_IDS, ICON_IDS_VERSION
+from djc_heroicons.icons import ICONS
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+class MenuItem(models.Model):
+    icon = IconField()
+    solid_icon = IconField(variant="solid", null=True, blank=True)
+
+    class Meta:
+        app_label = "tests"
+
+
+def _load_generator():
+    path = Path(__file__).parent.parent / "scripts" / "gen_icon_ids.py"
+    spec = importlib.util.spec_from_file_location("gen_icon_ids", path)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+@djc_test
+class TestIconIds:
+    def test_covers_all_icons(self):
+        icons = {(variant, name) for variant, variant_icons in ICONS.items() for name in variant_icons}
+        assert icons <= set(ICON_IDS.values())
+
+    def test_generated_data_up_to_date(self):
+        gen_icon_ids = _load_generator().gen_icon_ids
+        data_path = Path(__file__).parent.parent / "src" / "djc_heroicons" / "icon_ids_data.py"
+        icons = [(variant, name) for variant, variant_icons in ICONS.items() for name in variant_icons]
+
+        assert gen_icon_ids(icons, ICON_IDS, ICON_IDS_VERSION) == data_path.read_text()
+
+    def test_append_only(self):
+        namespace: dict = {}
+        icons = [("outline", "academic-cap"), ("outline", "bars-3")]
+        exec(_load_generator().gen_icon_ids(icons, {1: ("outline", "bars-3"), 2: ("solid", "old-icon")}, 3), namespace)
+
+        assert namespace["ICON_IDS_VERSION"] == 4
+        assert namespace["ICON_IDS"] == {
+            1: ("outline", "bars-3"),
+            2: ("solid", "old-icon"),
+            3: ("outline", "academic-cap"),
+        }
+
+    def test_lookups(self):
+        icon_id = get_icon_id("bars-3", "solid")
+        assert get_icon_by_id(icon_id) == ("solid", "bars-3")
+        assert get_icon_id("bars-3") != icon_id
+
+        with pytest.raises(ValueError, match="Invalid icon: outline:bars-33"):
+            get_icon_id("bars-33")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Invalid icon ID: 0"):
+            get_icon_by_id(0)
+
+
+@djc_test
+class TestIconField:
+    @pytest.fixture(autouse=True)
+    def menu_item_table(self):
+        with connection.schema_editor() as editor:
+            editor.create_model(MenuItem)
+        yield
+        with connection.schema_editor() as editor:
+            editor.delete_model(MenuItem)
+
+    def test_stores_id(self):
+        item = MenuItem.objects.create(icon="arrow-right-start-on-rectangle", solid_icon="bars-3")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT icon, solid_icon FROM tests_menuitem WHERE id = %s", [item.pk])
+            row = cursor.fetchone()
+        assert row == (get_icon_id("arrow-right-start-on-rectangle"), get_icon_id("bars-3", "solid"))
+
+        item = MenuItem.objects.get(pk=item.pk)
+        assert item.icon == "arrow-right-start-on-rectangle"
+        assert item.solid_icon == "bars-3"
+
+    def test_lookups(self):
+        MenuItem.objects.create(icon="academic-cap")
+        MenuItem.objects.create(icon="bars-3")
+
+        assert MenuItem.objects.filter(icon="bars-3").count() == 1
+        assert MenuItem.objects.filter(icon__in=["academic-cap", "bars-3"]).count() == 2
+        assert MenuItem.objects.filter(solid_icon__isnull=True).count() == 2
+        assert list(MenuItem.objects.order_by("icon").values_list("icon", flat=True)) == ["academic-cap", "bars-3"]
+
+    def test_invalid_name(self):
+        with pytest.raises(ValueError, match="Field 'icon' expected an icon name but got 'bars-33'"):
+            MenuItem.objects.create(icon="bars-33")
+
+        with pytest.raises(ValidationError, match="Invalid icon name: bars-33"):
+            MenuItem(icon="bars-33").full_clean()
+
+    def test_unknown_id_in_db(self, caplog):
+        item = MenuItem.objects.create(icon="bars-3")
+        # E.g. the icon was removed from the icon set after it was stored
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE tests_menuitem SET icon = %s WHERE id = %s", [9999, item.pk])
+
+        with caplog.at_level(logging.WARNING, logger="djc_heroicons"):
+            assert [item.icon for item in MenuItem.objects.all()] == [None]
+        messages = [record.getMessage() for record in caplog.records if record.name == "djc_heroicons"]
+        assert messages == ["Unknown icon ID 9999 in field 'icon', using None instead"]
+
+    def test_to_python(self):
+        field = MenuItem._meta.get_field("solid_icon")
+        assert field.to_python(get_icon_id("bars-3", "solid")) == "bars-3"
+        assert field.to_python("bars-3") == "bars-3"
+
+        for value in (get_icon_id("bars-3", "outline"), 9999):
+            with pytest.raises(ValidationError, match="Invalid icon name"):
+                field.to_python(value)
+
+    def test_form(self):
+        form_class = modelform_factory(MenuItem, fields=["icon", "solid_icon"])
+        form = form_class(data={"icon": "bars-3", "solid_icon": ""})
+
+        assert isinstance(form.fields["icon"], IconChoiceField)
+        assert form.fields["solid_icon"].widget.variant == "solid"
+        assert not form.fields["solid_icon"].required
+        assert form.is_valid(), form.errors
+        assert form.save().icon == "bars-3"
+
+    def test_deconstruct(self):
+        _, path, _, kwargs = MenuItem._meta.get_field("solid_icon").deconstruct()
+        assert path == "djc_heroicons.fields.IconField"
+        assert kwargs == {"variant": "solid", "null": True, "blank": True}
+        assert "variant" not in MenuItem._meta.get_field("icon").deconstruct()[3]
@@ -0,0 +1,97 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+from django.template import Context, Template
+from django.test import RequestFactory
+from django_components.testing import djc_test
+
+from djc_heroicons.context_processors import heroicons
+from djc_heroicons.fingerprints import (
+    get_icon_version,
+    get_icons_version,
+    get_markup_version,
+    get_variant_version,
+    icon_cache_key,
+)
+from djc_heroicons.fingerprints_data import ICON_VERSIONS, ICONS_VERSION, VARIANT_VERSIONS
+from djc_heroicons.icons import ICONS
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+def _load_generator():
+    path = Path(__file__).parent.parent / "scripts" / "gen_fingerprints.py"
+    spec = importlib.util.spec_from_file_location("gen_fingerprints", path)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+@djc_test
+class TestFingerprints:
+    def test_generated_data_up_to_date(self):
+        # Fails if `icons.py` was changed without running `scripts/gen_fingerprints.py`
+        gen_fingerprints = _load_generator().gen_fingerprints
+        data_path = Path(__file__).parent.parent / "src" / "djc_heroicons" / "fingerprints_data.py"
+
+        assert gen_fingerprints(ICONS) == data_path.read_text()
+
+    def test_covers_all_icons(self):
+        for variant, icons in ICONS.items():
+            assert set(ICON_VERSIONS[variant]) == set(icons)
+
+    def test_hash_depends_on_content(self):
+        gen_fingerprints = _load_generator().gen_fingerprints
+        icons = {variant: dict(icons) for variant, icons in ICONS.items()}
+        icons["solid"]["bars-3"] = [{"d": "M0 0h24v24H0z"}]
+
+        namespace: dict = {}
+        exec(gen_fingerprints(icons), namespace)
+
+        assert namespace["ICONS_VERSION"] != ICONS_VERSION
+        assert namespace["VARIANT_VERSIONS"]["outline"] == VARIANT_VERSIONS["outline"]
+        assert namespace["VARIANT_VERSIONS"]["solid"] != VARIANT_VERSIONS["solid"]
+        assert namespace["ICON_VERSIONS"]["solid"]["bars-3"] != ICON_VERSIONS["solid"]["bars-3"]
+        assert namespace["ICON_VERSIONS"]["solid"]["bars-4"] == ICON_VERSIONS["solid"]["bars-4"]
+
+    def test_getters(self):
+        assert get_icons_version() == ICONS_VERSION
+        assert get_variant_version("solid") == VARIANT_VERSIONS["solid"]
+        assert get_icon_version("bars-3", "solid") == ICON_VERSIONS["solid"]["bars-3"]
+        assert get_icon_version("bars-3") != get_icon_version("bars-3", "solid")
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError, match="Invalid variant: regular"):
+            get_variant_version("regular")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Invalid icon name: bars-33"):
+            get_icon_version("bars-33")  # type: ignore[arg-type]
+
+    def test_cache_key(self):
+        markup_version = get_markup_version()
+        assert markup_version.startswith(ICONS_VERSION)
+
+        assert icon_cache_key("sidebar", 42) == f"djc_heroicons:{markup_version}:sidebar:42"
+        icon_key = icon_cache_key("menu", name="bars-3")
+        assert icon_key.startswith(f"djc_heroicons:{ICON_VERSIONS['outline']['bars-3']}-")
+        assert icon_key.endswith(":menu")
+
+    @djc_test(django_settings={"DJC_HEROICONS": {"optimize": True, "css_variables": True}})
+    def test_markup_version_depends_on_settings(self):
+        assert get_markup_version().endswith("-oc")
+        assert icon_cache_key(name="bars-3").endswith("-oc")
+
+    def test_context_processor(self):
+        request = RequestFactory().get("/")
+        assert heroicons(request) == {"HEROICONS_VERSION": get_markup_version()}
+
+    def test_template_tag(self):
+        template_str = """
+            {% load heroicons %}
+            {% heroicons_version %}|{% heroicons_version "bars-3" "solid" %}
+        """
+        rendered = Template(template_str).render(Context()).strip()
+
+        assert rendered == f"{get_markup_version()}|{ICON_VERSIONS['solid']['bars-3']}"
@@ -0,0 +1,97 @@
+import pytest
+from django import forms
+from django.test import Client
+from django_components.testing import djc_test
+
+from djc_heroicons.forms import IconChoiceField, IconPickerWidget, get_icon_choices
+from djc_heroicons.icons import ICONS
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+class IconForm(forms.Form):
+    icon = IconChoiceField()
+
+
+@djc_test
+class TestIconChoiceField:
+    def test_valid_icon(self):
+        form = IconForm(data={"icon": "academic-cap"})
+        assert form.is_valid()
+        assert form.cleaned_data["icon"] == "academic-cap"
+
+    def test_invalid_icon(self):
+        form = IconForm(data={"icon": "academic-hat"})
+        assert not form.is_valid()
+        assert "icon" in form.errors
+
+    def test_widget_renders_only_first_page(self):
+        field = IconChoiceField(variant="solid", widget=IconPickerWidget(page_size=5))
+        rendered = field.widget.render("icon", "academic-cap")
+
+        assert rendered.count("<svg") == 5
+        assert 'data-url="/heroicons/picker/"' in rendered
+        assert 'data-variant="solid"' in rendered
+        assert 'data-next-page="2"' in rendered
+        assert 'value="academic-cap"' in rendered
+
+    def test_variant_choices(self):
+        field = IconChoiceField(variant="solid")
+        assert [value for value, _ in field.choices] == list(ICONS["solid"].keys())
+        assert get_icon_choices("solid") == [(name, name) for name in ICONS["solid"]]
+
+        with pytest.raises(ValueError, match="Invalid variant: regular"):
+            get_icon_choices("regular")  # type: ignore[arg-type]
+
+    def test_variant_from_widget(self):
+        field = IconChoiceField(widget=IconPickerWidget(variant="solid"))
+        assert field.variant == "solid"
+        assert isinstance(field.widget, IconPickerWidget)
+        assert field.widget.variant == "solid"
+
+        field = IconChoiceField(variant="outline", widget=IconPickerWidget(variant="solid"))
+        assert field.variant == "outline"
+        assert isinstance(field.widget, IconPickerWidget)
+        assert field.widget.variant == "outline"
+
+    def test_widget_media(self):
+        media = str(IconForm().media)
+        assert "djc_heroicons/icon_picker.js" in media
+        assert "djc_heroicons/icon_picker.css" in media
+
+
+@djc_test
+class TestIconPickerView:
+    def test_pages(self):
+        client = Client()
+        icon_names = list(ICONS["outline"].keys())
+
+        resp = client.get("/heroicons/picker/", {"page": 2})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [icon["name"] for icon in data["icons"]] == icon_names[48:96]
+        assert data["icons"][0]["svg"].startswith("<svg")
+        assert data["next_page"] == 3
+
+        resp = client.get("/heroicons/picker/", {"page": 100})
+        assert resp.json() == {"icons": [], "next_page": None}
+
+    def test_query(self):
+        client = Client()
+        resp = client.get("/heroicons/picker/", {"variant": "solid", "q": "ellipsis"})
+        data = resp.json()
+        assert sorted(icon["name"] for icon in data["icons"]) == [
+            "chat-bubble-left-ellipsis",
+            "chat-bubble-oval-left-ellipsis",
+            "ellipsis-horizontal",
+            "ellipsis-horizontal-circle",
+            "ellipsis-vertical",
+        ]
+        assert data["next_page"] is None
+
+    def test_invalid_params(self):
+        client = Client()
+        assert client.get("/heroicons/picker/", {"variant": "invalid"}).status_code == 400
+        assert client.get("/heroicons/picker/", {"page": "abc"}).status_code == 400
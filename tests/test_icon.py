@@ -1,9 +1,13 @@
+from unittest.mock import patch
+
 import pytest
 from django.template import Context, Library, Template
 from django_components import Component, ComponentRegistry, NotRegistered, registry as djc_registry, types
 from django_components.testing import djc_test
 
+from djc_heroicons import render_icon
 from djc_heroicons.apps import register_icon_component
+from djc_heroicons.components.icon import create_icon_preset
 
 from .testutils import setup_test_config
 
@@ -153,3 +157,53 @@ class TestIcon:
             Template(template_str).render(Context())
 
         assert issubclass(custom_registry.get("icon"), Component)
+
+
+PRESETS = {
+    "button_icon": {"variant": "solid", "size": 16, "static": True},
+    "nav_icon": {"size": 20, "static": True, "attrs": {"class": "nav-icon"}},
+}
+
+
+@djc_test
+class TestIconPresets:
+    @djc_test(django_settings={"DJC_HEROICONS": {"presets": PRESETS}})
+    def test_presets(self):
+        register_icon_component()
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "button_icon" name="check" / %}
+            {% component "nav_icon" name="home" / %}
+            {% component "nav_icon" name="home" size=24 attrs:data-id="1" / %}
+        """
+        rendered = Template(template_str).render(Context())
+
+        assert rendered.split() == [
+            *render_icon("check", variant="solid", size=16).split(),
+            *render_icon("home", size=20, class_="nav-icon").split(),
+            *render_icon("home", size=24, class_="nav-icon", data_id="1").split(),
+        ]
+
+    @djc_test(django_settings={"DJC_HEROICONS": {"presets": PRESETS}})
+    def test_preset_attrs_cached(self):
+        register_icon_component()
+
+        template_str: types.django_html = """
+            {% load component_tags %}
+            {% component "nav_icon" name="home" / %}
+        """
+        Template(template_str).render(Context())
+        with patch("djc_heroicons.render._format_svg") as format_svg:
+            Template(template_str).render(Context())
+        format_svg.assert_not_called()
+
+    def test_invalid_preset(self):
+        with pytest.raises(ValueError, match="Invalid icon preset 'x': Unknown inputs name, sizee"):
+            create_icon_preset("x", {"name": "check", "sizee": 16})
+        with pytest.raises(ValueError, match="Invalid icon preset 'x': Invalid variant: mini"):
+            create_icon_preset("x", {"variant": "mini"})
+        with pytest.raises(
+            ValueError, match="Invalid icon preset 'x': Value of attribute 'class' must be hashable, got list"
+        ):
+            create_icon_preset("x", {"attrs": {"class": ["btn-icon", "h-4"]}})
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import djc_heroicons
+from djc_heroicons.components.icon import Icon
+from djc_heroicons.render import render_icon
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def get_imported_modules(code: str) -> set:
+    """Run the code in a fresh interpreter, and return the names of the modules it imported."""
+    script = f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); {code}; print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    def test_icons_import_without_django(self):
+        modules = get_imported_modules("import djc_heroicons.icons")
+
+        assert "djc_heroicons.icons" in modules
+        assert "django" not in modules
+        assert "django_components" not in modules
+
+    def test_public_api(self):
+        assert djc_heroicons.Icon is Icon
+        assert djc_heroicons.render_icon is render_icon
+        assert set(djc_heroicons.__all__) <= set(dir(djc_heroicons))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="module 'djc_heroicons' has no attribute 'Iconn'"):
+            djc_heroicons.Iconn
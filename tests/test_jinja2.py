@@ -0,0 +1,54 @@
+import re
+from typing import TYPE_CHECKING
+
+import pytest
+from django.template import Context, Template
+from django_components.testing import djc_test
+
+from djc_heroicons import render_icon
+
+from .testutils import setup_test_config
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+setup_test_config()
+
+jinja2 = pytest.importorskip("jinja2")
+
+from djc_heroicons.jinja2 import HeroIconsExtension  # noqa: E402
+
+# Render ID differs for each render, so it's removed before comparing the outputs
+RENDER_ID_RE = re.compile(r" data-djc-id-\w+=\"\"")
+
+
+def get_environment() -> "Environment":
+    return jinja2.Environment(extensions=[HeroIconsExtension], autoescape=True)
+
+
+@djc_test
+class TestJinja2:
+    def test_same_as_component(self):
+        component_str = """
+            {% load component_tags %}
+            {% component "icon" name="ellipsis-vertical" variant="solid" size=20 attrs:class="self-center" / %}
+        """
+        jinja_str = '{{ heroicon("ellipsis-vertical", variant="solid", size=20, class_="self-center") }}'
+
+        component_rendered = RENDER_ID_RE.sub("", Template(component_str).render(Context())).strip()
+        jinja_rendered = get_environment().from_string(jinja_str).render()
+
+        assert jinja_rendered == component_rendered
+
+    def test_variables_and_attrs(self):
+        template = get_environment().from_string('{{ heroicon(name, attrs={"id": "menu"}, aria_label=label) }}')
+        rendered = template.render(name="bars-3", label="<Menu>")
+
+        assert rendered == render_icon("bars-3", id="menu", aria_label="<Menu>")
+        assert 'aria-label="&lt;Menu&gt;"' in rendered
+
+    def test_invalid_name(self):
+        template = get_environment().from_string('{{ heroicon("ellipsis-invalid") }}')
+
+        with pytest.raises(ValueError, match="Invalid icon name: ellipsis-invalid"):
+            template.render()
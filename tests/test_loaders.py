@@ -0,0 +1,134 @@
+from unittest.mock import patch
+
+from django.template import Context, Engine, Template
+from django.test import override_settings
+from django_components import ComponentNode
+from django_components.testing import djc_test
+
+from djc_heroicons import Icon, render_icon
+from djc_heroicons.apps import register_icon_component
+from djc_heroicons.loaders import FoldedIconComponentNode, fold_icon_components
+from djc_heroicons.render import _rendered_icons
+from djc_heroicons.signals import icon_rendered
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+def get_component_nodes(template: Template) -> list:
+    return list(template.nodelist.get_nodes_by_type(ComponentNode)) + [
+        node for node in template.nodelist if isinstance(node, FoldedIconComponentNode)
+    ]
+
+
+def make_engine(templates: dict) -> Engine:
+    return Engine(
+        loaders=[("djc_heroicons.loaders.Loader", [("django.template.loaders.locmem.Loader", templates)])],
+        libraries={"component_tags": "django_components.templatetags.component_tags"},
+    )
+
+
+@djc_test(django_settings={"DJC_HEROICONS": {"static_markup": True}})
+class TestFoldIconComponents:
+    def test_literal_inputs_are_folded(self):
+        template = Template("""
+            {% load component_tags %}
+            {% component "icon" name="bars-3" variant="solid" size=16 attrs:class="h-4" / %}
+        """)
+        fold_icon_components(template.nodelist)
+        [node] = get_component_nodes(template)
+
+        assert isinstance(node, FoldedIconComponentNode)
+        first = template.render(Context())
+        with patch("djc_heroicons.components.icon.render_icon_svg") as render_icon_svg:
+            second = template.render(Context())
+        render_icon_svg.assert_not_called()
+        assert first == second
+        assert first.strip() == render_icon("bars-3", variant="solid", size=16, class_="h-4")
+
+    def test_other_inputs_are_not_folded(self):
+        template = Template("""
+            {% load component_tags %}
+            {% component "icon" name=name / %}
+            {% component "icon" name="bars-3" size=size / %}
+            {% component "icon" name="bars-3"|lower / %}
+            {% component "icon" name="bars-3" static=False / %}
+            {% component "icon" name="bars-3" ...icon_kwargs / %}
+        """)
+        fold_icon_components(template.nodelist)
+
+        assert all(type(node) is not FoldedIconComponentNode for node in get_component_nodes(template))
+        rendered = template.render(Context({"name": "bars-3", "size": 16, "icon_kwargs": {"size": 20}}))
+        assert rendered.count("<svg") == 5
+
+    def test_nested_tags(self):
+        template = Template("""
+            {% load component_tags %}
+            {% if show %}{% component "icon" name="check" / %}{% else %}{% component "icon" name="x-mark" / %}{% endif %}
+            {% for item in items %}{% component "icon" name="bars-3" / %}{% endfor %}
+        """)  # noqa: E501
+        fold_icon_components(template.nodelist)
+
+        assert len(template.nodelist.get_nodes_by_type(FoldedIconComponentNode)) == 3
+        assert template.nodelist.get_nodes_by_type(ComponentNode) == []
+        rendered = template.render(Context({"show": True, "items": [1, 2]}))
+        assert rendered.split() == (render_icon("check") + "\n" + render_icon("bars-3") * 2).split()
+
+    @djc_test(
+        django_settings={
+            "DJC_HEROICONS": {"static_markup": True, "presets": {"nav_icon": {"size": 20, "attrs": {"class": "nav"}}}}
+        }
+    )
+    def test_presets(self):
+        register_icon_component()
+        template = Template("""{% load component_tags %}{% component "nav_icon" name="home" / %}""")
+        fold_icon_components(template.nodelist)
+
+        assert isinstance(template.nodelist[1], FoldedIconComponentNode)
+        assert template.render(Context()) == render_icon("home", size=20, class_="nav")
+
+    def test_rendered_by_component_without_static_markup(self):
+        template = Template("""{% load component_tags %}{% component "icon" name="bars-3" / %}""")
+        fold_icon_components(template.nodelist)
+        assert isinstance(template.nodelist[1], FoldedIconComponentNode)
+
+        with override_settings(DJC_HEROICONS={"static_markup": False}):
+            rendered = template.render(Context())
+        assert "data-djc-id-" in rendered
+        assert template.render(Context()) == render_icon("bars-3")
+
+    def test_sends_signal_and_counted_by_budget(self):
+        template = Template("""{% load component_tags %}{% component "icon" name="bars-3" size=16 / %}""")
+        fold_icon_components(template.nodelist)
+        template.render(Context())
+
+        calls = []
+
+        def receiver(sender, **kwargs):
+            calls.append((sender, kwargs))
+
+        icons: list = []
+        icon_rendered.connect(receiver)
+        token = _rendered_icons.set(icons)
+        try:
+            rendered = template.render(Context())
+        finally:
+            _rendered_icons.reset(token)
+            icon_rendered.disconnect(receiver)
+
+        assert icons == [rendered]
+        [(sender, data)] = calls
+        assert sender is Icon
+        assert data["kwargs"]["name"] == "bars-3"
+        assert data["kwargs"]["size"] == 16
+        assert data["html"] == rendered
+
+    def test_loader(self):
+        engine = make_engine({"page.html": """{% load component_tags %}{% component "icon" name="bars-3" / %}"""})
+
+        template = engine.get_template("page.html")
+        assert isinstance(template.nodelist[1], FoldedIconComponentNode)
+        # Compiled and folded only once
+        assert engine.get_template("page.html") is template
+        assert template.render(Context()) == render_icon("bars-3")
@@ -0,0 +1,113 @@
+import logging
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory
+from django_components.testing import djc_test
+
+from djc_heroicons import render_icon
+from djc_heroicons.middleware import IconBudgetMiddleware, measure_icon_bytes
+from djc_heroicons.render import _rendered_icons
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+def _make_view(icon_count: int, padding: int):
+    def view(request):
+        icons = "".join(render_icon("bars-3", size=16 + index % 2) for index in range(icon_count))
+        return HttpResponse(f"<html><body>{'x' * padding}{icons}</body></html>")
+
+    return view
+
+
+@djc_test
+class TestMeasureIconBytes:
+    def test_measure(self):
+        icon = render_icon("bars-3")
+        other = render_icon("check")
+        content = f"<p>Hello</p>{icon}{icon}<p>World</p>".encode()
+
+        report = measure_icon_bytes(content, [icon, icon, other])
+        assert report.icon_count == 2
+        assert report.icon_bytes == 2 * len(icon.encode())
+        assert report.response_bytes == len(content)
+        assert 0 < report.gzip_icon_bytes < report.icon_bytes
+        assert report.share == report.icon_bytes / len(content)
+
+    def test_no_icons(self):
+        report = measure_icon_bytes(b"<p>Hello</p>", [render_icon("bars-3")])
+        assert report.icon_count == 0
+        assert report.share == 0
+        assert report.gzip_icon_bytes == 0
+
+
+@djc_test
+class TestIconBudgetMiddleware:
+    def test_within_budget(self, caplog):
+        middleware = IconBudgetMiddleware(_make_view(icon_count=2, padding=20_000))
+        response = middleware(RequestFactory().get("/page/"))
+
+        assert response["Server-Timing"].startswith('heroicons;desc="2 icons, ')
+        assert not [record for record in caplog.records if record.name == "djc_heroicons"]
+
+    def test_over_budget(self, caplog):
+        middleware = IconBudgetMiddleware(_make_view(icon_count=20, padding=100))
+        with caplog.at_level(logging.WARNING, logger="djc_heroicons"):
+            response = middleware(RequestFactory().get("/page/"))
+
+        assert "20 icons" in response["Server-Timing"]
+        messages = [record.getMessage() for record in caplog.records if record.name == "djc_heroicons"]
+        assert len(messages) == 1
+        assert messages[0].startswith("Icons take ")
+        assert "of the response to /page/ (20 icons" in messages[0]
+        assert messages[0].endswith("over the budget of 25.0%")
+
+    def test_component_icons(self, caplog):
+        template_str = """
+            {% load component_tags %}
+            <html><body>
+            {% for index in indices %}
+                {% component "icon" name="bars-3" size=16 / %}
+            {% endfor %}
+            </body></html>
+        """
+        template = Template(template_str)
+
+        def view(request):
+            return HttpResponse(template.render(Context({"indices": range(20)})))
+
+        with caplog.at_level(logging.WARNING, logger="djc_heroicons"):
+            response = IconBudgetMiddleware(view)(RequestFactory().get("/page/"))
+
+        assert "20 icons" in response["Server-Timing"]
+        messages = [record.getMessage() for record in caplog.records if record.name == "djc_heroicons"]
+        assert len(messages) == 1
+        assert "(20 icons" in messages[0]
+
+    @djc_test(django_settings={"DJC_HEROICONS": {"byte_budget": 0.99}})
+    def test_custom_budget(self, caplog):
+        middleware = IconBudgetMiddleware(_make_view(icon_count=20, padding=100))
+        middleware(RequestFactory().get("/page/"))
+
+        assert not [record for record in caplog.records if record.name == "djc_heroicons"]
+
+    def test_skips_other_responses(self):
+        def json_view(request):
+            render_icon("bars-3")
+            return HttpResponse("{}", content_type="application/json")
+
+        def streaming_view(request):
+            render_icon("bars-3")
+            return StreamingHttpResponse(iter([b"<html></html>"]))
+
+        for view in (json_view, streaming_view, _make_view(icon_count=0, padding=10)):
+            response = IconBudgetMiddleware(view)(RequestFactory().get("/"))
+            assert not response.has_header("Server-Timing")
+
+    def test_collects_only_during_request(self):
+        middleware = IconBudgetMiddleware(_make_view(icon_count=1, padding=10))
+        middleware(RequestFactory().get("/"))
+
+        assert _rendered_icons.get() is None
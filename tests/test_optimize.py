@@ -0,0 +1,78 @@
+from django.template import Context, Template
+from django_components.testing import djc_test
+
+from djc_heroicons.icons import ICONS
+from djc_heroicons.optimize import get_optimized_icon, optimize_icon
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+class TestOptimizeIcon:
+    def test_merges_outline_paths(self):
+        icon = get_optimized_icon("outline", "camera")
+        orig_paths = ICONS["outline"]["camera"]
+
+        assert len(orig_paths) == 2
+        assert icon.svg_attrs == {"stroke-linecap": "round", "stroke-linejoin": "round"}
+        assert icon.paths == [{"d": orig_paths[0]["d"] + orig_paths[1]["d"]}]
+
+    def test_does_not_merge_solid_paths(self):
+        orig_paths = ICONS["solid"]["camera"]
+        icon = get_optimized_icon("solid", "camera")
+
+        assert len(icon.paths) == len(orig_paths)
+
+    def test_hoists_only_shared_attrs(self):
+        icon = optimize_icon(
+            "solid",
+            [
+                {"fill-rule": "evenodd", "clip-rule": "evenodd", "d": "M1 1h2"},
+                {"d": "M3 3h2"},
+            ],
+        )
+        assert icon.svg_attrs == {}
+        assert icon.paths[0] == {"fill-rule": "evenodd", "clip-rule": "evenodd", "d": "M1 1h2"}
+
+    def test_relative_moveto(self):
+        icon = optimize_icon(
+            "outline",
+            [
+                {"stroke-linecap": "round", "d": "M1 1h2"},
+                # Relative moveto with a single pair is made absolute
+                {"stroke-linecap": "round", "d": "m3 3h2"},
+                # Relative moveto with implicit lineto can't be merged
+                {"stroke-linecap": "round", "d": "m5 5 1 1"},
+                {"stroke-linecap": "round", "stroke-linejoin": "round", "d": "M7 7h2"},
+            ],
+        )
+        assert icon.svg_attrs == {"stroke-linecap": "round"}
+        assert icon.paths == [
+            {"d": "M1 1h2M3 3h2"},
+            {"d": "m5 5 1 1"},
+            {"stroke-linejoin": "round", "d": "M7 7h2"},
+        ]
+
+    def test_reduces_path_count(self):
+        for variant, icons in ICONS.items():
+            for name, paths in icons.items():
+                icon = get_optimized_icon(variant, name)
+                assert 1 <= len(icon.paths) <= len(paths)
+                # No path data is lost
+                assert sum(len(p["d"]) for p in icon.paths) == sum(len(p["d"]) for p in paths)
+
+
+@djc_test(django_settings={"DJC_HEROICONS": {"optimize": True}})
+def test_icon_optimized():
+    template_str = """
+        {% load component_tags %}
+        {% component "icon" name="camera" / %}
+    """
+    rendered: str = Template(template_str).render(Context())
+
+    assert rendered.count("<path") == 1
+    assert (
+        '<svg viewBox="0 0 24 24" aria-hidden="true" fill="none" stroke="currentColor" stroke-width="1.5" '
+        'stroke-linecap="round" stroke-linejoin="round" style="width: 24px; height: 24px;"'
+    ) in rendered
@@ -0,0 +1,230 @@
+import json
+import re
+import time
+
+import pytest
+from django.template import Context, Template
+from django_components import Component
+from django_components.testing import djc_test
+
+from djc_heroicons import render_icon
+from djc_heroicons.bundle import get_bundle_key, get_icon_bundle
+from djc_heroicons.render import INVALID_ICONS_CACHE_SIZE, FrozenAttrs, _invalid_icons, icon_css_vars
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+# Render ID differs for each render, so it's removed before comparing the outputs
+RENDER_ID_RE = re.compile(r" data-djc-id-\w+=\"\"")
+
+
+@djc_test
+class TestRenderIcon:
+    def test_same_as_component(self):
+        template_str = """
+            {% load component_tags %}
+            {% component "icon"
+                name="camera"
+                variant="solid"
+                size=32
+                color="red"
+                attrs:class="self-center"
+                attrs:data-id="123"
+            / %}
+        """
+        rendered = RENDER_ID_RE.sub("", Template(template_str).render(Context())).strip()
+
+        svg = render_icon("camera", variant="solid", size=32, color="red", class_="self-center", data_id="123")
+        assert svg == rendered
+
+    def test_default(self):
+        assert render_icon("ellipsis-vertical") == (
+            '<svg viewBox="0 0 24 24" aria-hidden="true" fill="none" stroke="currentColor" stroke-width="1.5" style="width: 24px; height: 24px;">\n'  # noqa: E501
+            "            \n"
+            '                <path stroke-linecap="round" stroke-linejoin="round" d="M12 6.75a.75.75 0 1 1 0-1.5.75.75 0 0 1 0 1.5ZM12 12.75a.75.75 0 1 1 0-1.5.75.75 0 0 1 0 1.5ZM12 18.75a.75.75 0 1 1 0-1.5.75.75 0 0 1 0 1.5Z" />\n'  # noqa: E501
+            "            \n"
+            "        </svg>"
+        )
+
+    def test_overrides_default_attrs(self):
+        svg = render_icon("check", **{"aria-hidden": "false", "style": "color: red"})  # type: ignore[arg-type]
+        assert 'aria-hidden="false"' in svg
+        assert 'style="color: red;"' in svg
+
+    def test_escapes_attrs(self):
+        svg = render_icon("check", color='"><script>')
+        assert "<script>" not in svg
+        assert 'stroke="&quot;&gt;&lt;script&gt;"' in svg
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Invalid variant: invalid"):
+            render_icon("check", variant="invalid")  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match="Invalid icon name: checkk. Did you mean any of 'check'"):
+            render_icon("checkk")  # type: ignore[arg-type]
+
+    def test_frozen_attrs_hash(self):
+        attrs = FrozenAttrs({"class": "h-4", "data-id": "1"})
+        reordered = FrozenAttrs({"data-id": "1", "class": "h-4"})
+
+        assert attrs == reordered
+        assert hash(attrs) == hash(reordered)
+
+    def test_fast_path(self):
+        start = time.perf_counter()
+        for index in range(10_000):
+            render_icon("check", size=16 + index % 4)
+        # Cached renders take microseconds each
+        assert time.perf_counter() - start < 1
+
+
+@djc_test(django_settings={"DJC_HEROICONS": {"css_variables": True}})
+class TestCssVariables:
+    def test_same_markup_for_all_params(self):
+        svg = render_icon("check")
+        assert render_icon("check", size=16, color="red", stroke_width=2) == svg
+        assert svg.startswith(
+            '<svg viewBox="0 0 24 24" aria-hidden="true" fill="none" style="width: var(--heroicon-size, 24px); '
+            "height: var(--heroicon-size, 24px); stroke: var(--heroicon-color, currentColor); "
+            'stroke-width: var(--heroicon-stroke-width, 1.5);">'
+        )
+
+    def test_solid(self):
+        svg = render_icon("check", variant="solid", color="red")
+        assert 'stroke="none"' in svg
+        assert "fill: var(--heroicon-color, currentColor);" in svg
+
+    def test_component(self):
+        template_str = """
+            {% load component_tags %}
+            {% component "icon" name="check" size=16 color="red" / %}
+        """
+        rendered = RENDER_ID_RE.sub("", Template(template_str).render(Context())).strip()
+        assert rendered == render_icon("check")
+
+    def test_icon_css_vars(self):
+        assert icon_css_vars() == ""
+        assert icon_css_vars(size=16, color="red", stroke_width=2) == (
+            "--heroicon-size: 16px; --heroicon-color: red; --heroicon-stroke-width: 2"
+        )
+
+
+@djc_test(django_settings={"DJC_HEROICONS": {"fallback_icon": "question-mark-circle"}})
+class TestFallbackIcon:
+    def test_renders_fallback(self):
+        svg = render_icon("no-such-icon", variant="solid", size=16, class_="p-4")  # type: ignore[arg-type]
+        assert svg == render_icon("question-mark-circle", variant="solid", size=16, class_="p-4")
+
+    def test_invalid_variant(self):
+        svg = render_icon("check", variant="invalid")  # type: ignore[arg-type]
+        assert svg == render_icon("question-mark-circle")
+
+    def test_component(self):
+        template_str = """
+            {% load component_tags %}
+            {% component "icon" name="no-such-icon" / %}
+        """
+        rendered = RENDER_ID_RE.sub("", Template(template_str).render(Context())).strip()
+        assert rendered == render_icon("question-mark-circle")
+
+    @djc_test(django_settings={"DJC_HEROICONS": {"fallback_icon": ""}})
+    def test_renders_nothing(self):
+        assert render_icon("no-such-icon") == ""  # type: ignore[arg-type]
+
+    def test_logs_once(self, caplog):
+        for _ in range(3):
+            render_icon("checkkk")  # type: ignore[arg-type]
+
+        records = [record for record in caplog.records if record.name == "djc_heroicons"]
+        assert len(records) == 1
+        assert records[0].getMessage() == "Invalid icon name: checkkk. Did you mean any of 'check'?"
+
+    def test_cache_is_bounded(self):
+        for index in range(INVALID_ICONS_CACHE_SIZE + 10):
+            render_icon(f"missing-{index}")  # type: ignore[arg-type]
+
+        assert len(_invalid_icons) == INVALID_ICONS_CACHE_SIZE
+        assert ("outline", "missing-0") not in _invalid_icons
+
+
+@djc_test(django_settings={"DJC_HEROICONS": {"static_markup": True}})
+class TestStaticMarkup:
+    def test_no_render_id(self):
+        template_str = """
+            {% load component_tags %}
+            {% component "icon" name="check" size=16 attrs:class="p-4" / %}
+        """
+        template = Template(template_str)
+        rendered = template.render(Context()).strip()
+
+        assert rendered == render_icon("check", size=16, class_="p-4")
+        assert "data-djc-id" not in rendered
+        # Same kwargs give the same HTML
+        assert template.render(Context()).strip() == rendered
+
+    def test_nested_in_component(self):
+        class Button(Component):
+            template = """
+                {% load component_tags %}
+                <button>{% component "icon" name="check" / %}</button>
+            """
+
+        rendered = Button.render()
+        assert rendered.count("<svg") == 1
+        # Only the button has the ID
+        assert rendered.count("data-djc-id") == 1
+        assert f"{render_icon('check')}</button>" in rendered
+
+    def test_per_call(self):
+        template_str = """
+            {% load component_tags %}
+            {% component "icon" name="check" static=False / %}
+        """
+        assert "data-djc-id" in Template(template_str).render(Context())
+
+
+@djc_test
+class TestStaticMarkupPerCall:
+    def test_static_kwarg(self):
+        template_str = """
+            {% load component_tags %}
+            {% component "icon" name="check" static=True / %}
+        """
+        assert Template(template_str).render(Context()).strip() == render_icon("check")
+
+
+@djc_test
+class TestDeferred:
+    def test_placeholder_without_paths(self):
+        svg = render_icon("bars-3", variant="solid", size=16, class_="h-4")
+        placeholder = render_icon("bars-3", variant="solid", size=16, class_="h-4", deferred=True)
+
+        assert "<path" not in placeholder
+        assert 'data-heroicon="solid:bars-3"' in placeholder
+        # Same attributes as the full icon, so the placeholder takes the same space
+        assert placeholder.replace(' data-heroicon="solid:bars-3"', "") == svg.split(">")[0] + "></svg>"
+
+    def test_placeholder_from_bundle_paths(self):
+        svg = render_icon("bars-3")
+        bundle = json.loads(get_icon_bundle(get_bundle_key([("outline", "bars-3")])).body)
+        bundle_svg = bundle["icons"]["outline:bars-3"]
+
+        # Filling the placeholder with the paths of the bundled icon gives the full icon
+        start, end = bundle_svg.index(">") + 1, bundle_svg.rindex("</svg>")
+        paths = bundle_svg[start:end]
+        placeholder = render_icon("bars-3", deferred=True).replace(' data-heroicon="outline:bars-3"', "")
+        assert placeholder.replace("></svg>", f">{paths}</svg>") == svg
+
+    def test_tag_and_component(self):
+        template_str = """
+            {% load component_tags heroicons %}
+            {% component "icon" name="check" deferred=True static=True / %}
+            {% icon "check" deferred=True %}
+        """
+        placeholder = render_icon("check", deferred=True)
+        assert Template(template_str).render(Context()).split() == placeholder.split() * 2
+
+    def test_invalid_name(self):
+        with pytest.raises(ValueError, match="Invalid icon name: checkk"):
+            render_icon("checkk", deferred=True)  # type: ignore[arg-type]
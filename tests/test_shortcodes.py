@@ -0,0 +1,59 @@
+from unittest.mock import patch
+
+from django.template import Context, Template
+from django.utils.safestring import SafeString, mark_safe
+from django_components.testing import djc_test
+
+from djc_heroicons import render_icon
+from djc_heroicons.shortcodes import render_shortcodes
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+@djc_test
+class TestRenderShortcodes:
+    def test_replaces_shortcodes(self):
+        rendered = render_shortcodes("Done :solid:check-circle:, menu :bars-3-bottom-left: and :bars-3:.")
+
+        assert rendered == (
+            f"Done {render_icon('check-circle', variant='solid')}, "
+            f"menu {render_icon('bars-3-bottom-left')} and {render_icon('bars-3')}."
+        )
+
+    def test_kwargs(self):
+        rendered = render_shortcodes(":check:", variant="solid", size=16, class_="inline")
+
+        assert rendered == render_icon("check", variant="solid", size=16, class_="inline")
+
+    def test_leaves_other_text(self):
+        text = "At 10:30: :not-an-icon: :outline: :bold:check: :solid:x:"
+
+        assert render_shortcodes(text) == f"At 10:30: :not-an-icon: :outline: {render_icon('bold')}check: :solid:x:"
+
+    def test_renders_each_icon_once(self):
+        with patch("djc_heroicons.shortcodes.render_icon_svg", return_value="<svg />") as render_icon_svg:
+            rendered = render_shortcodes(":check: :check: :solid:check: :check:")
+
+        assert rendered == "<svg /> <svg /> <svg /> <svg />"
+        assert render_icon_svg.call_count == 2
+
+    def test_keeps_safe_string(self):
+        assert isinstance(render_shortcodes(mark_safe("<b>:check:</b>")), SafeString)
+        assert not isinstance(render_shortcodes("<b>:check:</b>"), SafeString)
+
+
+@djc_test
+class TestShortcodesFilter:
+    def test_escapes_text(self):
+        template = Template("{% load heroicons %}{{ text|icon_shortcodes:16 }}")
+        rendered = template.render(Context({"text": "<b>Done</b> :check:"}))
+
+        assert rendered == f"&lt;b&gt;Done&lt;/b&gt; {render_icon('check', size=16)}"
+
+    def test_safe_text(self):
+        template = Template("{% load heroicons %}{{ text|icon_shortcodes }}")
+        rendered = template.render(Context({"text": mark_safe("<b>Done</b> :check:")}))
+
+        assert rendered == f"<b>Done</b> {render_icon('check')}"
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import pytest
+from django.http import HttpResponse
+from django.template import Context, Engine, Template
+from django_components.testing import djc_test
+
+from djc_heroicons import Icon
+from djc_heroicons.signals import icon_rendered
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+
+@djc_test
+class TestIconRenderedSignal:
+    def test_sent_on_render(self):
+        calls = []
+
+        def receiver(sender, **kwargs):
+            calls.append((sender, kwargs))
+
+        icon_rendered.connect(receiver)
+        try:
+            Template("""
+                {% load component_tags %}
+                {% component "icon" name="check" size=16 / %}
+                {% component "icon" name="check" variant="solid" / %}
+                """).render(Context())
+        finally:
+            icon_rendered.disconnect(receiver)
+
+        assert len(calls) == 2
+        sender, data = calls[0]
+        assert sender is Icon
+        assert data["kwargs"]["name"] == "check"
+        assert data["kwargs"]["size"] == 16
+        assert data["data_time"] >= 0
+        assert data["render_time"] >= 0
+        assert "<svg" in data["html"]
+        assert calls[1][1]["kwargs"]["variant"] == "solid"
+
+
+@djc_test
+class TestIconsPanel:
+    def test_panel_stats(self):
+        pytest.importorskip("debug_toolbar")
+        from djc_heroicons.panels import IconsPanel
+
+        toolbar = SimpleNamespace(stats={}, request_id="test", store=SimpleNamespace(save_panel=lambda *args: None))
+        panel = IconsPanel(toolbar, lambda request: HttpResponse())
+
+        panel.enable_instrumentation()
+        try:
+            html = Template("""
+                {% load component_tags %}
+                {% component "icon" name="check" / %}
+                {% component "icon" name="check" / %}
+                {% component "icon" name="bolt" / %}
+                """).render(Context())
+        finally:
+            panel.disable_instrumentation()
+
+        # Icons rendered after the instrumentation is disabled are not recorded
+        Icon.render(kwargs={"name": "bolt"})
+
+        panel.generate_stats(None, HttpResponse(html))
+        stats = panel.get_stats()
+
+        assert stats["count"] == 3
+        assert [icon["kwargs"].split(",")[0] for icon in stats["icons"]] == [
+            "name='check'",
+            "name='check'",
+            "name='bolt'",
+        ]
+        assert len(stats["duplicates"]) == 1
+        assert stats["duplicates"][0][1] == 2
+        assert 0 < stats["total_bytes"] <= stats["response_bytes"]
+        assert stats["total_time"] == pytest.approx(stats["total_data_time"] + stats["total_render_time"])
+
+        content = Engine(app_dirs=True).get_template(IconsPanel.template).render(Context(stats))
+        assert "name=&#x27;bolt&#x27;" in content
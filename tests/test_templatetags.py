@@ -0,0 +1,121 @@
+import re
+from unittest.mock import patch
+
+import pytest
+from django.template import Context, Template
+from django.template.library import SimpleNode
+from django.test import override_settings
+from django_components.testing import djc_test
+
+from djc_heroicons import render_icon
+from djc_heroicons.render import _rendered_icons
+from djc_heroicons.templatetags.heroicons import FoldedIconNode
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+# Render ID differs for each render, so it's removed before comparing the outputs
+RENDER_ID_RE = re.compile(r" data-djc-id-\w+=\"\"")
+
+
+@djc_test
+class TestIconTag:
+    def test_same_as_component(self):
+        component_str = """
+            {% load component_tags %}
+            {% component "icon"
+                name="ellipsis-vertical"
+                variant="solid"
+                size=20
+                color="red"
+                attrs:class="self-center"
+                attrs:data-id="123"
+            / %}
+        """
+        tag_str = """
+            {% load heroicons %}
+            {% icon "ellipsis-vertical" variant="solid" size=20 color="red" class="self-center" data_id="123" %}
+        """
+        component_rendered = RENDER_ID_RE.sub("", Template(component_str).render(Context())).strip()
+        tag_rendered = Template(tag_str).render(Context()).strip()
+
+        assert tag_rendered == component_rendered
+
+    def test_variables_and_attrs(self):
+        template_str = """
+            {% load heroicons %}
+            {% icon name stroke_width=2 attrs=svg_attrs aria_label="Menu" %}
+        """
+        rendered = Template(template_str).render(
+            Context({"name": "bars-3", "svg_attrs": {"id": "menu", "aria-hidden": "false"}})
+        )
+
+        assert rendered.strip().startswith(
+            '<svg viewBox="0 0 24 24" aria-hidden="false" fill="none" stroke="currentColor" stroke-width="2" '
+            'id="menu" aria-label="Menu" style="width: 24px; height: 24px;">'
+        )
+
+    def test_invalid_name(self):
+        template_str = """
+            {% load heroicons %}
+            {% icon "ellipsis-invalid" %}
+        """
+        with pytest.raises(ValueError, match="Invalid icon name: ellipsis-invalid"):
+            Template(template_str).render(Context())
+
+
+def get_icon_nodes(template: Template) -> list:
+    return [node for node in template.nodelist if isinstance(node, (FoldedIconNode, SimpleNode))]
+
+
+@djc_test
+class TestFoldedIconTag:
+    def test_literal_args_are_folded(self):
+        template = Template("""{% load heroicons %}{% icon "bars-3" variant="solid" size=16 class="h-4" %}""")
+        [node] = get_icon_nodes(template)
+
+        assert isinstance(node, FoldedIconNode)
+        first = template.render(Context())
+        with patch("djc_heroicons.templatetags.heroicons.render_icon_svg") as render_icon_svg:
+            second = template.render(Context())
+        render_icon_svg.assert_not_called()
+        assert first == second == render_icon("bars-3", variant="solid", size=16, class_="h-4")
+
+    def test_variable_args_are_not_folded(self):
+        template = Template("""
+            {% load heroicons %}
+            {% icon name %}
+            {% icon "bars-3" size=size %}
+            {% icon "bars-3"|lower %}
+            {% icon "bars-3" as menu_icon %}
+        """)
+
+        assert all(isinstance(node, SimpleNode) for node in get_icon_nodes(template))
+        assert template.render(Context({"name": "bars-3", "size": 16})).count("<svg") == 3
+
+    def test_invalid_icon_raises_on_render(self):
+        template = Template("""{% load heroicons %}{% icon "ellipsis-invalid" %}""")
+
+        with pytest.raises(ValueError, match="Invalid icon name: ellipsis-invalid"):
+            template.render(Context())
+
+    def test_rerendered_when_settings_change(self):
+        template = Template("""{% load heroicons %}{% icon "bars-3" size=16 %}""")
+
+        with override_settings(DJC_HEROICONS={"css_variables": True}):
+            rendered = template.render(Context())
+        assert "var(--heroicon-size" in rendered
+        assert template.render(Context()) == render_icon("bars-3", size=16)
+
+    def test_counted_by_budget(self):
+        template = Template("""{% load heroicons %}{% icon "bars-3" %}""")
+        template.render(Context())
+
+        icons: list = []
+        token = _rendered_icons.set(icons)
+        try:
+            rendered = template.render(Context())
+        finally:
+            _rendered_icons.reset(token)
+        assert icons == [rendered]
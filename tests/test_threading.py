@@ -0,0 +1,47 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from django.test import override_settings
+from django_components.testing import djc_test
+
+from djc_heroicons import Icon
+from djc_heroicons.app_settings import app_settings
+from djc_heroicons.icons import ICONS
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+# Render ID differs for each render, so it's removed before comparing the outputs
+RENDER_ID_RE = re.compile(r" data-djc-id-\w+=\"\"")
+
+
+def render(kwargs):
+    return RENDER_ID_RE.sub("", Icon.render(kwargs=kwargs))
+
+
+@djc_test
+class TestThreading:
+    def test_concurrent_renders(self):
+        workload = [
+            {"name": name, "variant": variant, "size": 16 + index % 3}
+            for variant, icons in ICONS.items()
+            for index, name in enumerate(list(icons)[:20])
+        ]
+        expected = [render(kwargs) for kwargs in workload]
+
+        def worker(offset):
+            results = []
+            for i in range(len(workload)):
+                index = (offset + i) % len(workload)
+                results.append(render(workload[index]) == expected[index])
+            return all(results)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert all(executor.map(worker, range(8)))
+
+    def test_settings_snapshot_reset(self):
+        assert app_settings.COMPONENT_NAME == "icon"
+        with override_settings(DJC_HEROICONS={"component_name": "my_icon"}):
+            assert app_settings.COMPONENT_NAME == "my_icon"
+        assert app_settings.COMPONENT_NAME == "icon"
@@ -0,0 +1,107 @@
+from django.template import engines
+from django_components.testing import djc_test
+
+from djc_heroicons import render_icon
+from djc_heroicons.tracing import IconTracer, InMemoryIconTracer, trace_icons
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+tracer = InMemoryIconTracer()
+
+TRACING_SETTINGS = {
+    "DJC_HEROICONS": {"tracer": "tests.test_tracing.tracer"},
+    "TEMPLATES": [
+        {
+            "BACKEND": "djc_heroicons.tracing.TracingDjangoTemplates",
+            "NAME": "django",
+            "OPTIONS": {
+                "loaders": [
+                    (
+                        "django.template.loaders.locmem.Loader",
+                        {
+                            "page.html": """
+                                {% load component_tags heroicons %}
+                                {% icon "bars-3" %}
+                                {% icon "bars-3" %}
+                                {% icon "check" variant="solid" class="p-4" %}
+                                {% component "icon" name="check" variant="solid" / %}
+                            """,
+                        },
+                    ),
+                ],
+            },
+        }
+    ],
+}
+
+
+@djc_test(django_settings=TRACING_SETTINGS)
+class TestTracing:
+    def setup_method(self):
+        tracer.clear()
+
+    def test_aggregates_template_render(self):
+        html = engines["django"].get_template("page.html").render({})
+
+        assert len(tracer.summaries) == 1
+        summary = tracer.summaries[0]
+        assert summary.label == "page.html"
+        assert summary.icon_count == 4
+        assert summary.icons == {"outline:bars-3": 2, "solid:check": 2}
+        assert summary.cache_hits >= 1
+        assert summary.cache_hits + summary.cache_misses == 4
+        assert 0 < summary.bytes <= len(html.encode())
+        assert summary.duration > 0
+
+    def test_from_string(self):
+        engines["django"].from_string('{% load heroicons %}{% icon "bars-3" %}').render({})
+        assert tracer.summaries[0].label == "<unknown source>"
+
+    def test_cache_hit(self):
+        with trace_icons("first"):
+            render_icon("x-mark", size=31)
+        with trace_icons("second"):
+            render_icon("x-mark", size=31)
+
+        first, second = tracer.summaries
+        assert (first.label, first.cache_hits) == ("first", 0)
+        assert (second.label, second.cache_hits) == ("second", 1)
+        assert first.bytes == second.bytes == len(render_icon("x-mark", size=31))
+
+    def test_nested_blocks(self):
+        with trace_icons("outer"):
+            render_icon("bars-3")
+            with trace_icons("inner"):
+                render_icon("check")
+
+        assert [(summary.label, summary.icons) for summary in tracer.summaries] == [
+            ("inner", {"outline:check": 1}),
+            ("outer", {"outline:bars-3": 1}),
+        ]
+
+    def test_outside_of_block(self):
+        render_icon("bars-3")
+
+        assert len(tracer.summaries) == 1
+        assert tracer.summaries[0].label is None
+        assert tracer.summaries[0].icon_count == 1
+
+    def test_no_icons_no_trace(self):
+        with trace_icons("empty"):
+            pass
+        assert tracer.summaries == []
+
+
+@djc_test(django_settings={"DJC_HEROICONS": {"tracer": IconTracer()}})
+def test_noop_tracer():
+    with trace_icons("noop"):
+        assert render_icon("bars-3") == render_icon("bars-3")
+
+
+def test_disabled():
+    tracer.clear()
+    with trace_icons("disabled"):
+        render_icon("bars-3")
+    assert tracer.summaries == []
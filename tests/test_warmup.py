@@ -0,0 +1,161 @@
+import json
+import sys
+import threading
+import time
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django_components.testing import djc_test
+
+from djc_heroicons import apps, render_icon
+from djc_heroicons.render import _format_svg_cached
+from djc_heroicons.warmup import (
+    UsageRecorder,
+    load_profile,
+    save_profile,
+    setup_warmup,
+    start_recording,
+    stop_recording,
+    warmup,
+)
+
+from .testutils import setup_test_config
+
+setup_test_config()
+
+BARS = ("outline", "bars-3", 24, "currentColor", 1.5, "0 0 24 24")
+CHECK = ("solid", "check", 16, "red", 1.5, "0 0 24 24")
+
+
+@djc_test
+class TestUsageRecorder:
+    def test_record_and_flush(self, tmp_path):
+        path = tmp_path / "profile.json"
+        save_profile(path, {BARS: 5})
+
+        recorder = start_recording(path, sample_rate=1)
+        try:
+            render_icon("bars-3")
+            render_icon("check", variant="solid", size=16, color="red")
+            render_icon("check", variant="solid", size=16, color="red")
+        finally:
+            stop_recording()
+
+        assert recorder._counts == {}
+        assert load_profile(path) == {BARS: 6, CHECK: 2}
+        # Most rendered icons first
+        assert json.loads(path.read_text())["icons"][0]["name"] == "bars-3"
+
+    def test_sampling(self, tmp_path):
+        recorder = UsageRecorder(tmp_path / "profile.json", sample_rate=0)
+        recorder.record(BARS)
+        assert recorder._counts == {}
+
+    def test_flush_interval(self, tmp_path):
+        path = tmp_path / "profile.json"
+        recorder = UsageRecorder(path, sample_rate=1, flush_interval=0.05)
+        try:
+            recorder.record(BARS)
+            # The counts are written by the background thread, not by the render
+            assert not path.exists()
+
+            deadline = time.monotonic() + 5
+            while not path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert load_profile(path) == {BARS: 1}
+        finally:
+            recorder.stop()
+
+    def test_concurrent_flushes(self, tmp_path):
+        path = tmp_path / "profile.json"
+        recorder = UsageRecorder(path, sample_rate=1)
+
+        # E.g. the background thread and `stop()` flushing at the same time
+        def record_and_flush():
+            for _ in range(20):
+                recorder.record(BARS)
+                recorder.flush()
+
+        threads = [threading.Thread(target=record_and_flush) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        recorder.stop()
+
+        assert load_profile(path) == {BARS: 160}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_invalid_profile(self, tmp_path):
+        path = tmp_path / "profile.json"
+        assert load_profile(path) == {}
+
+        path.write_text("{not json")
+        assert load_profile(path) == {}
+
+
+@djc_test
+class TestWarmup:
+    def test_warmup_renders_top_icons(self, tmp_path):
+        path = tmp_path / "profile.json"
+        missing = ("outline", "no-such-icon", 24, "currentColor", 1.5, "0 0 24 24")
+        uncommon = ("outline", "check", 17, "blue", 2.0, "0 0 24 24")
+        save_profile(path, {BARS: 10, CHECK: 8, missing: 5, uncommon: 1})
+
+        _format_svg_cached.cache_clear()
+        assert warmup(path, count=3) == [BARS, CHECK]
+
+        # The warmed up icons are served from the cache
+        render_icon("check", variant="solid", size=16, color="red")
+        assert _format_svg_cached.cache_info().hits == 1
+
+    def test_setup_warmup(self, tmp_path):
+        path = tmp_path / "profile.json"
+        save_profile(path, {BARS: 10})
+
+        @djc_test(django_settings={"DJC_HEROICONS": {"warmup_profile": str(path), "warmup_sample_rate": 1}})
+        def run():
+            _format_svg_cached.cache_clear()
+            setup_warmup()
+            try:
+                assert _format_svg_cached.cache_info().currsize == 1
+                render_icon("bars-3")
+            finally:
+                stop_recording()
+
+        run()
+        assert load_profile(path) == {BARS: 11}
+
+    def test_skipped_in_management_commands(self, tmp_path, monkeypatch):
+        path = tmp_path / "profile.json"
+        save_profile(path, {BARS: 10})
+
+        @djc_test(django_settings={"DJC_HEROICONS": {"warmup_profile": str(path), "warmup_sample_rate": 1}})
+        def run():
+            _format_svg_cached.cache_clear()
+            for argv, warmed_up in (
+                (["manage.py", "migrate"], False),
+                (["manage.py", "runserver"], True),
+                (["gunicorn", "demo.wsgi"], True),
+            ):
+                monkeypatch.setattr(sys, "argv", argv)
+                try:
+                    apps.setup_warmup()
+                    assert (_format_svg_cached.cache_info().currsize == 1) is warmed_up
+                finally:
+                    stop_recording()
+                    _format_svg_cached.cache_clear()
+
+        run()
+
+    def test_command(self, tmp_path):
+        path = tmp_path / "profile.json"
+        save_profile(path, {BARS: 10, CHECK: 8})
+
+        out = StringIO()
+        call_command("heroicons_warmup", profile=str(path), count=1, stdout=out)
+        assert out.getvalue().startswith(f"Rendered 1 of 2 icons from {path} in ")
+
+        with pytest.raises(CommandError, match="No profile file given"):
+            call_command("heroicons_warmup")
@@ -30,7 +30,7 @@ def setup_test_config(heroicons: Optional[Dict] = None):
             }
         },
         "SECRET_KEY": "secret",
-        "ROOT_URLCONF": "django_components.urls",
+        "ROOT_URLCONF": "tests.urls",
     }
 
     settings.configure(**default_settings)
@@ -0,0 +1,6 @@
+from django.urls import include, path
+
+urlpatterns = [
+    path("heroicons/", include("djc_heroicons.urls")),
+    path("", include("django_components.urls")),
+]